@@ -0,0 +1,6 @@
+import sys
+
+# thermo.server uses async/await and asyncio.run, which need Python 3.7
+collect_ignore = []
+if sys.version_info < (3, 7):
+    collect_ignore.extend(['thermo/server.py', 'tests/test_server.py'])
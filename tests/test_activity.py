@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+from numpy.testing import assert_allclose
+import pytest
+import numpy as np
+from thermo.activity import *
+from thermo.vapor_pressure import VaporPressure
+
+
+def test_bubble_dew_at_P():
+    # Benzene, toluene
+    VPs = [VaporPressure(Tb=353.23, Tc=562.05, Pc=4895000.0, omega=0.212),
+           VaporPressure(Tb=383.75, Tc=591.75, Pc=4108000.0, omega=0.257)]
+    T = bubble_at_P(101325, [0.5, 0.5], VPs)
+    assert_allclose(T, 365.0694706562938)
+    Psats = [i.T_dependent_property(T) for i in VPs]
+    assert_allclose(bubble_at_T([0.5, 0.5], Psats), 101325)
+
+    T = dew_at_P(101325, [0.5, 0.5], VPs)
+    assert_allclose(T, 371.4183290508447)
+    Psats = [i.T_dependent_property(T) for i in VPs]
+    assert_allclose(dew_at_T([0.5, 0.5], Psats), 101325)
+
+    # Poor guesses still converge
+    assert_allclose(bubble_at_P(101325, [0.5, 0.5], VPs, T_guess=200.), 365.0694706562938)
+    assert_allclose(dew_at_P(101325, [0.5, 0.5], VPs, T_guess=550.), 371.4183290508447)
+
+    # Activity coefficients
+    T = bubble_at_P(101325, [0.5, 0.5], VPs, gammas=[1.1, 0.75])
+    Psats = [i.T_dependent_property(T) for i in VPs]
+    assert_allclose(bubble_at_T([0.5, 0.5], Psats, gammas=[1.1, 0.75]), 101325)
+
+    with pytest.raises(Exception):
+        bubble_at_P(101325, [0.5, 0.5, 0.], VPs)
+
+
+def test_bubble_dew_at_P_many():
+    VPs = [VaporPressure(Tb=353.23, Tc=562.05, Pc=4895000.0, omega=0.212),
+           VaporPressure(Tb=383.75, Tc=591.75, Pc=4108000.0, omega=0.257)]
+    x1s = np.linspace(0, 1, 11)
+    zs = np.vstack([x1s, 1 - x1s]).T
+
+    Ts = bubble_at_P_many(101325, zs, VPs)
+    Ts_expect = [bubble_at_P(101325, z.tolist(), VPs) for z in zs]
+    assert_allclose(Ts, Ts_expect)
+
+    Ts = dew_at_P_many([1E5]*11, zs, VPs, T_guesses=Ts)
+    Ts_expect = [dew_at_P(1E5, z.tolist(), VPs) for z in zs]
+    assert_allclose(Ts, Ts_expect)
+
+
+def test_phase_envelope():
+    VPs = [VaporPressure(Tb=353.23, Tc=562.05, Pc=4895000.0, omega=0.212),
+           VaporPressure(Tb=383.75, Tc=591.75, Pc=4108000.0, omega=0.257)]
+    zs = [0.5, 0.5]
+    Ts_bubble, Ps_bubble, Ts_dew, Ps_dew = phase_envelope(zs, VPs)
+
+    # Curves begin at Pmin and end at the lowest critical temperature
+    assert_allclose([Ps_bubble[0], Ps_dew[0]], [1E3, 1E3])
+    assert_allclose([Ts_bubble[-1], Ts_dew[-1]], [562.05, 562.05])
+    assert_allclose(Ps_bubble[-1], 3870372.2534649554)
+    assert all(np.diff(Ts_bubble) > 0)
+    assert Ts_dew[0] > Ts_bubble[0]
+
+    # Every point is on its curve
+    Ps_calc = [bubble_at_T(zs, [i.T_dependent_property(T) for i in VPs]) for T in Ts_bubble]
+    assert_allclose(Ps_calc, Ps_bubble)
+    Ps_calc = [dew_at_T(zs, [i.T_dependent_property(T) for i in VPs]) for T in Ts_dew]
+    assert_allclose(Ps_calc, Ps_dew)
+
+    # Tighter tolerances need more points
+    Ts_bubble_fine = phase_envelope(zs, VPs, Tmin=300., rtol=1E-6)[0]
+    assert Ts_bubble_fine[0] == 300.
+    assert len(Ts_bubble_fine) > len(Ts_bubble)
+
+    with pytest.raises(Exception):
+        phase_envelope(zs, VPs, Method='BADMETHOD')
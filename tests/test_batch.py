@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+
+import pytest
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_allclose
+from thermo.batch import *
+from thermo.chemical import Chemical
+
+
+@pytest.mark.meta_Chemical
+def test_BatchEvaluator():
+    evaluator = BatchEvaluator(['rhol', 'Psat'], max_objects=2)
+    df = pd.DataFrame({'ID': ['water', 'ethanol', '7732-18-5', 'notachemical', 'methanol'],
+                       'T': [300., 350., 350., 300., 310.], 'P': [1E5, 1E5, 2E5, 1E5, 1E5]})
+    values = evaluator.evaluate(df)
+    assert list(values.index) == list(df.index)
+    for i in [0, 1, 2, 4]:
+        chem = Chemical(df['ID'][i], T=df['T'][i], P=df['P'][i])
+        assert_allclose(values.iloc[i].values.astype(float), [chem.rhol, chem.Psat])
+    assert np.isnan(values.iloc[3].values.astype(float)).all()
+    # Identifiers resolved once; water's two identifiers share one object,
+    # and only the most recently used objects are kept
+    assert evaluator.CASs == {'water': '7732-18-5', 'ethanol': '64-17-5', '7732-18-5': '7732-18-5',
+                              'notachemical': None, 'methanol': '67-56-1'}
+    assert list(evaluator.objects) == ['64-17-5', '67-56-1']
+
+    # Mixtures
+    evaluator = BatchEvaluator(['MW'])
+    values = evaluator.evaluate(pd.DataFrame({'ID': ['water;ethanol', 'water'], 'zs': ['0.5;0.5', None]}))
+    assert_allclose(values['MW'], [(18.01528 + 46.06844)/2, 18.01528])
+
+
+@pytest.mark.meta_Chemical
+def test_BatchEvaluator_state():
+    # Each row must match a new Chemical at its conditions, whichever other
+    # temperatures the shared object was evaluated at first
+    props = ['rhol', 'mul', 'kl', 'Cpl']
+    Ts = np.linspace(200., 400., 21)
+    df = pd.DataFrame({'ID': ['acetone']*21 + ['ammonia']*21, 'T': np.concatenate([Ts[::-1], Ts[::-1]])})
+    values = BatchEvaluator(props).evaluate(df)
+    for i in range(len(df)):
+        chem = Chemical(df['ID'][i], T=df['T'][i])
+        expect = [getattr(chem, prop) for prop in props]
+        assert_allclose(values.iloc[i].values.astype(float),
+                        [np.nan if v is None else v for v in expect])
+
+    evaluator = BatchEvaluator(['MW'], max_identifiers=2)
+    evaluator.evaluate(pd.DataFrame({'ID': ['water', 'ethanol', 'methanol']}))
+    assert list(evaluator.CASs) == ['ethanol', 'methanol']
+
+
+@pytest.mark.meta_Chemical
+def test_evaluate_file(tmpdir):
+    from thermo.__main__ import main
+    path_in, path_out = str(tmpdir.join('in.csv')), str(tmpdir.join('out.csv'))
+    df = pd.DataFrame({'ID': ['water', 'hexane', 'water', 'toluene', 'hexane'],
+                       'T': [300., 320., 340., 360., 380.]})
+    df.to_csv(path_in, index=False)
+    assert evaluate_file(path_in, path_out, ['Cpl', 'sigma'], chunksize=2) == 5
+    out = pd.read_csv(path_out)
+    assert list(out.columns) == ['ID', 'T', 'Cpl', 'sigma']
+    assert_allclose(out[['Cpl', 'sigma']].values,
+                    BatchEvaluator(['Cpl', 'sigma']).evaluate(df).values.astype(float))
+
+    assert main(['eval', path_in, path_out, '--props', 'MW']) == 0
+    assert_allclose(pd.read_csv(path_out)['MW'], [18.01528, 86.17536, 18.01528, 92.13842, 86.17536])
+    assert main([]) == 2
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+
+import numpy as np
+import pandas as pd
+from numpy.testing import assert_allclose
+from thermo.bulk import *
+from thermo.critical import Tc, Pc, Vc
+from thermo.acentric import omega
+from thermo.phase_change import Tb, Tm
+from thermo.triple import Tt
+from thermo.dipole import dipole
+from thermo.safety import LFL
+from thermo.environment import logP
+from thermo.vapor_pressure import VaporPressure
+
+
+def test_constants_table():
+    CASRNs = all_CASRNs()
+    assert len(CASRNs) > 30000
+    assert CASRNs == sorted(CASRNs)
+
+    sample = CASRNs[::97] + ['7732-18-5', '64-17-5', '71-43-2', '7664-41-7', 'notaCAS']
+    df = constants_table(sample)
+    assert list(df.index) == sample
+    assert list(df.columns) == list(constant_sources)
+    functions = {'Tc': Tc, 'Pc': Pc, 'Vc': Vc, 'omega': omega, 'Tb': Tb,
+                 'Tm': Tm, 'Tt': Tt, 'dipole': dipole, 'logP': logP,
+                 'LFL': lambda CASRN: LFL(CASRN=CASRN)}
+    for CASRN in sample[:-1]:
+        for name, f in functions.items():
+            value = f(CASRN)
+            if value is None:
+                assert np.isnan(df.at[CASRN, name])
+            else:
+                assert_allclose(df.at[CASRN, name], value)
+    assert df.loc['notaCAS'].isnull().all()
+    assert df.at['7732-18-5', 'formula'] == 'H2O'
+
+    # Constants taken from other constants are resolved even if not requested
+    df = constants_table(['7664-41-7', '64-17-5'], ['Tt'])
+    assert list(df.columns) == ['Tt']
+    assert_allclose(df['Tt'], [Tt('7664-41-7'), Tt('64-17-5')])
+
+
+def test_curves_table():
+    df = curves_table(['7732-18-5', '64-17-5'], [300., 350.], ['Psat', 'Vml'])
+    assert list(df.columns) == ['Psat', 'Vml']
+    ethanol = VaporPressure(Tb=351.39, Tc=514.0, Pc=6137000.0, omega=0.635, CASRN='64-17-5')
+    assert_allclose(df.loc[('64-17-5', 350.), 'Psat'], ethanol.T_dependent_property(350.))
+    assert df.notnull().all().all()
+
+    # Each point is evaluated as by a new object; the order does not matter
+    CASRNs, Ts = ['67-64-1', '7664-41-7', '108-88-3'], np.linspace(200., 500., 13)
+    df = curves_table(CASRNs, Ts)
+    df_reversed = curves_table(CASRNs, Ts[::-1])
+    assert_allclose(df.values, df_reversed.loc[df.index].values, rtol=1e-14)
+
+def test_export(tmpdir):
+    path = str(tmpdir.join('constants.csv'))
+    assert export_constants(path, CASRNs=['7732-18-5', '64-17-5', '71-43-2'],
+                            constants=['Tc', 'MW'], chunksize=2) == 3
+    df = pd.read_csv(path, index_col=0)
+    assert list(df.index) == ['7732-18-5', '64-17-5', '71-43-2']
+    assert_allclose(df['Tc'], [647.14, 514.0, 562.05])
+
+    path = str(tmpdir.join('curves.csv'))
+    assert export_curves(path, [300., 320., 340.], CASRNs=['7732-18-5', '64-17-5', '71-43-2'],
+                         props=['Psat'], chunksize=2) == 3
+    df = pd.read_csv(path, index_col=[0, 1])
+    assert df.shape == (9, 1)
+    assert_allclose(df.values, curves_table(['7732-18-5', '64-17-5', '71-43-2'], [300., 320., 340.], ['Psat']).values)
@@ -24,6 +24,15 @@ from numpy.testing import assert_allclose
 import pytest
 from thermo.chemical import *
 
+def test_Chemical_at_Tm():
+    # The CoolProp methods must only be invalid below the melting line
+    w = Chemical('water', T=273.15)
+    assert w.T == w.Tm
+    from thermo.datasheet import tabulate_liq
+    for ID in ['methanol', 'pentane']:
+        assert len(tabulate_liq(ID)) == 10
+
+
 def test_Mixture():
     Mixture(['water', 'ethanol'], ws=[.5, .5], T=320, P=1E5)
     Mixture(['water', 'phosphoric acid'], ws=[.5, .5], T=320, P=1E5)
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+
+import numpy as np
+from numpy.testing import assert_allclose
+from thermo.coefficients import *
+from thermo.critical import Tc, Pc
+from thermo.vapor_pressure import VaporPressure
+from thermo.heat_capacity import HeatCapacityGas
+from thermo.volume import VolumeLiquid
+from thermo.viscosity import ViscosityLiquid
+
+
+def test_coefficient_sets_match_property_objects():
+    classes = {'Psat': VaporPressure, 'Cpgm': HeatCapacityGas,
+               'Vml': VolumeLiquid, 'mul': ViscosityLiquid}
+    Ts = [200., 300., 400., 600.]
+    for prop, sets in coefficient_sets.items():
+        for method, coefficient_set in sets.items():
+            CASRNs = list(coefficient_set.CASRNs[::25])
+            values = coefficient_set.evaluate(np.array(Ts)[:, None], CASRNs)
+            assert values.shape == (len(Ts), len(CASRNs))
+            for j, CASRN in enumerate(CASRNs):
+                kwargs = {'CASRN': CASRN}
+                if prop == 'Vml':
+                    kwargs.update(Tc=Tc(CASRN), Pc=Pc(CASRN))
+                obj = classes[prop](**kwargs)
+                for i, T in enumerate(Ts):
+                    if obj.test_method_validity(T, method):
+                        assert_allclose(values[i, j], obj.calculate(T, method), rtol=1e-12)
+                    else:
+                        assert np.isnan(values[i, j])
+
+
+def test_CoefficientSet():
+    Antoine = coefficient_sets['Psat']['Antoine (Poling)']
+    assert '64-17-5' in Antoine
+    assert len(Antoine) == len(Antoine.rows())
+    assert list(Antoine.rows(['64-17-5', 'notaCAS']))[1] == -1
+
+    # Outside of the range of the coefficients
+    assert np.isnan(Antoine.evaluate(500., ['64-17-5'])[0])
+    assert Antoine.evaluate(500., ['64-17-5'], check_range=False)[0] > 1e6
+    assert list(Antoine.valid([300., 500.], ['64-17-5', '64-17-5'])) == [True, False]
+    assert not Antoine.valid(300., ['notaCAS'])[0]
+
+    values = Antoine.evaluate(300.)
+    assert values.shape == (len(Antoine),)
+
+
+def test_evaluate_all():
+    df = evaluate_all('Psat', 350.)
+    assert df.index.is_monotonic_increasing
+    assert df.loc['7732-18-5', 'method'] == 'Wagner Original (McGarry)'
+    assert_allclose(df.loc['7732-18-5', 'Psat'], VaporPressure(CASRN='7732-18-5').calculate(350., 'Wagner Original (McGarry)'))
+    assert df['method'].isnull().sum() == df['Psat'].isnull().sum()
+
+    df = evaluate_all('mul', 300., ['64-17-5', 'notaCAS'])
+    assert list(df.index) == ['64-17-5', 'notaCAS']
+    assert df.loc['notaCAS', 'method'] is None
+    assert_allclose(df.loc['64-17-5', 'mul'], ViscosityLiquid(CASRN='64-17-5').calculate(300., df.loc['64-17-5', 'method']))
@@ -20,6 +20,7 @@ LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 
+import numpy as np
 from numpy.testing import assert_allclose
 import pytest
 from thermo.coolprop import *
@@ -65,4 +66,118 @@ def test_CoolProp_T_dependent_property():
         CoolProp_T_dependent_property(700, '7732-18-5', 'D', 'l')
 
     rhow = CoolProp_T_dependent_property(700, '7732-18-5', 'D', 'g')
-    assert_allclose(rhow, 0.3139926976198761)
\ No newline at end of file
+    assert_allclose(rhow, 0.3139926976198761)
+
+def test_CoolProp_pooled_states():
+    from CoolProp.CoolProp import PropsSI
+    assert CoolProp_state('7732-18-5') is coolprop_fluids['7732-18-5'].HEOS
+    with pytest.raises(Exception):
+        CoolProp_state('BADCAS')
+
+    rho, mu = CoolProp_TP(298.15, 101325., '7732-18-5', ['DMOLAR', 'V'])
+    assert_allclose(rho, PropsSI('DMOLAR', 'T', 298.15, 'P', 101325., '7732-18-5'))
+    assert_allclose(mu, PropsSI('V', 'T', 298.15, 'P', 101325., '7732-18-5'))
+    assert_allclose(CoolProp_TP(298.15, 101325., '7732-18-5', 'DMOLAR'), rho)
+
+    # Arrays of inputs broadcast together
+    Ts = [280., 300., 320., 500.]
+    rhos = CoolProp_TP(Ts, 101325., '7732-18-5', 'DMOLAR')
+    assert_allclose(rhos, [PropsSI('DMOLAR', 'T', T, 'P', 101325., '7732-18-5') for T in Ts])
+    rhos, mus = CoolProp_TP(Ts, [1E5, 1E6, 1E7, 1E5], '7732-18-5', ['DMOLAR', 'V'])
+    assert_allclose(mus[2], PropsSI('V', 'T', 320., 'P', 1E7, '7732-18-5'))
+
+    Psat = CoolProp_TQ(298.15, 0, '7732-18-5', 'P')
+    assert_allclose(Psat, PropsSI('P', 'T', 298.15, 'Q', 0, '7732-18-5'))
+    assert_allclose(CoolProp_TQ([298.15, 350.], 0, '7732-18-5', 'P'),
+                    [Psat, PropsSI('P', 'T', 350., 'Q', 0, '7732-18-5')])
+
+    Hl, Hg = CoolProp_saturation(298.15, '7732-18-5', 'HMOLAR')
+    assert_allclose([Hl, Hg], [PropsSI('HMOLAR', 'T', 298.15, 'Q', i, '7732-18-5') for i in [0, 1]])
+    Hls, Hgs = CoolProp_saturation([298.15, 350.], '7732-18-5', 'HMOLAR')
+    assert_allclose([Hls[0], Hgs[0]], [Hl, Hg])
+    (Hl2, rhol), (Hg2, rhog) = CoolProp_saturation(298.15, '7732-18-5', ['HMOLAR', 'DMOLAR'])
+    assert_allclose([Hl2, Hg2], [Hl, Hg])
+    assert rhol > rhog
+
+    assert CoolProp_phase(298.15, 101325., '7732-18-5') == 'liquid'
+    assert CoolProp_phase(400., 101325., '7732-18-5') == 'gas'
+    assert CoolProp_phase(700., 3E7, '7732-18-5') == 'supercritical'
+    # States CoolProp cannot evaluate, i.e. below the melting line
+    assert CoolProp_phase(273.15, 101325., '7732-18-5') == 'unknown'
+    assert CoolProp_phase(200., 101325., '7732-18-5') == 'unknown'
+
+
+def test_CoolProp_tabular_backend():
+    from CoolProp.CoolProp import PropsSI
+    with pytest.raises(Exception):
+        set_CoolProp_backend('BADBACKEND')
+    set_CoolProp_backend('BICUBIC&HEOS')
+    try:
+        rho = CoolProp_TP(298.15, 101325., '7732-18-5', 'DMOLAR')
+        assert_allclose(rho, PropsSI('DMOLAR', 'T', 298.15, 'P', 101325., '7732-18-5'), rtol=1E-5)
+        assert CoolProp_state('7732-18-5').backend_name() == 'BicubicBackend'
+
+        # Out of the range of the table - evaluated with HEOS instead
+        fallbacks = CoolProp_backend_info()['fallbacks']
+        rhos = CoolProp_TP([298.15, 5000.], 101325., '7732-18-5', 'DMOLAR')
+        assert_allclose(rhos, [rho, PropsSI('DMOLAR', 'T', 5000., 'P', 101325., '7732-18-5')], rtol=1E-5)
+        assert CoolProp_backend_info()['fallbacks'] == fallbacks + 1
+
+        info = CoolProp_backend_info()
+        assert info['backend'] == 'BICUBIC&HEOS'
+        assert 'BicubicBackend' in info['states']['7732-18-5']
+        assert info['evaluations']['BICUBIC&HEOS'] >= 2
+    finally:
+        set_CoolProp_backend('HEOS')
+    assert CoolProp_state('7732-18-5') is coolprop_fluids['7732-18-5'].HEOS
+
+
+def test_CoolProp_backend_argument():
+    from CoolProp.CoolProp import PropsSI
+    from thermo.volume import VolumeLiquid, COOLPROP
+    # A backend given to a function, or set on a property object, is used
+    # instead of the selected one
+    evaluations = CoolProp_backend_info()['evaluations'].get('BICUBIC&HEOS', 0)
+    rho = CoolProp_TP(298.15, 101325., '7732-18-5', 'DMOLAR', backend='BICUBIC&HEOS')
+    assert_allclose(rho, PropsSI('DMOLAR', 'T', 298.15, 'P', 101325., '7732-18-5'), rtol=1E-5)
+    assert CoolProp_backend_info()['evaluations']['BICUBIC&HEOS'] == evaluations + 1
+
+    obj = VolumeLiquid(CASRN='7732-18-5')
+    obj.CoolProp_backend = 'BICUBIC&HEOS'
+    assert_allclose(obj.calculate_P(298.15, 101325., COOLPROP), 1./rho, rtol=1E-12)
+    assert_allclose(obj.calculate(298.15, COOLPROP), 1./rho, rtol=1E-12)
+    assert CoolProp_backend_info()['evaluations']['BICUBIC&HEOS'] == evaluations + 3
+    assert CoolProp_backend_info()['backend'] == 'HEOS'
+
+
+def test_CoolProp_T_dependent_property_array():
+    assert_allclose(coolprop_fluids['7732-18-5'].Tb, 373.1242958476844)
+
+    Ts = [298.15, 450., 700.]
+    rhos = CoolProp_T_dependent_property(Ts, '7732-18-5', 'D', 'g')
+    assert_allclose(rhos, [CoolProp_T_dependent_property(T, '7732-18-5', 'D', 'g') for T in Ts])
+    assert_allclose(rhos, [0.0230748041827597, 0.49104706182775576, 0.3139926976198761], rtol=1E-7)
+
+    rhos = CoolProp_T_dependent_property(Ts[:2], '7732-18-5', 'D', 'l')
+    assert_allclose(rhos, [997.0476367603451, 890.3412497616716], rtol=1E-7)
+
+    with pytest.raises(Exception):
+        CoolProp_T_dependent_property(Ts, '7732-18-5', 'D', 'l')
+
+
+def test_CoolProp_thread_pools():
+    from concurrent.futures import ThreadPoolExecutor
+    Ts = np.linspace(280., 360., 9)
+    expect = [CoolProp_TP(T, 101325., '7732-18-5', 'DMOLAR') for T in Ts]
+    evaluations = CoolProp_backend_info()['evaluations']['HEOS']
+
+    def work(T):
+        return CoolProp_state('7732-18-5'), CoolProp_TP(T, 101325., '7732-18-5', 'DMOLAR')
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(work, Ts))
+    assert_allclose([rho for _, rho in results], expect)
+    # Other threads do not use the importing thread's states
+    assert all(state is not coolprop_fluids['7732-18-5'].HEOS for state, _ in results)
+    # But their evaluations are counted
+    assert CoolProp_backend_info()['evaluations']['HEOS'] == evaluations + len(Ts)
@@ -142,4 +142,91 @@ def test_Kweq_IAPWS():
 def test_Kweq_1981():
     # Point from IAPWS formulation, very close despite being different
     pKw = -1*log10(Kweq_1981(600, 700))
-    assert_allclose(pKw, 11.274522047458206)
\ No newline at end of file
+    assert_allclose(pKw, 11.274522047458206)
+
+def test_LaliberteSolution():
+    CASRNs = ['7647-14-5', '7447-40-7', '7757-82-6']
+    solution = LaliberteSolution(CASRNs)
+    Ts = np.linspace(275., 360., 5)
+    wss = np.array([[0.05, 0.02, 0.01], [0.1, 0., 0.], [0., 0., 0.], [0.01, 0.08, 0.03]])
+
+    for f, vf in [(Laliberte_density, solution.density),
+                  (Laliberte_viscosity, solution.viscosity),
+                  (Laliberte_heat_capacity, solution.heat_capacity)]:
+        values = vf(Ts[:, None], wss)
+        assert values.shape == (5, 4)
+        expect = [[f(T, ws.tolist(), CASRNs) for ws in wss if ws.any()] for T in Ts]
+        assert_allclose(values[:, [0, 1, 3]], expect, rtol=1e-13)
+        assert type(vf(300., wss[0])) is float
+
+    # Analytical derivatives
+    h = 1E-3
+    for f, df in [(solution.density, solution.ddensity_dT),
+                  (solution.viscosity, solution.dviscosity_dT),
+                  (solution.heat_capacity, solution.dheat_capacity_dT)]:
+        numerical = (-f(Ts[:, None] + 2*h, wss) + 8*f(Ts[:, None] + h, wss)
+                     - 8*f(Ts[:, None] - h, wss) + f(Ts[:, None] - 2*h, wss))/(12*h)
+        assert_allclose(df(Ts[:, None], wss), numerical, rtol=1e-7)
+
+    assert_allclose(solution.heat_capacity(Ts, wss[2]), [Laliberte_heat_capacity_w(T) for T in Ts], rtol=1e-13)
+    assert_allclose(solution.density(Ts, wss[2]), [Laliberte_density_w(T) for T in Ts], rtol=1e-13)
+
+    # Water heat capacity is only tabulated from -15 to 140 degC
+    assert np.isnan(solution.heat_capacity([200., 300.], wss[0])).tolist() == [True, False]
+
+    with pytest.raises(Exception):
+        LaliberteSolution(['7732-18-5'])
+    with pytest.raises(Exception):
+        solution.density(300., [0.1, 0.1])
+
+
+def test_LaliberteSolution_inverse():
+    from scipy.integrate import quad
+    solution = LaliberteSolution(['7647-14-5', '7447-40-7', '7757-82-6'])
+    fractions = [0.6, 0.3, 0.1]
+    Ts = np.linspace(280., 350., 50)
+    w = np.linspace(0.01, 0.2, 50)
+    wss = w[:, None]*np.array(fractions)
+
+    rhos = solution.density(Ts, wss)
+    assert_allclose(solution.mass_fraction_from_density(rhos, Ts, fractions), w, atol=1e-14)
+    # Warm start from the previous call, and unnormalized fractions
+    assert_allclose(solution.mass_fraction_from_density(rhos, Ts, [6., 3., 1.], maxiter=2), w, atol=1e-14)
+    w_calc = solution.mass_fraction_from_density(rhos[3], Ts[3], fractions, w0=0.5)
+    assert type(w_calc) is float
+    assert_allclose(w_calc, w[3], atol=1e-14)
+    with pytest.raises(Exception):
+        solution.mass_fraction_from_density(1050., 300.)
+
+    Hs = solution.enthalpy(Ts, wss)
+    for i in [0, 20, 49]:
+        H = quad(solution.heat_capacity, 298.15, Ts[i], args=(wss[i],), epsabs=0, epsrel=1e-13)[0]
+        assert_allclose(Hs[i], H, rtol=1e-12)
+    assert_allclose(solution.T_from_enthalpy(Hs, wss), Ts, rtol=1e-13)
+    assert_allclose(solution.T_from_enthalpy(Hs, wss, maxiter=2), Ts, rtol=1e-13)
+    assert_allclose(solution.T_from_enthalpy(0., wss[4], T_ref=320.), 320.)
+
+    NaCl = LaliberteSolution(['7647-14-5'])
+    assert_allclose(NaCl.mass_fraction_from_density(NaCl.density(298.15, [0.1]), 298.15), 0.1)
+
+    # Samples which cannot be solved are NaN, without failing the others
+    ws = NaCl.mass_fraction_from_density([1020., np.nan, 1030.], 298.15)
+    assert np.isnan(ws[1])
+    assert_allclose(ws[[0, 2]], NaCl.mass_fraction_from_density([1020., 1030.], 298.15))
+    # and do not prevent warm starts of the next block
+    ws = NaCl.mass_fraction_from_density([1020., 1025., 1030.], 298.15, maxiter=3)
+    assert_allclose(NaCl.density(298.15, ws[:, None]), [1020., 1025., 1030.])
+    assert np.isnan(NaCl.mass_fraction_from_density(np.nan, 298.15))
+    # Densities below that of water, or past the range of the fit, are NaN
+    ws = NaCl.mass_fraction_from_density([990., 1100., 1300.], 298.15)
+    assert np.isnan(ws[[0, 2]]).all()
+    assert_allclose(ws[1], 0.14128552, rtol=1e-7)
+    assert np.isnan(NaCl.mass_fraction_from_density(NaCl.density(298.15, [0.27]), 298.15))
+    assert NaCl.mass_fraction_from_density(NaCl.density(298.15, [0.]), 298.15) == 0.
+    # With several solutes, the limit is set by the first to leave its range
+    w_max = (solution.density_wMax[:, 0]/fractions).min()
+    assert np.isnan(solution.mass_fraction_from_density(solution.density(298.15, np.array(fractions)*(w_max + 0.01)),
+                                                        298.15, fractions))
+    Ts = NaCl.T_from_enthalpy([37366.4209, np.nan, 1E7], [0.1])
+    assert_allclose(Ts[0], 308.15, rtol=1e-9)
+    assert np.all(np.isnan(Ts[1:]))
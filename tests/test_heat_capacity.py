@@ -22,7 +22,9 @@ SOFTWARE.'''
 
 from numpy.testing import assert_allclose
 import pytest
+import numpy as np
 from thermo.heat_capacity import *
+from thermo.heat_capacity import _ZabranskyConsts, _ZabranskyConstp
 
 
 def test_heat_capacity_CSP():
@@ -183,3 +185,42 @@ def test_HeatCapacityLiquid():
     Cpl_calc = [(ctp.set_user_methods(i, forced=True), ctp.T_dependent_property(250))[1] for i in ctp.all_methods]
     Cpls = [134.1186283149712, 134.14961304014292]
     assert_allclose(sorted(Cpl_calc), sorted(Cpls))
+
+
+def test_ZabranskySpline():
+    from scipy.integrate import quad
+    water = _ZabranskyConsts['7732-18-5']
+    assert len(water) == 4
+    assert_allclose(water.Tmins, [273.6, 380., 590., 635.])
+    # Segments are chosen by their Tmax; the first and last extrapolate
+    assert [water.segment(T) for T in [200., 273.6, 380., 380.1, 600., 635., 644.6, 700.]] == [0, 0, 0, 1, 2, 2, 3, 3]
+    assert water.calculate(380.) == Zabransky_cubic(380., *water.coeffs[0])
+    assert water.calculate(380.1) == Zabransky_cubic(380.1, *water.coeffs[1])
+
+    Ts = np.linspace(250., 640., 50)
+    assert_allclose(water.calculate_array(Ts), [water.calculate(T) for T in Ts], rtol=1e-12)
+    assert water.calculate_array(Ts.reshape(5, 10)).shape == (5, 10)
+
+    for T1, T2 in [(300., 350.), (300., 600.), (270., 644.)]:
+        points = [T for T in water.bounds if T1 < T < T2]
+        H = quad(water.calculate, T1, T2, points=points or None)[0]
+        S = quad(lambda T: water.calculate(T)/T, T1, T2, points=points or None)[0]
+        assert_allclose(water.calculate_integral(T1, T2), H, rtol=1e-8)
+        assert_allclose(water.calculate_integral_over_T(T1, T2), S, rtol=1e-8)
+        assert_allclose(water.calculate_integral(T2, T1), -H, rtol=1e-8)
+
+    ethanol = _ZabranskyConstp['64-17-5']
+    Ts = np.linspace(200., 450., 20)
+    assert_allclose(ethanol.calculate_array(Ts), [ethanol.calculate(T) for T in Ts], rtol=1e-12)
+    H = quad(ethanol.calculate, 250., 450.)[0]
+    S = quad(lambda T: ethanol.calculate(T)/T, 250., 450.)[0]
+    assert_allclose(ethanol.calculate_integral(250., 450.), H, rtol=1e-8)
+    assert_allclose(ethanol.calculate_integral_over_T(250., 450.), S, rtol=1e-8)
+
+    water = HeatCapacityLiquid(CASRN='7732-18-5')
+    H = quad(water.calculate, 300., 400., args=(ZABRANSKY_SPLINE,))[0]
+    assert_allclose(water.calculate_integral(300., 400., ZABRANSKY_SPLINE), H, rtol=1e-8)
+    # Other methods are integrated numerically
+    assert_allclose(water.calculate_integral(300., 310., POLING_CONST), 10*water.POLING_constant)
+    assert not water.test_method_validity(700., ZABRANSKY_SPLINE)
+    assert water.test_method_validity(500., ZABRANSKY_SPLINE)
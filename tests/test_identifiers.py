@@ -37,4 +37,114 @@ def test_pubchem_dict():
 
 def test_mixture_from_any():
     with pytest.raises(Exception):
-        mixture_from_any(['water', 'methanol'])
\ No newline at end of file
+        mixture_from_any(['water', 'methanol'])
+    assert mixture_from_any('air') == 'Air'
+    assert mixture_from_any(['Air ']) == 'Air'
+    assert mixture_from_any('natural gas') == 'Gulf Coast Gas'
+    assert mixture_from_any('r-410a') == 'R410A'
+    assert mixture_from_any('R 410 A') == 'R410A'
+    assert mixture_from_any('Gulf-Coast-Gas') == 'Gulf Coast Gas'
+    assert mixture_from_any('water') is None
+
+
+def test_mixture_from_any_many():
+    air, missing, R410A, wrong = mixture_from_any_many(['air', 'water', 'R-410A', None])
+    assert air['CASs'] == ['7727-37-9', '7440-37-1', '7782-44-7']
+    assert air['zs'] == [0.7812, 0.0092, 0.2096]
+    assert missing is None and wrong is None
+    assert R410A['N'] == 2
+
+def test_CASfromAny():
+    assert CASfromAny('water') == '7732-18-5'
+    assert CASfromAny('7732-18-5') == '7732-18-5'
+    assert CASfromAny('InChI=1S/H2O/h1H2') == '7732-18-5'
+    assert CASfromAny('962') == '7732-18-5'
+    assert CASfromAny('not a chemical name') is None
+
+    # Normalized names; case, whitespace, and punctuation do not matter
+    assert normalize_name(' Furfuryl-Alcohol. ') == 'furfurylalcohol'
+    assert CASfromAny('FURFURYL ALCOHOL') == '98-00-0'
+    assert CASfromAny('1,2 - Dichloro-Ethane') == CASfromAny('1,2-dichloroethane')
+    assert CASfromAny('ethanol;') == '64-17-5'
+
+    # Results are memoized, in a dict so that Python 2 is supported
+    from thermo.identifiers import _CASfromAny_cache
+    assert _CASfromAny_cache['FURFURYL ALCOHOL'] == '98-00-0'
+
+
+def test_CASfromAny_cache(monkeypatch):
+    from thermo import identifiers
+    monkeypatch.setattr(identifiers, '_CASfromAny_cache', identifiers.OrderedDict())
+    monkeypatch.setattr(identifiers, '_CASfromAny_cache_size', 2)
+    for ID in ['water', 'ethanol', 'water', 'methanol']:
+        CASfromAny(ID)
+    # The least recently used identifier is discarded first
+    assert list(identifiers._CASfromAny_cache.items()) == [('water', '7732-18-5'), ('methanol', '67-56-1')]
+
+
+def test_CASfromAny_many():
+    IDs = ['water', 'Ethanol', 'water', 'not a chemical name', None, float('nan'), ['water']]
+    assert CASfromAny_many(IDs) == ['7732-18-5', '64-17-5', '7732-18-5', None, None, None, None]
+    assert CASfromAny_many([]) == []
+
+
+def test_pubchem_records():
+    water = pubchem_dict['7732-18-5']
+    assert water['Pubchem ID'] == 962 == PubChem('7732-18-5')
+    assert water['MW'] == 18.01528 == MW('7732-18-5')
+    assert water['formula'] == 'H2O' == formula('7732-18-5')
+    assert water['InChI Key'] == InChI_Key('7732-18-5')
+    assert water['Names'] == synonyms('7732-18-5')
+    assert water['common name'] == name('7732-18-5') == water['Names'][1]
+    assert '7732-18-5' in pubchem_dict
+    assert 'notaCAS' not in pubchem_dict
+    with pytest.raises(KeyError):
+        MW('notaCAS')
+    assert len(pubchem_dict) == len(list(pubchem_dict)) > 70000
+
+
+def test_packed_file(tmpdir):
+    from collections import OrderedDict
+    import numpy as np
+    from thermo.identifiers import _write_packed, _read_packed
+    arrays = OrderedDict([('a', np.arange(5, dtype=np.int64)),
+                          ('b', np.array([1.5, 2.5, 3.5])),
+                          ('c', np.frombuffer(b'abc', dtype=np.uint8))])
+    path = str(tmpdir.join('test.packed'))
+    # An existing file is replaced
+    _write_packed(path, arrays, {'version': 0})
+    _write_packed(path, arrays, {'version': 1})
+    assert tmpdir.listdir() == [tmpdir.join('test.packed')]
+    meta, read = _read_packed(path)
+    assert meta == {'version': 1}
+    for key, array in arrays.items():
+        assert read[key].dtype == array.dtype
+        assert list(read[key]) == list(array)
+        assert not read[key].flags.writeable
+
+
+def test_load_identifiers_read_only(tmpdir, monkeypatch):
+    import os
+    from thermo import identifiers
+    from thermo.identifiers import _load_identifiers, _IdentifierStore, _CAS
+    with open(identifiers._identifiers_path) as f:
+        lines = [f.readline() for i in range(3)]
+    csv = str(tmpdir.join('identifiers.csv'))
+    with open(csv, 'w') as f:
+        f.writelines(lines)
+    # The package folder cannot be written to, as its parent is a file
+    tmpdir.join('package').write('')
+    monkeypatch.setattr(identifiers, '_identifiers_path', csv)
+    monkeypatch.setattr(identifiers, '_packed_path', str(tmpdir.join('package', 'ids.packed')))
+    monkeypatch.setattr(identifiers, '_cache_packed_path', str(tmpdir.join('cache', 'ids.packed')))
+    _load_identifiers()
+    assert os.path.exists(str(tmpdir.join('cache', 'ids.packed')))
+    # Later loads map the cached file
+    arrays = _load_identifiers()
+    assert not arrays['offsets'].flags.writeable
+    store = _IdentifierStore(arrays)
+    CASs = [line.split('\t')[1] for line in lines]
+    assert [store.field(store.row(CAS), _CAS) for CAS in CASs] == CASs
+    assert store.names(store.row(CASs[0])) == lines[0].rstrip('\n').split('\t')[7:]
+    with pytest.raises(KeyError):
+        store.row('notaCAS')
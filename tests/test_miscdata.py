@@ -71,4 +71,39 @@ def test_VDI_tabular_data():
             sums[prop]+= sum(VDI_tabular_data(CASRN, prop)[1])
 
     sums_calc = {'Volume (g)': 4480967.380663272, 'Mu (g)': 0.01092262, 'K (g)': 13.3338, 'P': 830362576.5100002, 'Pr (l)': 2561.917999999999, 'Cp (l)': 109652.14080415797, 'K (l)': 62.80901, 'T': 210960.66, 'Volume (l)': 0.06622819718826786, 'Beta': 3.66542, 'Pr (g)': 2561.917999999999, 'Hvap': 11146818.439615589, 'Mu (l)': 0.14801666, 'Cp (g)': 215899.05447308993, 'sigma': 9.08229, 'Density (l)': 510315.80999999994, 'Density (g)': 33258.34707901}
-    assert sums_calc == sums
\ No newline at end of file
+    assert sums_calc == sums
+
+def test_VDI_tabular_arrays():
+    from thermo.utils import SharedTabularData
+    for CASRN in _VDISaturationDict:
+        for prop in ['P', 'Volume (l)', 'sigma', 'Cp (g)']:
+            data = VDI_tabular_arrays(CASRN, prop)
+            assert isinstance(data, SharedTabularData)
+            assert data is VDI_tabular_arrays(CASRN, prop)
+            Ts, props = data
+            assert (Ts.tolist(), props.tolist()) == VDI_tabular_data(CASRN, prop)
+            assert not Ts.flags.writeable and not props.flags.writeable
+
+    with pytest.raises(Exception):
+        VDI_tabular_arrays('67-56-1000', 'Mu (g)')
+    with pytest.raises(Exception):
+        VDI_tabular_arrays('67-56-1', 'Mug')
+
+
+def test_VDI_shared_interpolators():
+    from thermo.vapor_pressure import VaporPressure, VDI_TABULAR
+    from thermo.volume import VolumeLiquid
+    for cls, prop in [(VaporPressure, 'P'), (VolumeLiquid, 'Volume (l)')]:
+        first, second = cls(CASRN='67-56-1'), cls(CASRN='67-56-1')
+        assert first.tabular_data[VDI_TABULAR] is second.tabular_data[VDI_TABULAR]
+        values = [first.interpolate(T, VDI_TABULAR) for T in [300., 350., 400., 600.]]
+
+        # Same values as from the data set as lists, with its own interpolators
+        third = cls(CASRN='67-56-1')
+        third.tabular_data[VDI_TABULAR] = VDI_tabular_data('67-56-1', prop)
+        assert values == [third.interpolate(T, VDI_TABULAR) for T in [300., 350., 400., 600.]]
+
+        second.interpolate(300., VDI_TABULAR)
+        key = (VDI_TABULAR, first.interpolation_T, first.interpolation_property, first.interpolation_property_inv)
+        key2 = (VDI_TABULAR, second.interpolation_T, second.interpolation_property, second.interpolation_property_inv)
+        assert first.tabular_data_interpolators[key][0] is second.tabular_data_interpolators[key2][0]
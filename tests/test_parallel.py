@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+from thermo.parallel import *
+from thermo.chemical import Chemical
+
+
+@pytest.mark.meta_Chemical
+def test_tabulate():
+    CASRNs = ['7732-18-5', '64-17-5', '110-54-3', 'notachemical', '108-88-3']
+    Ts = [280., 320., 360.]
+    props = ['rhol', 'Psat', 'Cpg']
+    timings = []
+    df = tabulate(CASRNs, Ts, props, workers=2, chunksize=2,
+                  callback=lambda chunk, elapsed: timings.append((chunk, elapsed)))
+    assert list(df.columns) == props
+    assert list(df.index.get_level_values(0)) == [i for i in CASRNs for T in Ts]
+    assert list(df.index.get_level_values(1)) == Ts*len(CASRNs)
+    # Chunks are reported in order
+    assert [chunk for chunk, _ in timings] == [CASRNs[0:2], CASRNs[2:4], CASRNs[4:]]
+    assert all(elapsed >= 0 for _, elapsed in timings)
+
+    for CASRN in ['64-17-5', '108-88-3']:
+        for T in Ts:
+            chem = Chemical(CASRN, T=T)
+            assert_allclose(df.loc[(CASRN, T)].values.astype(float),
+                            [chem.rhol, chem.Psat, chem.Cpg])
+    assert np.isnan(df.loc['notachemical'].values.astype(float)).all()
+
+    # Same results when evaluated in this process, or with streamed chunks
+    assert df.equals(tabulate(CASRNs, Ts, props, workers=1))
+    chunks = list(tabulate_chunks(CASRNs, Ts, props, workers=2, chunksize=3))
+    assert [chunk for chunk, _, _ in chunks] == [CASRNs[0:3], CASRNs[3:]]
+    assert len(chunks[1][1]) == 2*len(Ts)
+
+    # Each row matches a new Chemical at its temperature, whatever
+    # temperatures were evaluated before it
+    Ts_acetone = list(np.linspace(400., 200., 21))
+    df_acetone = tabulate(['67-64-1'], Ts_acetone, ['Cpl', 'rhol'], workers=1)
+    for T in Ts_acetone:
+        chem = Chemical('67-64-1', T=T)
+        assert_allclose(df_acetone.loc[('67-64-1', T)].values.astype(float), [chem.Cpl, chem.rhol])
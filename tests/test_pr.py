@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+
+from numpy.testing import assert_allclose
+import pytest
+import numpy as np
+from thermo.pr import *
+from math import log
+
+
+def test_cubic_roots_min_max():
+    # Three real roots, one real root, and a triple root
+    assert_allclose(cubic_roots_min_max(-7., 14., -8.), (1., 4.))
+    assert_allclose(cubic_roots_min_max(-1., 1., -1.), (1., 1.))
+    assert_allclose(cubic_roots_min_max(-3., 3., -1.), (1., 1.))
+
+    c2s = [-7., -1., -3., 2.5]
+    c1s = [14., 1., 3., -0.5]
+    c0s = [-8., -1., -1., -0.1]
+    mins, maxs = cubic_roots_min_max_array(c2s, c1s, c0s)
+    for c2, c1, c0, l, g in zip(c2s, c1s, c0s, mins, maxs):
+        assert_allclose((l, g), cubic_roots_min_max(c2, c1, c0))
+
+
+def test_PR_Vm_roots():
+    Tc, Pc, omega = 507.6, 3025000., 0.2975
+    a_PR, b_PR, kappa_PR = a(Tc, Pc), b(Tc, Pc), kappa(omega)
+    Ts = np.linspace(150., 700., 30)
+    Ps = np.logspace(3., 7.5, 30)
+    for T in Ts:
+        for P in Ps:
+            A_calc = A(T, P, Tc, Pc, omega)
+            B_calc = B(T, P, Tc, Pc)
+            coeffs = [1, -(1-B_calc), (A_calc-3*B_calc**2-2*B_calc), -(A_calc*B_calc-B_calc**2-B_calc**3)]
+            Zs = np.roots(coeffs)
+            Zs = Zs[np.abs(Zs.imag) < 1E-12*np.abs(Zs.real)].real
+            Vml, Vmg = PR_Vm_roots(float(T), float(P), a_PR, b_PR, kappa_PR, Tc)
+            assert_allclose([Vml, Vmg], [min(Zs)*R*T/P, max(Zs)*R*T/P], rtol=1E-9)
+
+    # Vectorized path over a T-P grid matches the scalar one
+    Vmls, Vmgs = PR_Vm_roots(Ts, Ps[:, None], a_PR, b_PR, kappa_PR, Tc)
+    assert Vmls.shape == (30, 30)
+    for i, P in enumerate(Ps):
+        for j, T in enumerate(Ts):
+            assert_allclose((Vmls[i, j], Vmgs[i, j]), PR_Vm_roots(float(T), float(P), a_PR, b_PR, kappa_PR, Tc), rtol=1E-12)
+
+
+def test_PR_Vm():
+    Vm = PR_Vm(305., 1E5, 430.8, 7884098.25, 0.251, phase='g')
+    assert_allclose(Vm, 0.0250244217720803)
+    Vml, Vmg = PR_Vm(305., 1E5, 430.8, 7884098.25, 0.251)
+    assert_allclose([Vml, Vmg], [4.7026527116290734e-05, 0.0250244217720803])
+    assert_allclose(PR_Vm(305., 1E5, 430.8, 7884098.25, 0.251, phase='l'), 4.7026527116290734e-05)
+
+    # Supercritical - single root returned
+    Vm = PR_Vm(500., 1E7, 430.8, 7884098.25, 0.251)
+    assert type(Vm) == float
+
+    Vms = PR_Vm([305., 400.], 1E5, 430.8, 7884098.25, 0.251, phase='g')
+    assert_allclose(Vms, [0.0250244217720803, 0.03305664], rtol=1E-7)
+
+
+def test_PRMIX():
+    # Pure component matches the pure-component functions
+    eos = PRMIX([430.8], [7884098.25], [0.251])
+    eos.solve(305., 1E5, [1.])
+    assert_allclose([eos.V_l, eos.V_g], [4.7026527116290734e-05, 0.0250244217720803])
+    # Pure-component fugacity coefficient is the departure Gibbs energy
+    for phase in ['l', 'g']:
+        H_dep, S_dep = getattr(eos, 'H_dep_' + phase), getattr(eos, 'S_dep_' + phase)
+        assert_allclose(log(getattr(eos, 'phis_' + phase)[0]), (H_dep - 305.*S_dep)/(R*305.))
+
+    eos = PRMIX(Tcs=[190.56, 305.32, 425.1], Pcs=[4599000., 4872000., 3796000.],
+                omegas=[0.011, 0.098, 0.2], kijs=[[0, 0.01, 0.02], [0.01, 0, 0.03], [0.02, 0.03, 0]])
+    T, P, ns = 300., 2E6, [0.5, 0.3, 0.2]
+
+    def G_dep_RT_total(T, ns, phase):
+        n = sum(ns)
+        eos.solve(T, P, [ni/n for ni in ns])
+        return n*(getattr(eos, 'H_dep_' + phase) - T*getattr(eos, 'S_dep_' + phase))/(R*T)
+
+    for phase in ['l', 'g']:
+        # Fugacity coefficients are the partial molar departure Gibbs energy
+        lnphis_num = []
+        for i in range(3):
+            h = 1E-6
+            n_up, n_down = list(ns), list(ns)
+            n_up[i] += h
+            n_down[i] -= h
+            lnphis_num.append((G_dep_RT_total(T, n_up, phase) - G_dep_RT_total(T, n_down, phase))/(2*h))
+        # Departure enthalpy from the Gibbs-Helmholtz relation
+        dT = 1E-3
+        H_dep_num = -T*T*R*(G_dep_RT_total(T+dT, ns, phase) - G_dep_RT_total(T-dT, ns, phase))/(2*dT)
+        eos.solve(T, P, ns)
+        assert_allclose(np.log(getattr(eos, 'phis_' + phase)), lnphis_num, rtol=1E-6)
+        assert_allclose(getattr(eos, 'H_dep_' + phase), H_dep_num, rtol=1E-6)
+
+    # Two-phase region has distinct roots
+    eos.solve(200., 1E6, ns)
+    assert_allclose([eos.Z_l, eos.Z_g], [0.0333318803395672, 0.7442857025658091])
+
+    # Supercritical states where the smallest root is below B; only the
+    # largest root is used
+    eos = PRMIX([33.2, 126.2], [1297000., 3394000.], [-0.216, 0.04])
+    eos.solve(300., 1E7, [0.75, 0.25])
+    assert_allclose([eos.Z_l, eos.Z_g], [1.0282145657912483]*2)
+    assert_allclose(eos.phis_l, eos.phis_g)
+    assert np.isfinite([eos.H_dep_l, eos.S_dep_l]).all()
+    eos = PRMIX([190.56, 305.32], [4599000., 4872000.], [0.011, 0.098])
+    eos.solve(400., 1E8, [0.5, 0.5])
+    assert_allclose([eos.Z_l, eos.Z_g], [1.6472816169449105]*2)
+    assert_allclose(eos.phis_g, [1.1818992, 0.67518338], rtol=1E-7)
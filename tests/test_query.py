@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+
+import numpy as np
+from thermo.query import *
+from thermo.safety import IARC_data, Carcinogen
+from thermo.bulk import constants_table
+
+
+def test_ConstantIndex():
+    CASRNs = ['7732-18-5', '64-17-5', '67-64-1', '71-43-2', '108-88-3', '50-00-0', '74-82-8']
+    index = ConstantIndex(CASRNs, ['Tb', 'Tc', 'logP'])
+    assert list(index.CASRNs) == sorted(CASRNs)
+    table = constants_table(sorted(CASRNs), ['Tb', 'Tc', 'logP'])
+
+    def brute(low, high, column):
+        values = table[column]
+        return set(values.index[(values >= low) & (values <= high)])
+
+    assert set(index.query(Tb=(300, 400))) == brute(300, 400, 'Tb')
+    assert set(index.query(Tc=(None, 520))) == brute(0, 520, 'Tc')
+    assert set(index.query(Tb=(300, 400), logP=(None, 1))) == brute(300, 400, 'Tb') & brute(-10, 1, 'logP')
+    assert list(index.query(Tb=(1000, 2000))) == []
+    assert list(index.query(Tc=table.at['7732-18-5', 'Tc'])) == ['7732-18-5']
+
+    # Carcinogen status, as from the safety functions
+    for CASRN in CASRNs:
+        status = Carcinogen(CASRN)
+        assert index.table.at[CASRN, 'IARC'] == status['International Agency for Research on Cancer']
+        assert index.table.at[CASRN, 'NTP'] == status['National Toxicology Program 13th Report on Carcinogens']
+    assert set(index.query(Carcinogen=True)) == set(['64-17-5', '71-43-2', '50-00-0'])
+    assert set(index.query(NTP=['Known', 'Reasonably Anticipated'])) == set(['71-43-2', '50-00-0'])
+    assert '7732-18-5' in index.query(Carcinogen=False, Tb=(370, 380))
+
+
+def test_ConstantIndex_refresh():
+    index = ConstantIndex(['7732-18-5', '108-88-3'], ['Tb'])
+    assert not index.refresh()
+    assert list(index.query(Carcinogen=True)) == []
+    group = IARC_data.at['108-88-3', 'group']
+    try:
+        IARC_data.at['108-88-3', 'group'] = 1
+        assert list(index.query(Carcinogen=True)) == ['108-88-3']
+    finally:
+        IARC_data.at['108-88-3', 'group'] = group
+    assert list(index.query(Carcinogen=True)) == []
+
+    index.auto_refresh = False
+    assert not index.mask(Tb=(0, 1)).any()
+
+
+def test_query_constants():
+    CASRNs = query_constants(Tb=(300, 350), Tc=(500, None), logP=(None, 1), Carcinogen=False)
+    assert '67-64-1' in CASRNs
+    assert '71-43-2' not in CASRNs
+    assert len(CASRNs) == len(set(CASRNs))
+    assert len(query_constants()) > 30000
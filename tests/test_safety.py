@@ -238,6 +238,85 @@ def test_UFL():
         UFL(CASRN='8006-61-9', Method='BADMETHOD')
 
 
+def test_FuelSet():
+    CASRNs = ['7440-37-1', '124-38-9', '7440-59-7', '7440-01-9', '7727-37-9', '7440-63-3', '10102-43-9', '7782-44-7', '132259-10-0', '7439-90-9', '10043-92-2', '7732-18-5', '7782-50-5', '7782-41-4', '67-64-1', '67-56-1', '75-52-5', '590-19-2', '277-10-1']
+    LFLs = [None]*14 + [0.025, 0.06, 0.073, 0.020039, 0.011316]
+    UFLs = [None]*14 + [0.143, 0.36, 0.63, 0.1097, 0.072]
+    fuels = FuelSet(CASRNs, LFLs=LFLs, UFLs=UFLs)
+    assert fuels.inert.sum() == 14
+
+    ys = [0.05]*9 + [0.10] + [0.05]*9
+    assert_allclose(fuels.LFL(ys), 0.023964903630937385)
+    assert_allclose(fuels.UFL(ys), 0.14550641757359664)
+    assert type(fuels.LFL(ys)) is float
+
+    # Many compositions at once, matching the one-at-a-time functions
+    yss = np.random.RandomState(0).rand(50, len(CASRNs))
+    expect_LFL = [LFL_mixture(ys=list(ys), LFLs=LFLs, CASRNs=CASRNs) for ys in yss]
+    expect_UFL = [UFL_mixture(ys=list(ys), UFLs=UFLs, CASRNs=CASRNs) for ys in yss]
+    assert_allclose(fuels.LFL(yss), expect_LFL, rtol=1e-13)
+    assert_allclose(fuels.UFL(yss), expect_UFL, rtol=1e-13)
+    assert_allclose(fuels.LFL(yss.reshape(5, 10, -1)).ravel(), expect_LFL, rtol=1e-13)
+
+    fractions = fuels.fuel_fraction(yss)
+    assert_allclose(fractions, yss[:, 14:].sum(axis=1))
+    assert np.all(fuels.flammable(yss) == ((fractions >= expect_LFL) & (fractions <= expect_UFL)))
+
+    # Limits resolved from the databanks and the estimation methods
+    fuels = FuelSet(['74-82-8', '74-84-0', '7727-37-9', '132259-10-0'])
+    assert_allclose(fuels.LFLs[:2], [LFL(CASRN='74-82-8'), LFL(CASRN='74-84-0')])
+    assert_allclose(fuels.UFLs[:2], [UFL(CASRN='74-82-8'), UFL(CASRN='74-84-0')])
+    assert np.all(np.isnan(fuels.LFLs[2:]))
+    ys = np.array([[0.05, 0., 0.05, 0.9], [0.5, 0., 0., 0.5], [0., 0., 0.1, 0.9]])
+    assert list(fuels.flammable(ys)) == [True, False, False]
+    assert fuels.flammable(ys[0]) is True
+    assert np.isnan(fuels.LFL(ys[2]))
+
+    fuels = FuelSet(['unknown', '74-82-8'], Hcs=[-764464.0, None],
+                    atomss=[{'H': 4, 'C': 1, 'O': 1}, {}])
+    assert_allclose(fuels.LFLs, [0.05870183749384112, 0.044])
+    assert_allclose(fuels.UFLs, [0.1901523455253683, 0.17])
+
+    # A fuel without a known limit only matters when present
+    fuels = FuelSet(['132451235-2151234-1234123', '74-82-8'])
+    assert np.isnan(fuels.LFLs[0])
+    assert_allclose(fuels.LFL([[0., 0.1], [0.1, 0.1]]), [0.044, np.nan])
+
+
+def test_hazard_profile_many():
+    from thermo.safety import _OntarioExposureLimits
+    CASRNs = [i.strip() for i in _OntarioExposureLimits] + list(hazard_data.index) + ['132451235-2151234-1234123', '7732-18-5']
+    profile = hazard_profile_many(CASRNs)
+    assert list(profile.columns) == hazard_columns
+    assert list(profile.index) == CASRNs
+
+    def same(value, expect):
+        if expect is None:
+            return value is None or (isinstance(value, float) and np.isnan(value))
+        return value == expect
+
+    for CASRN, row in zip(CASRNs, profile.itertuples(index=False)):
+        row = dict(zip(hazard_columns, row))
+        for name, func in [('TWA', TWA), ('STEL', STEL), ('Ceiling', Ceiling)]:
+            # Ontario CASRNs with whitespace are only found with it by the single functions
+            expect = func(CASRN) or func(' ' + CASRN)
+            assert same(row[name], None if expect is None else expect[0])
+            assert row[name + ' units'] == (None if expect is None else expect[1])
+        skin = Skin(CASRN)
+        assert row['Skin'] == (Skin(' ' + CASRN) if skin is None else skin)
+        carcinogen = Carcinogen(CASRN)
+        assert row['IARC'] == carcinogen[IARC]
+        assert row['NTP'] == carcinogen[NTP]
+        for name, func in [('Tflash', Tflash), ('Tautoignition', Tautoignition), ('LFL', LFL), ('UFL', UFL)]:
+            assert same(row[name], func(CASRN=CASRN))
+
+    profile = hazard_profile_many(['71-43-2', 'bad', '71-43-2'], columns=['Skin', 'IARC', 'UFL'])
+    assert list(profile.columns) == ['Skin', 'IARC', 'UFL']
+    assert profile['Skin'].tolist() == [True, None, True]
+    assert profile['IARC'].tolist() == [IARC_codes[1], UNLISTED, IARC_codes[1]]
+    assert_allclose(profile['UFL'].values, [0.086, np.nan, 0.086])
+
+
 def test_unit_conv_TLV():
     mgm3 = ppmv_to_mgm3(1, 40)
     assert_allclose(mgm3, 1.6349623351068687)
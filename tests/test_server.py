@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+
+import asyncio
+import json
+import pytest
+from numpy.testing import assert_allclose
+from thermo.server import *
+from thermo.chemical import Chemical
+
+
+@pytest.mark.meta_Chemical
+def test_PropertyServer_evaluate():
+    server = PropertyServer(preload=['water'])
+    assert list(server.chemicals) == ['7732-18-5']
+
+    results, errors = server.evaluate([['water', 'rhol', 300.],
+                                       {'ID': '7732-18-5', 'property': 'Psat', 'T': 350.},
+                                       ['ethanol', 'Cpg', 400., 2E5],
+                                       ['notachemical', 'rhol'],
+                                       ['water', 'NOTAPROPERTY'],
+                                       ['water', 'set_T']])
+    water, ethanol = Chemical('water', T=300.), Chemical('ethanol', T=400., P=2E5)
+    assert_allclose(results[0], water.rhol)
+    water.set_T(350.)
+    assert_allclose(results[1], water.Psat)
+    assert_allclose(results[2], ethanol.Cpg)
+    assert results[3:] == [None, None, None]
+    assert [i for i, _ in errors] == [3, 4, 5]
+    # Both identifiers of water share one object
+    assert sorted(server.chemicals) == ['64-17-5', '7732-18-5']
+
+    status, content_type, body = server.respond('POST', '/evaluate', 'application/json',
+                                                b'{"requests": [["water", "MW"]]}')
+    assert (status, json.loads(body.decode('utf-8'))) == (200, {'results': [18.01528], 'errors': []})
+    assert server.respond('POST', '/evaluate', None, b'not json')[0] == 400
+    assert server.respond('GET', '/evaluate', None, b'')[0] == 405
+    assert server.respond('GET', '/nothing', None, b'')[0] == 404
+    metrics = json.loads(server.respond('GET', '/metrics', None, b'')[2].decode('utf-8'))
+    assert metrics['evaluations'] == 7
+    assert metrics['requests']['/evaluate'] == 3
+    # Arbitrary paths do not each get a counter
+    for i in range(20):
+        server.respond('GET', '/nothing/%d?x=%d' %(i, i), None, b'')
+    metrics = json.loads(server.respond('GET', '/metrics', None, b'')[2].decode('utf-8'))
+    assert sorted(metrics['requests']) == ['/evaluate', '/metrics', 'other']
+    assert metrics['requests']['other'] == 21
+
+
+@pytest.mark.meta_Chemical
+def test_PropertyServer_state():
+    # Answers do not depend on the requests served before
+    server = PropertyServer()
+    (rhol_400, rhol_300), errors = server.evaluate([['acetone', 'rhol', 400.], ['acetone', 'rhol', 300.]])
+    assert errors == []
+    assert_allclose(rhol_300, Chemical('67-64-1', T=300.).rhol, rtol=1e-13)
+    assert_allclose(rhol_400, Chemical('67-64-1', T=400.).rhol, rtol=1e-13)
+    for T in [350., 250., 300.]:
+        value = server.evaluate([['acetone', 'Cpl', T]])[0][0]
+        assert_allclose(value, Chemical('67-64-1', T=T).Cpl, rtol=1e-13)
+
+    # Non-scalar attributes fail on their own, not the whole batch
+    results, errors = server.evaluate([['water', 'VaporPressure', 300.], ['water', 'synonyms'], ['water', 'MW']])
+    assert results == [None, None, 18.01528]
+    assert [i for i, _ in errors] == [0, 1]
+    status, _, body = server.respond('POST', '/evaluate', None, b'[["water", "VaporPressure", 300], ["water", "MW"]]')
+    assert status == 200
+    assert json.loads(body.decode('utf-8'))['results'] == [None, 18.01528]
+
+    # Unexpected failures give a response with the status 500
+    server.evaluate = lambda requests: ([object()], [])
+    status, _, body = server.respond('POST', '/evaluate', None, b'[["water", "MW"]]')
+    assert status == 500
+    assert 'error' in json.loads(body.decode('utf-8'))
+
+    # The caches are bounded
+    server = PropertyServer(max_chemicals=2, max_identifiers=3)
+    server.evaluate([[ID, 'MW'] for ID in ['water', 'ethanol', 'methanol', 'water', '7732-18-5']])
+    assert list(server.chemicals) == ['67-56-1', '7732-18-5']
+    assert list(server.CASs) == ['methanol', 'water', '7732-18-5']
+
+
+@pytest.mark.meta_Chemical
+def test_PropertyServer_http():
+    server = PropertyServer()
+
+    async def client():
+        listener = await server.start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        answers = []
+        for method, path, body in [('GET', '/health', b''),
+                                   ('POST', '/evaluate', b'[["water", "Tc"], ["water", "MW", 300]]')]:
+            writer.write(('%s %s HTTP/1.1\r\nContent-Length: %d\r\n\r\n' %(method, path, len(body))).encode() + body)
+            await writer.drain()
+            status = await reader.readline()
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if not line.strip():
+                    break
+                key, value = line.decode().split(':', 1)
+                headers[key.lower()] = value.strip()
+            payload = await reader.readexactly(int(headers['content-length']))
+            answers.append((status.split()[1], json.loads(payload.decode())))
+        writer.close()
+        listener.close()
+        await listener.wait_closed()
+        return answers
+
+    (status1, health), (status2, evaluated) = asyncio.run(client())
+    assert status1 == status2 == b'200'
+    assert health['status'] == 'ok'
+    assert evaluated == {'results': [647.14, 18.01528], 'errors': []}
@@ -348,3 +348,81 @@ def test_TDependentProperty():
     # Test naming and retrieving
     with pytest.raises(Exception):
         EtOH.set_tabular_data(Ts=Ts, properties=props)
+
+
+def test_TDependentProperty_and_method():
+    EtOH = TDependentProperty(CASRN='67-56-1')
+    assert EtOH.method_plan() == (TEST_METHOD_2, TEST_METHOD_1)
+    assert EtOH.method_plan() is EtOH.method_plan()
+    EtOH.set_user_methods(TEST_METHOD_1)
+    assert EtOH.method_plan() == (TEST_METHOD_1, TEST_METHOD_2)
+    EtOH.set_user_methods(TEST_METHOD_1, forced=True)
+    assert EtOH.method_plan() == (TEST_METHOD_1,)
+    # Methods changed directly are used once the user methods are set again
+    EtOH.all_methods.discard(TEST_METHOD_2)
+    EtOH.all_methods.add('another method')
+    EtOH.ranked_methods = EtOH.ranked_methods + ['another method']
+    EtOH.set_user_methods(TEST_METHOD_1)
+    assert EtOH.method_plan() == (TEST_METHOD_1, 'another method')
+    # Tabular data is placed first
+    EtOH.set_tabular_data(Ts=[200, 250, 300], properties=[1.2, 1.3, 1.4], name='test_plan')
+    assert EtOH.method_plan() == ('test_plan', TEST_METHOD_1, 'another method')
+    # Setting the attributes directly discards the plan too
+    EtOH.forced = True
+    assert EtOH.method_plan() == ('test_plan', TEST_METHOD_1)
+    EtOH.user_methods = [TEST_METHOD_1]
+    assert EtOH.method_plan() == (TEST_METHOD_1,)
+    EtOH.forced = False
+
+    from thermo.volume import VolumeLiquid
+    water = VolumeLiquid(CASRN='7732-18-5', Tc=647.14, Pc=22048320.0, omega=0.344)
+    first, second = sorted(water.all_methods_P)[:2]
+    water.set_user_methods_P([first])
+    assert water.method_plan_P()[0] == first
+    water.set_user_methods_P([second])
+    assert water.method_plan_P()[0] == second
+
+    # The object is not modified
+    EtOH = TDependentProperty(CASRN='67-56-1')
+    assert (2.125, TEST_METHOD_2) == EtOH.T_dependent_property_and_method(375)
+    assert (1.5, TEST_METHOD_1) == EtOH.T_dependent_property_and_method(250, TEST_METHOD_2)
+    assert (None, None) == EtOH.T_dependent_property_and_method(150)
+    assert EtOH.method is None
+    assert EtOH.sorted_valid_methods == []
+
+    # Tabular data interpolators are created with the data set
+    Ts = [200, 250, 300, 400, 450]
+    EtOH.set_tabular_data(Ts=Ts, properties=[1.2, 1.3, 1.4, 1.5, 1.6], name='test_set')
+    assert len(EtOH.tabular_data_interpolators) == 1
+    assert EtOH.T_dependent_property_and_method(275)[1] == 'test_set'
+
+
+def test_TDependentProperty_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    EtOH = TDependentProperty(CASRN='67-56-1')
+    EtOH.set_tabular_data(Ts=[200, 250, 300, 400, 450], properties=[1.2, 1.3, 1.4, 1.5, 1.6], name='test_set')
+    Ts = np.linspace(150, 500, 200)
+    expect = [EtOH.T_dependent_property_and_method(T) for T in Ts]
+
+    def work(T):
+        EtOH.T_dependent_property(T)
+        return EtOH.T_dependent_property_and_method(T)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(executor.map(work, Ts)) == expect
+
+
+def test_SharedTabularData():
+    import pickle
+    Ts, props = [200., 250., 300., 350., 400., 450.], [1., 2., 4., 8., 16., 32.]
+    data = SharedTabularData(Ts, props)
+    assert tuple(data) == (Ts, props)
+    assert data.interpolators() is data.interpolators()
+    extrapolator, spline = data.interpolators(lambda T: 1./T, np.log)
+    extrapolator2, spline2 = tabular_interpolators(Ts, props, lambda T: 1./T, np.log)
+    assert_allclose(spline(1/275.), spline2(1/275.), rtol=1e-15)
+    assert_allclose(extrapolator(1/500.), extrapolator2(1/500.), rtol=1e-15)
+
+    copied = pickle.loads(pickle.dumps(data))
+    assert type(copied) is SharedTabularData
+    assert tuple(copied) == (Ts, props)
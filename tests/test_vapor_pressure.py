@@ -146,3 +146,27 @@ def test_VaporPressure():
         cycloheptane.test_method_validity(300, 'BADMETHOD')
 
 
+
+
+def test_VaporPressure_derivative():
+    from scipy.misc import derivative
+    EtOH = VaporPressure(Tb=351.39, Tc=514.0, Pc=6137000.0, omega=0.635, CASRN='64-17-5')
+    methods = [WAGNER_MCGARRY, WAGNER_POLING, ANTOINE_POLING, BOILING_CRITICAL,
+               LEE_KESLER_PSAT, AMBROSE_WALTON, SANJARI]
+    dPsats_calc = [EtOH.calculate_derivative(305., i) for i in methods]
+    dPsats_num = [derivative(EtOH.calculate, 305., dx=1E-4, args=[i]) for i in methods]
+    assert_allclose(dPsats_calc, dPsats_num, rtol=1E-7)
+
+    a = VaporPressure(CASRN='589-81-1')
+    dPsat_calc = a.calculate_derivative(410., ANTOINE_EXTENDED_POLING)
+    dPsat_num = derivative(a.calculate, 410., dx=1E-4, args=[ANTOINE_EXTENDED_POLING])
+    assert_allclose(dPsat_calc, dPsat_num, rtol=1E-7)
+
+    dPsat = dAntoine_dT(100.0, 8.7687, 395.744, -6.469)
+    assert_allclose(dPsat, 3591.414774748115)
+    dPsat = dWagner_original_dT(100.0, 190.53, 4596420., -6.00435, 1.1885, -0.834082, -1.22833)
+    assert_allclose(dPsat, 3593.7078328375014)
+    dPsat = dWagner_dT(100., 190.551, 4599200, -6.02242, 1.26652, -0.5707, -1.366)
+    assert_allclose(dPsat, 3587.2910498076603)
+    dPsat = dTRC_Antoine_extended_dT(180.0, 227.51, -120., 8.95894, 510.595, -15.95, 2.41377, -93.74, 7425.9)
+    assert_allclose(dPsat, 31219.60612638225)
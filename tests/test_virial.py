@@ -54,3 +54,32 @@ def test_BVirial_Tsonopoulos_Extended():
     Bs = [-9.002529440027288e-05, -9.002529440027288e-05, -8.136805574379563e-05, -9.232250634010228e-05, -9.00558069055045e-05, -9.00558069055045e-05, -9.00558069055045e-05, -9.00558069055045e-05, -9.00558069055045e-05, -9.00558069055045e-05, -9.00558069055045e-05, -9.00558069055045e-05, -9.003495446399036e-05, -9.003495446399036e-05, -9.003495446399036e-05, -9.003495446399036e-05, -7.331247111785242e-05]
     assert_allclose(Bs_calc, Bs)
 
+
+
+def test_BVirial_matrix():
+    Tcs, Pcs, Vcs, omegas = [190.56, 305.32], [4599000., 4872000.], [9.86e-05, 0.0001455], [0.008, 0.098]
+    Tcijs, Pcijs, omegaijs = Tcijs_Pcijs_omegaijs(Tcs, Pcs, Vcs, omegas)
+    assert_allclose(np.diag(Tcijs), Tcs)
+    assert_allclose(np.diag(Pcijs), Pcs)
+    assert_allclose(omegaijs[0, 1], 0.053)
+    assert_allclose(Pcijs[0, 1], 4704142.341142858)
+
+    kijs = [[0, 0.01], [0.01, 0]]
+    Tcijs_k = Tcijs_Pcijs_omegaijs(Tcs, Pcs, Vcs, omegas, kijs)[0]
+    assert_allclose(Tcijs_k[0, 1], Tcijs[0, 1]*0.99)
+
+    for correlation in [BVirial_Pitzer_Curl, BVirial_Abbott, BVirial_Tsonopoulos, BVirial_Tsonopoulos_Extended]:
+        Bijs = BVirial_matrix(300., Tcs, Pcs, Vcs, omegas, correlation=correlation)
+        assert_allclose(Bijs, Bijs.T)
+        assert_allclose(np.diag(Bijs), [correlation(300., Tc, Pc, omega) for Tc, Pc, omega in zip(Tcs, Pcs, omegas)])
+        assert_allclose(Bijs[0, 1], correlation(300., Tcijs[0, 1], Pcijs[0, 1], omegaijs[0, 1]))
+
+    # Array of temperatures
+    Ts = [250., 300., 350.]
+    Bijs = BVirial_matrix(Ts, Tcs, Pcs, Vcs, omegas)
+    assert Bijs.shape == (3, 2, 2)
+    assert_allclose(Bijs[1], BVirial_matrix(300., Tcs, Pcs, Vcs, omegas))
+    Bs = BVirial_mixture([0.7, 0.3], Bijs)
+    assert_allclose(Bs[1], -7.566460050671404e-05)
+    assert_allclose(BVirial_Tsonopoulos(np.array(Ts), 190.56, 4599000., 0.008),
+                    [BVirial_Tsonopoulos(T, 190.56, 4599000., 0.008) for T in Ts])
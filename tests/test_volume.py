@@ -26,6 +26,7 @@ import pytest
 import pandas as pd
 from thermo.volume import *
 from thermo.identifiers import checkCAS
+from thermo.virial import BVirial_Tsonopoulos
 
 def test_volume_CSP():
     V1_calc = Yen_Woods_saturation(300, 647.14, 55.45E-6, 0.245)
@@ -328,4 +329,13 @@ def test_COSTALD_mixture():
         COSTALD_mixture([0.4576, 0.5424], 298.,  [512.58],[0.000117, 5.6e-05], [0.559,0.344] )
 
 def test_VolumeLiquidMixture():
-    pass
\ No newline at end of file
+    pass
+
+def test_VolumeGas_B_cache():
+    SO2 = VolumeGas(CASRN='7446-09-5', MW=64.0638,  Tc=430.8, Pc=7884098.25, omega=0.251, dipole=1.63)
+    for method in [TSONOPOULOS_EXTENDED, TSONOPOULOS, ABBOTT, PITZER_CURL]:
+        B = SO2.calculate_B(305., method)
+        assert SO2._B_cache == (305., method, B)
+        Vms = [SO2.calculate_P(305., P, method) for P in [1E4, 1E5, 1E6]]
+        assert_allclose(Vms, [ideal_gas(305., P) + B for P in [1E4, 1E5, 1E6]])
+    assert_allclose(SO2.calculate_B(305., TSONOPOULOS), BVirial_Tsonopoulos(305., 430.8, 7884098.25, 0.251))
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+import sys
+
+usage = '''usage: python -m thermo <command> [arguments]
+
+commands:
+  eval      evaluate properties for each row of a CSV or Parquet file
+  server    serve properties over HTTP
+
+Use python -m thermo <command> --help for the arguments of a command.'''
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in ('eval', 'server'):
+        print(usage)
+        return 0 if argv and argv[0] in ('-h', '--help') else 2
+    # Only the selected command's module is imported
+    if argv[0] == 'eval':
+        from thermo.batch import main as command
+    else:
+        if sys.version_info < (3, 7):
+            print('The server requires Python 3.7 or later')
+            return 1
+        from thermo.server import main as command
+    command(argv[1:])
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -21,7 +21,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 
 from __future__ import division
-from scipy.optimize import fsolve
+from scipy.optimize import fsolve, brenth
 from math import exp, log
 import numpy as np
 import os
@@ -123,6 +123,336 @@ def bubble_at_T(zs, Psats, fugacities=None, gammas=None):
     return P
 
 
+def _Psats_dPsats_at_T(T, vapor_pressures):
+    # Vapor pressures and their analytical derivatives, using the same method
+    # for both; the property objects are not modified, so they may be shared
+    # between threads. The object's own method is only used as the first guess.
+    Psats, dPsats = [], []
+    for obj in vapor_pressures:
+        Psat, method = obj.T_dependent_property_and_method(T, obj.method)
+        if Psat is None:
+            raise Exception('Vapor pressure could not be calculated at %g K' %T)
+        Psats.append(Psat)
+        dPsats.append(obj.calculate_derivative(T, method))
+    return Psats, dPsats
+
+
+def _T_guess_VLE(vapor_pressures, zs):
+    # Mole fraction weighted normal boiling point, or the middle of the range
+    # of vapor pressure validity if the boiling point is not known
+    T_guess = 0.
+    for obj, zi in zip(vapor_pressures, zs):
+        if obj.Tb:
+            T_guess += zi*obj.Tb
+        else:
+            T_guess += zi*0.5*(obj.Tmin + obj.Tmax)
+    return T_guess
+
+
+def _bubble_dew_at_P_err(T, P, zs, vapor_pressures, fugacities, gammas, dew):
+    # Error in the logarithmic form used by the solvers, and its derivative
+    # with respect to 1/T; ln(P) is nearly linear in 1/T so Newton's method
+    # converges in very few iterations in this space.
+    Psats, dPsats = _Psats_dPsats_at_T(T, vapor_pressures)
+    if dew:
+        tot = sum(zs[i]*fugacities[i]/Psats[i]/gammas[i] for i in range(len(zs)))
+        dtot = -sum(zs[i]*fugacities[i]*dPsats[i]/Psats[i]**2/gammas[i] for i in range(len(zs)))
+        err = log(tot*P)
+    else:
+        tot = sum(zs[i]*Psats[i]*gammas[i]/fugacities[i] for i in range(len(zs)))
+        dtot = sum(zs[i]*dPsats[i]*gammas[i]/fugacities[i] for i in range(len(zs)))
+        err = log(tot/P)
+    # d(err)/d(1/T) = -T^2 d(err)/dT
+    return err, -T*T*dtot/tot
+
+
+def _bubble_dew_at_P(P, zs, vapor_pressures, fugacities, gammas, T_guess,
+                     xtol, maxiter, dew):
+    if not fugacities:
+        fugacities = [1 for i in range(len(zs))]
+    if not gammas:
+        gammas = [1 for i in range(len(zs))]
+    if not none_and_length_check((zs, vapor_pressures, fugacities, gammas)):
+        raise Exception('Input dimentions are inconsistent or some input parameters are missing.')
+    if T_guess is None:
+        T_guess = _T_guess_VLE(vapor_pressures, zs)
+
+    T = T_guess
+    try:
+        for i in range(maxiter):
+            err, derr = _bubble_dew_at_P_err(T, P, zs, vapor_pressures, fugacities, gammas, dew)
+            T_inv = 1./T - err/derr
+            if T_inv <= 0:
+                break
+            T_new = 1./T_inv
+            if abs(T_new - T) < xtol*T:
+                return T_new
+            T = T_new
+    except:
+        pass
+
+    # Newton's method failed or left the range of the vapor pressure methods;
+    # fall back to a bounded solver over the common range of validity.
+    Tmin = max(obj.Tmin for obj in vapor_pressures)
+    Tmax = min(obj.Tmax for obj in vapor_pressures)
+    def error(T):
+        return _bubble_dew_at_P_err(T, P, zs, vapor_pressures, fugacities, gammas, dew)[0]
+    try:
+        return brenth(error, Tmin, Tmax)
+    except ValueError:
+        raise Exception('To within the implemented temperature range, it is not possible to calculate the desired value.')
+
+
+def bubble_at_P(P, zs, vapor_pressures, fugacities=None, gammas=None,
+                T_guess=None, xtol=1E-10, maxiter=50):
+    r'''Calculates the bubble point temperature of a mixture at a specified
+    pressure, using the vapor pressure objects of each component. The
+    liquid mole fractions are those of the mixture. Solves:
+
+    .. math::
+        \ln \left(\frac{1}{P}\sum_i \frac{x_i P^{sat}_i \gamma_i}{\phi_i}
+        \right) = 0
+
+    Newton's method is used in terms of :math:`1/T`, with analytical vapor
+    pressure derivatives from :obj:`VaporPressure.calculate_derivative`.
+    If Newton's method fails, the solution is bracketed with brenth over the
+    range in which all vapor pressure objects are valid.
+
+    Parameters
+    ----------
+    P : float
+        Pressure, [Pa]
+    zs : list[float]
+        Liquid-phase mole fractions, [-]
+    vapor_pressures : list[VaporPressure]
+        :obj:`thermo.vapor_pressure.VaporPressure` instances for each
+        component
+    fugacities : list[float], optional
+        Fugacity coefficients of each component, [-]
+    gammas : list[float], optional
+        Activity coefficients of each component, [-]
+    T_guess : float, optional
+        Initial guess for the temperature, i.e. the solution at the previous
+        tray or iteration; if not provided, the mole fraction averaged
+        boiling point is used, [K]
+    xtol : float, optional
+        Relative tolerance in temperature, [-]
+    maxiter : int, optional
+        Maximum number of Newton iterations, [-]
+
+    Returns
+    -------
+    T : float
+        Bubble point temperature, [K]
+
+    Notes
+    -----
+    The vapor pressure objects remember the method they last used, so
+    repeated calls with the same objects are fast.
+
+    Examples
+    --------
+    >>> from thermo.vapor_pressure import VaporPressure
+    >>> VPs = [VaporPressure(Tb=353.23, Tc=562.05, Pc=4895000.0, omega=0.212),
+    ...        VaporPressure(Tb=383.75, Tc=591.75, Pc=4108000.0, omega=0.257)]
+    >>> bubble_at_P(101325, [0.5, 0.5], VPs)
+    365.0694706562938
+    '''
+    return _bubble_dew_at_P(P, zs, vapor_pressures, fugacities, gammas,
+                            T_guess, xtol, maxiter, dew=False)
+
+
+def dew_at_P(P, zs, vapor_pressures, fugacities=None, gammas=None,
+             T_guess=None, xtol=1E-10, maxiter=50):
+    r'''Calculates the dew point temperature of a mixture at a specified
+    pressure, using the vapor pressure objects of each component. The
+    vapor mole fractions are those of the mixture. Solves:
+
+    .. math::
+        \ln \left(P\sum_i \frac{y_i \phi_i}{P^{sat}_i \gamma_i}\right) = 0
+
+    Newton's method is used in terms of :math:`1/T`, with analytical vapor
+    pressure derivatives from :obj:`VaporPressure.calculate_derivative`.
+    If Newton's method fails, the solution is bracketed with brenth over the
+    range in which all vapor pressure objects are valid.
+
+    Parameters
+    ----------
+    P : float
+        Pressure, [Pa]
+    zs : list[float]
+        Vapor-phase mole fractions, [-]
+    vapor_pressures : list[VaporPressure]
+        :obj:`thermo.vapor_pressure.VaporPressure` instances for each
+        component
+    fugacities : list[float], optional
+        Fugacity coefficients of each component, [-]
+    gammas : list[float], optional
+        Activity coefficients of each component, [-]
+    T_guess : float, optional
+        Initial guess for the temperature, i.e. the solution at the previous
+        tray or iteration; if not provided, the mole fraction averaged
+        boiling point is used, [K]
+    xtol : float, optional
+        Relative tolerance in temperature, [-]
+    maxiter : int, optional
+        Maximum number of Newton iterations, [-]
+
+    Returns
+    -------
+    T : float
+        Dew point temperature, [K]
+
+    Examples
+    --------
+    >>> from thermo.vapor_pressure import VaporPressure
+    >>> VPs = [VaporPressure(Tb=353.23, Tc=562.05, Pc=4895000.0, omega=0.212),
+    ...        VaporPressure(Tb=383.75, Tc=591.75, Pc=4108000.0, omega=0.257)]
+    >>> dew_at_P(101325, [0.5, 0.5], VPs)
+    371.4183290508447
+    '''
+    return _bubble_dew_at_P(P, zs, vapor_pressures, fugacities, gammas,
+                            T_guess, xtol, maxiter, dew=True)
+
+
+def _bubble_dew_at_P_many(Ps, zs, vapor_pressures, T_guesses, xtol, maxiter,
+                          dew):
+    zs = np.atleast_2d(np.array(zs, dtype=float))
+    N, n = zs.shape
+    if n != len(vapor_pressures):
+        raise Exception('Input dimentions are inconsistent or some input parameters are missing.')
+    Ps = np.ones(N)*Ps
+    if T_guesses is None:
+        Ts = np.array([_T_guess_VLE(vapor_pressures, row) for row in zs])
+    else:
+        Ts = np.ones(N)*T_guesses
+
+    # Newton iterations on all compositions at once; only compositions which
+    # have not converged are evaluated at each step.
+    active = np.arange(N)
+    Psats = np.zeros((N, n))
+    dPsats = np.zeros((N, n))
+    for _ in range(maxiter):
+        if not len(active):
+            break
+        try:
+            for k in active:
+                for j, obj in enumerate(vapor_pressures):
+                    Psat, method = obj.T_dependent_property_and_method(Ts[k], obj.method)
+                    Psats[k, j] = Psat
+                    dPsats[k, j] = obj.calculate_derivative(Ts[k], method)
+        except:
+            # Solve the problematic points with the scalar solver instead
+            break
+        z, Psat, dPsat, T = zs[active], Psats[active], dPsats[active], Ts[active]
+        if dew:
+            tot = (z/Psat).sum(axis=1)
+            dtot = -(z*dPsat/Psat**2).sum(axis=1)
+            err = np.log(tot*Ps[active])
+        else:
+            tot = (z*Psat).sum(axis=1)
+            dtot = (z*dPsat).sum(axis=1)
+            err = np.log(tot/Ps[active])
+        derr = -T*T*dtot/tot
+        T_inv = 1./T - err/derr
+        if np.any(T_inv <= 0):
+            break
+        T_new = 1./T_inv
+        Ts[active] = T_new
+        active = active[np.abs(T_new - T) >= xtol*T]
+
+    for k in active:
+        Ts[k] = _bubble_dew_at_P(Ps[k], zs[k].tolist(), vapor_pressures, None,
+                                 None, None, xtol, maxiter, dew)
+    return Ts
+
+
+def bubble_at_P_many(Ps, zs, vapor_pressures, T_guesses=None, xtol=1E-10,
+                     maxiter=50):
+    r'''Vectorized version of :obj:`bubble_at_P`, which calculates the bubble
+    point temperatures of many liquid compositions of the same components
+    at once. Newton's method is applied to all compositions simultaneously
+    with NumPy; compositions for which it fails are solved individually
+    with :obj:`bubble_at_P`. Ideal liquid and vapor phases are assumed.
+
+    Parameters
+    ----------
+    Ps : float or array-like
+        Pressure, either the same for all compositions or one for each of
+        them, [Pa]
+    zs : array-like
+        Liquid-phase mole fractions; one row per composition, [-]
+    vapor_pressures : list[VaporPressure]
+        :obj:`thermo.vapor_pressure.VaporPressure` instances for each
+        component
+    T_guesses : float or array-like, optional
+        Initial guesses for the temperatures, i.e. the solutions at the
+        previous iteration, [K]
+    xtol : float, optional
+        Relative tolerance in temperature, [-]
+    maxiter : int, optional
+        Maximum number of Newton iterations, [-]
+
+    Returns
+    -------
+    Ts : ndarray
+        Bubble point temperatures, [K]
+
+    Examples
+    --------
+    >>> from thermo.vapor_pressure import VaporPressure
+    >>> VPs = [VaporPressure(Tb=353.23, Tc=562.05, Pc=4895000.0, omega=0.212),
+    ...        VaporPressure(Tb=383.75, Tc=591.75, Pc=4108000.0, omega=0.257)]
+    >>> bubble_at_P_many(101325, [[0.25, 0.75], [0.5, 0.5]], VPs)
+    array([373.00726195, 365.06947066])
+    '''
+    return _bubble_dew_at_P_many(Ps, zs, vapor_pressures, T_guesses, xtol,
+                                 maxiter, dew=False)
+
+
+def dew_at_P_many(Ps, zs, vapor_pressures, T_guesses=None, xtol=1E-10,
+                  maxiter=50):
+    r'''Vectorized version of :obj:`dew_at_P`, which calculates the dew
+    point temperatures of many vapor compositions of the same components
+    at once. Newton's method is applied to all compositions simultaneously
+    with NumPy; compositions for which it fails are solved individually
+    with :obj:`dew_at_P`. Ideal liquid and vapor phases are assumed.
+
+    Parameters
+    ----------
+    Ps : float or array-like
+        Pressure, either the same for all compositions or one for each of
+        them, [Pa]
+    zs : array-like
+        Vapor-phase mole fractions; one row per composition, [-]
+    vapor_pressures : list[VaporPressure]
+        :obj:`thermo.vapor_pressure.VaporPressure` instances for each
+        component
+    T_guesses : float or array-like, optional
+        Initial guesses for the temperatures, i.e. the solutions at the
+        previous iteration, [K]
+    xtol : float, optional
+        Relative tolerance in temperature, [-]
+    maxiter : int, optional
+        Maximum number of Newton iterations, [-]
+
+    Returns
+    -------
+    Ts : ndarray
+        Dew point temperatures, [K]
+
+    Examples
+    --------
+    >>> from thermo.vapor_pressure import VaporPressure
+    >>> VPs = [VaporPressure(Tb=353.23, Tc=562.05, Pc=4895000.0, omega=0.212),
+    ...        VaporPressure(Tb=383.75, Tc=591.75, Pc=4108000.0, omega=0.257)]
+    >>> dew_at_P_many(101325, [[0.25, 0.75], [0.5, 0.5]], VPs)
+    array([377.71878717, 371.41832905])
+    '''
+    return _bubble_dew_at_P_many(Ps, zs, vapor_pressures, T_guesses, xtol,
+                                 maxiter, dew=True)
+
+
 def identify_phase(T=None, P=None, Tm=None, Tb=None, Tc=None, Psat=None):
     '''
     >>> identify_phase(T=280, P=101325, Tm=273.15, Psat=991)
@@ -307,3 +637,139 @@ def Pdew_mixture(T=None, zs=None, Psats=None, CASRNs=None,
 
 
 
+def _envelope_point(T, zs, vapor_pressures, fugacities, gammas, dew, Method):
+    # Saturation pressure on one of the curves and its derivative with
+    # respect to 1/T, in logarithmic form. Other phase equilibrium models
+    # supply the same two values at a given T for the tracer to use.
+    if Method == IDEALVLE:
+        err, derr = _bubble_dew_at_P_err(T, 1., zs, vapor_pressures,
+                                         fugacities, gammas, dew)
+        if dew:
+            return -err, -derr
+        return err, derr
+    else:
+        raise Exception('Failure in in function')
+
+
+def _trace_envelope_curve(zs, vapor_pressures, fugacities, gammas, Tmin,
+                          Tmax, rtol, max_points, dew, Method):
+    s, s_end = 1./Tmin, 1./Tmax
+    ds_max = (s - s_end)/10.
+    ds_min = (s - s_end)*1E-6
+    ds = ds_max/10.
+
+    lnP, dlnP = _envelope_point(Tmin, zs, vapor_pressures, fugacities, gammas, dew, Method)
+    Ts, Ps = [Tmin], [exp(lnP)]
+    while s - s_end > ds_min and len(Ts) < max_points:
+        ds = min(ds, s - s_end)
+        s_new = s - ds
+        try:
+            lnP_new, dlnP_new = _envelope_point(1./s_new, zs, vapor_pressures,
+                                                fugacities, gammas, dew, Method)
+        except:
+            if ds > ds_min:
+                ds *= 0.5
+                continue
+            break
+        # The tangent is the predictor; its deviation from the corrected
+        # point controls the step size.
+        err = abs(lnP_new - (lnP - dlnP*ds))
+        if err > rtol and ds > ds_min:
+            ds *= 0.5
+            continue
+        s, lnP, dlnP = s_new, lnP_new, dlnP_new
+        Ts.append(1./s)
+        Ps.append(exp(lnP))
+        if err < 0.25*rtol:
+            ds = min(2.*ds, ds_max)
+    return np.array(Ts), np.array(Ps)
+
+
+def phase_envelope(zs, vapor_pressures, fugacities=None, gammas=None,
+                   Tmin=None, Tmax=None, Pmin=1E3, rtol=1E-3, max_points=1000,
+                   Method=IDEALVLE):
+    r'''Traces the bubble and dew point curves of a mixture of fixed
+    composition, from a low temperature up to the highest temperature at
+    which every component's vapor pressure can be calculated.
+
+    Each curve is followed by continuation in :math:`1/T`, in which the
+    logarithm of the saturation pressure is nearly linear. The tangent at the
+    last point, obtained from the analytical vapor pressure derivatives, is
+    used as a predictor; the step is halved if the predicted pressure differs
+    from the calculated one by more than `rtol`, and doubled if the error is
+    small. Points are therefore concentrated where the curves bend.
+
+    Parameters
+    ----------
+    zs : list[float]
+        Mole fractions of the mixture, [-]
+    vapor_pressures : list[VaporPressure]
+        :obj:`thermo.vapor_pressure.VaporPressure` instances for each
+        component
+    fugacities : list[float], optional
+        Fugacity coefficients of each component, [-]
+    gammas : list[float], optional
+        Activity coefficients of each component, [-]
+    Tmin : float, optional
+        Temperature to begin both curves at; if not provided, each curve
+        begins at the temperature where its pressure is `Pmin`, [K]
+    Tmax : float, optional
+        Temperature to end both curves at; defaults to the lowest maximum
+        temperature of the vapor pressure objects, normally the lowest
+        critical temperature, [K]
+    Pmin : float, optional
+        Pressure at which to begin the curves if `Tmin` is not given, [Pa]
+    rtol : float, optional
+        Allowable error of the predictor in the logarithm of pressure, [-]
+    max_points : int, optional
+        Maximum number of points along each curve, [-]
+    Method : str, optional
+        Phase equilibrium model; only 'Ideal' is implemented at present
+
+    Returns
+    -------
+    Ts_bubble : ndarray
+        Temperatures along the bubble point curve, [K]
+    Ps_bubble : ndarray
+        Bubble point pressures, [Pa]
+    Ts_dew : ndarray
+        Temperatures along the dew point curve, [K]
+    Ps_dew : ndarray
+        Dew point pressures, [Pa]
+
+    Notes
+    -----
+    For ideal VLE, the curves have an explicit solution at a specified
+    temperature; the tracer is structured around the predictor-corrector
+    step so that models requiring an iterative corrector can be added.
+
+    Examples
+    --------
+    >>> from thermo.vapor_pressure import VaporPressure
+    >>> VPs = [VaporPressure(Tb=353.23, Tc=562.05, Pc=4895000.0, omega=0.212),
+    ...        VaporPressure(Tb=383.75, Tc=591.75, Pc=4108000.0, omega=0.257)]
+    >>> Ts_bubble, Ps_bubble, Ts_dew, Ps_dew = phase_envelope([0.5, 0.5], VPs)
+    >>> Ts_bubble[-1], Ps_bubble[-1]
+    (562.05, 3870372.2534649554)
+    '''
+    if not fugacities:
+        fugacities = [1 for i in range(len(zs))]
+    if not gammas:
+        gammas = [1 for i in range(len(zs))]
+    if not none_and_length_check((zs, vapor_pressures, fugacities, gammas)):
+        raise Exception('Input dimentions are inconsistent or some input parameters are missing.')
+    if Tmax is None:
+        Tmax = min(obj.Tmax for obj in vapor_pressures)
+    if Tmin is None:
+        Tmin_bubble = bubble_at_P(Pmin, zs, vapor_pressures, fugacities, gammas)
+        Tmin_dew = dew_at_P(Pmin, zs, vapor_pressures, fugacities, gammas)
+    else:
+        Tmin_bubble = Tmin_dew = Tmin
+
+    Ts_bubble, Ps_bubble = _trace_envelope_curve(zs, vapor_pressures, fugacities,
+                                                 gammas, Tmin_bubble, Tmax, rtol,
+                                                 max_points, False, Method)
+    Ts_dew, Ps_dew = _trace_envelope_curve(zs, vapor_pressures, fugacities,
+                                           gammas, Tmin_dew, Tmax, rtol,
+                                           max_points, True, Method)
+    return Ts_bubble, Ps_bubble, Ts_dew, Ps_dew
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Batch evaluation of properties for files of (identifier, T, P) rows, also
+available from the command line::
+
+    python -m thermo eval input.csv output.csv --props rhol Cpl Psat
+
+Files are read and written in chunks, so files of any size may be processed
+with bounded memory. CSV files are always supported; Parquet files (with
+the extension .parquet) require pyarrow. A row describes a mixture if it has
+a composition: its identifier column then has the identifiers of the
+components separated by ';', and its composition column their mole
+fractions, also separated by ';'.
+'''
+
+from __future__ import division
+
+__all__ = ['BatchEvaluator', 'evaluate_file', 'main']
+
+import argparse
+import sys
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from thermo.chemical import Chemical, Mixture
+from thermo.identifiers import CASfromAny
+from thermo.utils import TableWriter
+
+
+class BatchEvaluator(object):
+    r'''Evaluates properties for tables of (identifier, T, P) rows.
+
+    Each identifier is resolved with :obj:`thermo.identifiers.CASfromAny`
+    only once. The rows of each chunk are grouped by chemical, and evaluated
+    in order of temperature and pressure with one `Chemical` (or `Mixture`)
+    object per group; the objects are kept for later chunks, up to
+    `max_objects` of them, the least recently used being discarded first,
+    and likewise up to `max_identifiers` resolved identifiers. The methods
+    of the property objects are reset before each change of state, so each
+    row has the values of a new object at its conditions, whichever other
+    rows are evaluated.
+
+    Parameters
+    ----------
+    props : list[str]
+        Names of the attributes of `Chemical` or `Mixture` to evaluate
+    max_objects : int, optional
+        Maximum number of chemical objects kept between chunks
+    max_identifiers : int, optional
+        Maximum number of resolved identifiers kept between chunks
+
+    Examples
+    --------
+    >>> evaluator = BatchEvaluator(['MW', 'Tc'])
+    >>> evaluator.evaluate(pd.DataFrame({'ID': ['water', 'methanol'], 'T': [300., 300.]}))
+             MW      Tc
+    0  18.01528  647.14
+    1  32.04186  512.50
+    '''
+    def __init__(self, props, max_objects=1000, max_identifiers=100000):
+        self.props = list(props)
+        self.max_objects = max_objects
+        self.max_identifiers = max_identifiers
+        self.CASs = OrderedDict()
+        self.objects = OrderedDict()
+
+    def CAS(self, ID):
+        r'''Resolves an identifier, caching the result; returns None if the
+        identifier is not recognized.'''
+        try:
+            CAS = self.CASs.pop(ID)
+        except KeyError:
+            try:
+                CAS = CASfromAny(ID)
+            except:
+                CAS = None
+            if len(self.CASs) >= self.max_identifiers:
+                self.CASs.popitem(last=False)
+        self.CASs[ID] = CAS
+        return CAS
+
+    def key(self, ID, composition=None):
+        r'''Returns the key by which rows are grouped: the CAS number of a
+        chemical, or a tuple of the CAS numbers and mole fractions of a
+        mixture; or None if any identifier is not recognized.'''
+        if composition is None or (isinstance(composition, float) and np.isnan(composition)):
+            return self.CAS(ID)
+        CASs = tuple(self.CAS(i.strip()) for i in str(ID).split(';'))
+        try:
+            zs = tuple(float(z) for z in str(composition).split(';'))
+        except ValueError:
+            return None
+        if None in CASs or len(CASs) != len(zs):
+            return None
+        return (CASs, zs)
+
+    def object(self, key):
+        r'''Returns the `Chemical` or `Mixture` object for a key, or None if
+        it could not be created.'''
+        try:
+            obj = self.objects.pop(key)
+        except KeyError:
+            try:
+                if isinstance(key, tuple):
+                    obj = Mixture(list(key[0]), zs=list(key[1]))
+                else:
+                    obj = Chemical(key)
+            except:
+                obj = None
+            if len(self.objects) >= self.max_objects:
+                self.objects.popitem(last=False)
+        self.objects[key] = obj
+        return obj
+
+    def evaluate(self, df, id_column='ID', T_column='T', P_column='P',
+                 composition_column='zs'):
+        r'''Evaluates the properties for each row of a DataFrame. The
+        temperature and pressure columns are optional, defaulting to
+        298.15 K and 101325 Pa.
+
+        Returns
+        -------
+        values : DataFrame
+            One column for each property, with the same index as `df`; None
+            or NaN where they could not be calculated
+        '''
+        n = len(df)
+        Ts = df[T_column].values.astype(float) if T_column in df else np.full(n, 298.15)
+        Ps = df[P_column].values.astype(float) if P_column in df else np.full(n, 101325.)
+        IDs = df[id_column].values
+        compositions = df[composition_column].values if composition_column in df else [None]*n
+
+        groups = OrderedDict()
+        for i in range(n):
+            groups.setdefault(self.key(IDs[i], compositions[i]), []).append(i)
+
+        empty = [None]*len(self.props)
+        rows = [empty]*n
+        for key, indexes in groups.items():
+            obj = None if key is None else self.object(key)
+            if obj is None:
+                continue
+            indexes.sort(key=lambda i: (Ts[i], Ps[i]))
+            for i in indexes:
+                T, P = Ts[i], Ps[i]
+                try:
+                    if obj.T != T or obj.P != P:
+                        obj.P = P
+                        obj.reset_T_methods()
+                        obj.set_T(T)
+                except:
+                    continue
+                rows[i] = [getattr(obj, prop, None) for prop in self.props]
+        return pd.DataFrame(rows, index=df.index, columns=self.props)
+
+
+def _read_chunks(path, chunksize):
+    if path.endswith('.parquet'):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:  # pragma: no cover
+            raise Exception('Reading Parquet files requires pyarrow')
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        for chunk in pd.read_csv(sys.stdin if path == '-' else path, chunksize=chunksize):
+            yield chunk
+
+
+def evaluate_file(input, output, props, chunksize=10000, id_column='ID',
+                  T_column='T', P_column='P', composition_column='zs',
+                  max_objects=1000):
+    r'''Evaluates properties for every row of a CSV or Parquet file, and
+    writes the rows with the properties appended as columns to another one.
+    The input is read, evaluated, and written one chunk at a time. Either
+    path may be '-' for standard input or output, in CSV format.
+
+    Parameters
+    ----------
+    input : str
+        Path of the file of rows to evaluate
+    output : str
+        Path of the file to write
+    props : list[str]
+        Names of the attributes of `Chemical` or `Mixture` to evaluate
+    chunksize : int, optional
+        Number of rows read and evaluated at once
+    id_column : str, optional
+        Column of the identifiers of the chemicals
+    T_column : str, optional
+        Column of the temperatures, [K]
+    P_column : str, optional
+        Column of the pressures, [Pa]
+    composition_column : str, optional
+        Column of the mole fractions of mixtures
+    max_objects : int, optional
+        Maximum number of chemical objects kept between chunks
+
+    Returns
+    -------
+    rows : int
+        Number of rows evaluated
+    '''
+    evaluator = BatchEvaluator(props, max_objects=max_objects)
+    writer = TableWriter(output)
+    rows = 0
+    try:
+        for chunk in _read_chunks(input, chunksize):
+            values = evaluator.evaluate(chunk, id_column=id_column, T_column=T_column,
+                                        P_column=P_column, composition_column=composition_column)
+            writer.write(pd.concat([chunk, values], axis=1))
+            rows += len(chunk)
+    finally:
+        writer.close()
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m thermo eval',
+                                     description='Evaluate properties for each row of a CSV or Parquet file.')
+    parser.add_argument('input', help="File of rows to evaluate, or '-' for standard input")
+    parser.add_argument('output', help="File to write, or '-' for standard output")
+    parser.add_argument('--props', nargs='+', required=True, help='Properties to evaluate, i.e. rhol Cpl')
+    parser.add_argument('--chunksize', type=int, default=10000, help='Rows evaluated at once')
+    parser.add_argument('--id-column', default='ID', help='Column of identifiers')
+    parser.add_argument('--T-column', default='T', help='Column of temperatures, K')
+    parser.add_argument('--P-column', default='P', help='Column of pressures, Pa')
+    parser.add_argument('--composition-column', default='zs', help='Column of mixture mole fractions')
+    parser.add_argument('--max-objects', type=int, default=1000, help='Chemical objects kept between chunks')
+    args = parser.parse_args(argv)
+    evaluate_file(args.input, args.output, args.props, chunksize=args.chunksize,
+                  id_column=args.id_column, T_column=args.T_column,
+                  P_column=args.P_column, composition_column=args.composition_column,
+                  max_objects=args.max_objects)
@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Bulk access to the databanks: the constants of every chemical at once, and
+their export along with temperature-dependent curves to CSV or Parquet files.
+
+Constants are resolved for all chemicals with whole-column operations, with
+the same order of preference between data sources as the function of each
+constant (i.e. :obj:`thermo.critical.Tc`) uses by default. Only tabulated
+values are used; the few functions which fall back to calculating a value
+(such as :obj:`thermo.triple.Pt`, from the vapor pressure at the triple
+temperature) may give values where these tables have none.
+'''
+
+from __future__ import division
+
+__all__ = ['constant_sources', 'curve_sources', 'all_CASRNs',
+           'constants_table', 'curves_table', 'export_constants',
+           'export_curves']
+
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from thermo.utils import TableWriter
+from thermo.identifiers import checkCAS, _identifiers, _CAS, _FORMULA
+from thermo.critical import _crit_IUPAC, _crit_Matthews, _crit_CRC, _crit_PSRKR4, _crit_PassutDanner, _crit_Yaws
+from thermo.miscdata import CRC_inorganic_data, CRC_organic_data
+from thermo.phase_change import Yaws_data, Tm_ON_data, CRCHfus_data, EnthalpyVaporization
+from thermo.triple import Staveley_data
+from thermo.reaction import API_TDB_data
+from thermo.dipole import _dipole_CCDB, _dipole_Muller, _dipole_Poling
+from thermo.safety import IEC_2010, NFPA_2008
+from thermo.environment import CRClogPDict, SyrresDict2
+from thermo.refractivity import CRC_RI_organic
+from thermo.lennard_jones import MagalhaesLJ_data
+from thermo.vapor_pressure import VaporPressure
+from thermo.volume import VolumeLiquid
+from thermo.heat_capacity import HeatCapacityGas, HeatCapacityLiquid
+from thermo.interface import SurfaceTension
+from thermo.viscosity import ViscosityLiquid
+from thermo.thermal_conductivity import ThermalConductivityLiquid
+
+
+_pubchem_frame = None
+
+def _pubchem():
+    # The MW and formula columns of the identifiers databank are made into a
+    # DataFrame on first use only
+    global _pubchem_frame
+    if _pubchem_frame is None:
+        _pubchem_frame = pd.DataFrame({'MW': np.array(_identifiers.MW),
+                                       'formula': _identifiers.column(_FORMULA)},
+                                      index=_identifiers.column(_CAS))
+    return _pubchem_frame
+
+
+# Each source is (DataFrame or function returning it, column, whether the
+# source is skipped for chemicals whose value is missing), or the name of a
+# constant listed before it. Sources are in order of preference, the same
+# as in the function of each constant.
+constant_sources = OrderedDict([
+    ('formula', [(_pubchem, 'formula', True)]),
+    ('MW', [(_pubchem, 'MW', True)]),
+    ('Tm', [(Tm_ON_data, 'Tm', False), (CRC_inorganic_data, 'Tm', True),
+            (CRC_organic_data, 'Tm', True)]),
+    ('Tb', [(CRC_inorganic_data, 'Tb', True), (CRC_organic_data, 'Tb', True),
+            (Yaws_data, 'Tb', False)]),
+    ('Tc', [(_crit_IUPAC, 'Tc', True), (_crit_Matthews, 'Tc', True),
+            (_crit_CRC, 'Tc', True), (_crit_PSRKR4, 'Tc', True),
+            (_crit_PassutDanner, 'Tc', True), (_crit_Yaws, 'Tc', True)]),
+    ('Pc', [(_crit_IUPAC, 'Pc', True), (_crit_Matthews, 'Pc', True),
+            (_crit_CRC, 'Pc', True), (_crit_PSRKR4, 'Pc', True),
+            (_crit_PassutDanner, 'Pc', True), (_crit_Yaws, 'Pc', True)]),
+    ('Vc', [(_crit_IUPAC, 'Vc', True), (_crit_Matthews, 'Vc', True),
+            (_crit_CRC, 'Vc', True), (_crit_PSRKR4, 'Vc', True),
+            (_crit_Yaws, 'Vc', True)]),
+    ('Zc', [(_crit_IUPAC, 'Zc', True), (_crit_Matthews, 'Zc', True),
+            (_crit_CRC, 'Zc', True), (_crit_PSRKR4, 'Zc', True),
+            (_crit_Yaws, 'Zc', True)]),
+    ('omega', [(_crit_PSRKR4, 'omega', True), (_crit_PassutDanner, 'omega', True),
+               (_crit_Yaws, 'omega', True)]),
+    ('Tt', [(Staveley_data, 'Tt68', False), 'Tm']),
+    ('Pt', [(Staveley_data, 'Pt', True)]),
+    ('Hfusm', [(CRCHfus_data, 'Hfus', False)]),
+    ('Hf', [(API_TDB_data, 'Hf', False)]),
+    ('dipole', [(_dipole_CCDB, 'Dipole', True), (_dipole_Muller, 'Dipole', True),
+                (_dipole_Poling, 'Dipole', True)]),
+    ('Stockmayer', [(MagalhaesLJ_data, 'epsilon', False)]),
+    ('molecular_diameter', [(MagalhaesLJ_data, 'sigma', False)]),
+    ('RI', [(CRC_RI_organic, 'RI', False)]),
+    ('logP', [(CRClogPDict, 'logP', False), (SyrresDict2, 'logP', False)]),
+    ('Tflash', [(IEC_2010, 'Tflash', True), (NFPA_2008, 'Tflash', True)]),
+    ('Tautoignition', [(IEC_2010, 'Tautoignition', True), (NFPA_2008, 'Tautoignition', True)]),
+    ('LFL', [(IEC_2010, 'LFL', True), (NFPA_2008, 'LFL', True)]),
+    ('UFL', [(IEC_2010, 'UFL', True), (NFPA_2008, 'UFL', True)]),
+])
+'''Data sources of each constant exported by :obj:`constants_table`, in
+order of preference.'''
+
+# Temperature-dependent properties, with the object calculating each and the
+# constants passed to it
+curve_sources = OrderedDict([
+    ('Psat', (VaporPressure, ['Tb', 'Tc', 'Pc', 'omega'])),
+    ('Vml', (VolumeLiquid, ['MW', 'Tb', 'Tc', 'Pc', 'Vc', 'Zc', 'omega', 'dipole'])),
+    ('Cpgm', (HeatCapacityGas, ['MW'])),
+    ('Cplm', (HeatCapacityLiquid, ['MW', 'Tc', 'omega'])),
+    ('Hvapm', (EnthalpyVaporization, ['Tb', 'Tc', 'Pc', 'omega'])),
+    ('sigma', (SurfaceTension, ['Tb', 'Tc', 'Pc', 'Vc', 'Zc', 'omega'])),
+    ('mul', (ViscosityLiquid, ['MW', 'Tm', 'Tc', 'Pc', 'Vc', 'omega'])),
+    ('kl', (ThermalConductivityLiquid, ['MW', 'Tm', 'Tb', 'Tc', 'Pc', 'omega'])),
+])
+'''Temperature-dependent properties exported by :obj:`curves_table`, with
+the class of the object calculating each and the constants it is created
+with.'''
+
+
+def _frame(source):
+    frame = source() if callable(source) else source
+    if frame.index.has_duplicates:  # pragma: no cover
+        # Lookups by CAS number find the first row
+        frame = frame[~frame.index.duplicated()]
+    return frame
+
+
+def all_CASRNs():
+    r'''Returns the CAS numbers of every chemical with at least one constant
+    in the property databanks (the identifiers databank is not included),
+    sorted.
+
+    Returns
+    -------
+    CASRNs : list[str]
+        CAS numbers
+
+    Examples
+    --------
+    >>> CASRNs = all_CASRNs()
+    >>> '7732-18-5' in CASRNs
+    True
+    '''
+    index = pd.Index([])
+    for name, sources in constant_sources.items():
+        for source in sources:
+            if not isinstance(source, str) and source[0] is not _pubchem:
+                index = index.union(_frame(source[0]).index)
+    # A few keys in the databanks are not valid CAS numbers
+    return sorted(str(CASRN) for CASRN in index if checkCAS(str(CASRN)))
+
+
+def constants_table(CASRNs=None, constants=None):
+    r'''Resolves constants for many chemicals at once, taking each from the
+    first of its :obj:`constant_sources` which has it. This gives the same
+    values as calling the function of each constant with only the CAS number,
+    where the function uses tabulated data, but for all chemicals together.
+
+    Parameters
+    ----------
+    CASRNs : list[str], optional
+        CAS numbers of the chemicals; all those of :obj:`all_CASRNs` if not
+        provided
+    constants : list[str], optional
+        Names of the constants, keys of :obj:`constant_sources`; all of them
+        if not provided
+
+    Returns
+    -------
+    df : DataFrame
+        Constants, indexed by CAS number; NaN where not available
+
+    Examples
+    --------
+    >>> constants_table(['7732-18-5', '64-17-5'], ['Tc', 'Pc', 'omega'])
+                   Tc          Pc  omega
+    7732-18-5  647.14  22048320.0  0.344
+    64-17-5    514.00   6137000.0  0.635
+    '''
+    CASRNs = pd.Index(all_CASRNs() if CASRNs is None else list(CASRNs))
+    if constants is None:
+        constants = list(constant_sources)
+    # Constants which others are taken from must be resolved too
+    needed, resolved = list(constants), OrderedDict()
+    for name in constant_sources:
+        if name in needed:
+            needed.extend(i for i in constant_sources[name] if isinstance(i, str))
+    for name in constant_sources:
+        if name not in needed:
+            continue
+        values = pd.Series(np.nan, index=CASRNs, dtype=object if name == 'formula' else float)
+        found = np.zeros(len(CASRNs), dtype=bool)
+        for source in constant_sources[name]:
+            if isinstance(source, str):
+                column = resolved[source]
+                present = column.notnull().values & (column.values != 0)
+            else:
+                frame = _frame(source[0])
+                column = frame[source[1]].reindex(CASRNs)
+                present = CASRNs.isin(frame.index)
+                if source[2]:
+                    present &= column.notnull().values
+            take = present & ~found
+            values[take] = column.values[take]
+            found |= take
+        resolved[name] = values
+    return pd.DataFrame(OrderedDict((name, resolved[name]) for name in constants), index=CASRNs)
+
+
+def _none_if_nan(value):
+    return None if value is None or value != value else value
+
+
+def curves_table(CASRNs, Ts, props=None, constants=None):
+    r'''Evaluates temperature-dependent properties of many chemicals over a
+    range of temperatures, without creating a full
+    :obj:`thermo.chemical.Chemical` for each. Each property object of
+    :obj:`curve_sources` is created with the constants from
+    :obj:`constants_table`, and evaluated at every temperature.
+
+    The points are evaluated one at a time with the property objects, so
+    that all of their methods (CoolProp, tabular data, estimation methods)
+    are considered as for a single chemical; the method of each point is
+    selected independently of the other points, so the values do not depend
+    on the order of `Ts`. For the correlations of the databanks alone,
+    :obj:`thermo.coefficients.evaluate_all` evaluates every chemical in one
+    array operation instead.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CAS numbers of the chemicals
+    Ts : list[float]
+        Temperatures at which to evaluate the properties, [K]
+    props : list[str], optional
+        Names of the properties, keys of :obj:`curve_sources`; all of them
+        if not provided
+    constants : DataFrame, optional
+        Constants of the chemicals as returned by :obj:`constants_table`, if
+        already available
+
+    Returns
+    -------
+    df : DataFrame
+        Properties, indexed by CAS number and temperature; NaN where they
+        could not be calculated
+
+    Examples
+    --------
+    >>> curves_table(['7732-18-5'], [300., 350.], ['Psat']) # doctest: +NORMALIZE_WHITESPACE
+                             Psat
+    CAS       T, K
+    7732-18-5 300.0   3533.918074
+              350.0  41619.816549
+    '''
+    CASRNs, Ts = list(CASRNs), [float(T) for T in Ts]
+    props = list(curve_sources) if props is None else list(props)
+    if constants is None:
+        constants = constants_table(CASRNs, sorted(set(i for prop in props for i in curve_sources[prop][1])))
+    values = np.full((len(CASRNs), len(Ts), len(props)), np.nan)
+    for i, CASRN in enumerate(CASRNs):
+        for k, prop in enumerate(props):
+            cls, names = curve_sources[prop]
+            kwargs = dict((name, _none_if_nan(constants.at[CASRN, name])) for name in names)
+            try:
+                obj = cls(CASRN=CASRN, **kwargs)
+            except:
+                continue
+            for j, T in enumerate(Ts):
+                try:
+                    value = obj.T_dependent_property_and_method(T)[0]
+                except:
+                    continue
+                if value is not None:
+                    values[i, j, k] = value
+    index = pd.MultiIndex.from_product([CASRNs, Ts], names=['CAS', 'T, K'])
+    return pd.DataFrame(values.reshape(len(CASRNs)*len(Ts), len(props)), index=index, columns=props)
+
+
+def _export(path, CASRNs, chunksize, table):
+    CASRNs = all_CASRNs() if CASRNs is None else list(CASRNs)
+    writer = TableWriter(path, index=True)
+    try:
+        for start in range(0, len(CASRNs), chunksize):
+            writer.write(table(CASRNs[start:start+chunksize]))
+    finally:
+        writer.close()
+    return len(CASRNs)
+
+
+def export_constants(path, CASRNs=None, constants=None, chunksize=5000):
+    r'''Writes the constants of many chemicals, as resolved by
+    :obj:`constants_table`, to a CSV or Parquet file (with the extension
+    .parquet; requires pyarrow), one chunk of chemicals at a time.
+
+    Parameters
+    ----------
+    path : str
+        File to write, or '-' for standard output
+    CASRNs : list[str], optional
+        CAS numbers of the chemicals; all those of :obj:`all_CASRNs` if not
+        provided
+    constants : list[str], optional
+        Names of the constants; all of :obj:`constant_sources` if not provided
+    chunksize : int, optional
+        Number of chemicals resolved and written at once
+
+    Returns
+    -------
+    count : int
+        Number of chemicals written
+    '''
+    return _export(path, CASRNs, chunksize,
+                   lambda chunk: constants_table(chunk, constants).rename_axis('CAS'))
+
+
+def export_curves(path, Ts, CASRNs=None, props=None, chunksize=100):
+    r'''Writes temperature-dependent properties of many chemicals, as
+    calculated by :obj:`curves_table`, to a CSV or Parquet file (with the
+    extension .parquet; requires pyarrow), one chunk of chemicals at a time.
+
+    Parameters
+    ----------
+    path : str
+        File to write, or '-' for standard output
+    Ts : list[float]
+        Temperatures at which to evaluate the properties, [K]
+    CASRNs : list[str], optional
+        CAS numbers of the chemicals; all those of :obj:`all_CASRNs` if not
+        provided
+    props : list[str], optional
+        Names of the properties; all of :obj:`curve_sources` if not provided
+    chunksize : int, optional
+        Number of chemicals evaluated and written at once
+
+    Returns
+    -------
+    count : int
+        Number of chemicals written
+    '''
+    return _export(path, CASRNs, chunksize,
+                   lambda chunk: curves_table(chunk, Ts, props))
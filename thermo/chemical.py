@@ -25,7 +25,7 @@ from thermo.identifiers import *
 from thermo.identifiers import _MixtureDict
 from thermo.vapor_pressure import VaporPressure
 from thermo.phase_change import Tb, Tm, Hfus, Hsub, Tliquidus, EnthalpyVaporization
-from thermo.activity import identify_phase, identify_phase_mixture, Pbubble_mixture, Pdew_mixture
+from thermo.activity import identify_phase, identify_phase_mixture, Pbubble_mixture, Pdew_mixture, bubble_at_P, dew_at_P, phase_envelope
 
 from thermo.critical import Tc, Pc, Vc, Zc, Tc_mixture, Pc_mixture, Vc_mixture
 from thermo.acentric import omega, omega_mixture, StielPolar
@@ -343,6 +343,21 @@ class Chemical(object): # pragma: no cover
         self.solubility_parameter_methods = solubility_parameter(T=self.T, Hvapm=self.HvapTbm, Vml=self.Vml_STP, AvailableMethods=True, CASRN=self.CAS)
         self.solubility_parameter_method = self.solubility_parameter_methods[0]
 
+        # The evaluations above select the methods a new object starts with
+        self._T_source_methods = [(obj, obj.method, getattr(obj, 'method_P', None))
+                                  for obj in self.__dict__.values() if isinstance(obj, TDependentProperty)]
+
+    def reset_T_methods(self):
+        r'''Restores the methods of the temperature-dependent property objects
+        to those they had when they were created. The objects keep using the
+        method they last used while it is valid, so properties calculated
+        after this are the same as those of a new object at the same
+        conditions.'''
+        for obj, method, method_P in self._T_source_methods:
+            obj.method = method
+            if hasattr(obj, 'method_P'):
+                obj.method_P = method_P
+
     def set_T(self, T=None):
         if T:
             self.T = T
@@ -625,6 +640,13 @@ class Mixture(object):  # pragma: no cover
         self.legal_statuses = [i.legal_status for i in self.Chemicals]
         self.economic_statuses = [i.economic_status for i in self.Chemicals]
 
+    def reset_T_methods(self):
+        r'''Restores the methods of the temperature-dependent property objects
+        of each component to those they had when they were created; see
+        :obj:`Chemical.reset_T_methods`.'''
+        for i in self.Chemicals:
+            i.reset_T_methods()
+
     def set_chemical_T(self):
         # Tempearture and Pressure Denepdence
         # Get and choose initial methods
@@ -718,7 +740,8 @@ class Mixture(object):  # pragma: no cover
 
     def set_T_sources(self):
         # Tempearture and Pressure Denepdence
-        # No vapor pressure (bubble-dew points)
+        # Vapor pressure objects are kept for bubble and dew point solvers
+        self.VaporPressures = [i.VaporPressure for i in self.Chemicals]
 
         self.Vl_methods = volume_liquid_mixture(xs=self.zs, ws=self.ws, Vms=self.Vmls, T=self.T, MWs=self.MWs, MW=self.MW, Tcs=self.Tcs, Pcs=self.Pcs, Vcs=self.Vcs, Zcs=self.Zcs, omegas=self.omegas, Tc=self.Tc, Pc=self.Pc, Vc=self.Vc, Zc=self.Zc, omega=self.omega, CASRNs=self.CASs, AvailableMethods=True)
         self.Vl_method = self.Vl_methods[0]
@@ -845,6 +868,15 @@ class Mixture(object):  # pragma: no cover
         if all(self.Hms):
             self.Hm = mixing_simple(self.Hms, self.ws)
 
+    def Tbubble(self, P=None, T_guess=None):
+        return bubble_at_P(P if P else self.P, self.zs, self.VaporPressures, T_guess=T_guess)
+
+    def Tdew(self, P=None, T_guess=None):
+        return dew_at_P(P if P else self.P, self.zs, self.VaporPressures, T_guess=T_guess)
+
+    def phase_envelope(self, Tmin=None, Tmax=None, Pmin=1E3):
+        return phase_envelope(self.zs, self.VaporPressures, Tmin=Tmin, Tmax=Tmax, Pmin=Pmin)
+
     def Reynolds(self, V=None, D=None):
         return Reynolds(V=V, D=D, rho=self.rho, mu=self.mu)
 
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Coefficients of the correlations of the databanks, held as arrays for all of
+the chemicals of each databank at once, so a correlation can be evaluated for
+every chemical (or any subset of them) in one array operation. This is meant
+for screening; for the properties of a single chemical, use the property
+objects such as :obj:`thermo.vapor_pressure.VaporPressure`, which also have
+the CoolProp, tabular, and estimation methods.
+
+>>> Psats = evaluate_all('Psat', 350.)
+>>> Psats.loc['7732-18-5', 'method']
+'Wagner Original (McGarry)'
+>>> Psats[Psats['Psat'] > 101325.].shape[0]
+116
+'''
+
+from __future__ import division
+
+__all__ = ['CoefficientSet', 'coefficient_sets', 'evaluate_all']
+
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from scipy.constants import R
+from thermo.vapor_pressure import (WagnerMcGarry, WagnerPoling, AntoineExtended,
+                                   AntoinePoling, Antoine, WAGNER_MCGARRY,
+                                   WAGNER_POLING, ANTOINE_EXTENDED_POLING,
+                                   ANTOINE_POLING)
+from thermo.heat_capacity import TRC_gas_data, Poling_data, TRCIG, POLING
+from thermo.volume import (Perry_l_data, COSTALD_data, COSTALD, Rackett,
+                           PERRYDIPPR, HTCOSTALDFIT, RACKETTFIT)
+from thermo.viscosity import (Dutt_Prasad, VN3_data, VN2_data, VN2E_data,
+                              ViswanathNatarajan3, ViswanathNatarajan2Exponential,
+                              DUTT_PRASAD, VISWANATH_NATARAJAN_3,
+                              VISWANATH_NATARAJAN_2, VISWANATH_NATARAJAN_2E)
+from thermo.dippr import EQ105
+from thermo.bulk import constants_table
+
+
+### Array versions of the correlations using math functions
+
+def _Wagner_original(T, Tc, Pc, a, b, c, d):
+    Tr = T/Tc
+    tau = 1.0 - Tr
+    return Pc*np.exp((a*tau + b*tau**1.5 + c*tau**3 + d*tau**6)/Tr)
+
+
+def _Wagner(T, Tc, Pc, a, b, c, d):
+    Tr = T/Tc
+    tau = 1.0 - Tr
+    return Pc*np.exp((a*tau + b*tau**1.5 + c*tau**2.5 + d*tau**5)/Tr)
+
+
+def _TRC_Antoine_extended(T, Tc, to, A, B, C, n, E, F):
+    x = np.maximum((T - to - 273.15)/Tc, 0.0)
+    return 10**(A - B/(T+C) + 0.43429*x**n + E*x**8 + F*x**12)
+
+
+def _TRCCp(T, a0, a1, a2, a3, a4, a5, a6, a7):
+    y = np.where(T <= a7, 0.0, (T - a7)/(T + a6))
+    return R*(a0 + (a1/T**2)*np.exp(-a2/T) + a3*y**2 + (a4 - a5/(T-a7)**2)*y**8)
+
+
+def _Poling(T, a0, a1, a2, a3, a4):
+    return R*(a0 + a1*T + a2*T**2 + a3*T**3 + a4*T**4)
+
+
+def _ViswanathNatarajan2(T, A, B):
+    return np.exp(A + B/T)/100.
+
+
+def _Perry_Vm(T, A, B, C, D):
+    return 1./EQ105(T, A, B, C, D)
+
+
+class CoefficientSet(object):
+    r'''Coefficients of one correlation for every chemical of a databank,
+    held as a two-dimensional array with one row per chemical, along with
+    the range of temperatures in which each chemical's coefficients are
+    valid.
+
+    Parameters
+    ----------
+    method : str
+        Name of the method, as used by the property objects
+    CASRNs : list[str]
+        CAS numbers of the chemicals, one per row of `coefficients`
+    coefficients : array-like
+        Coefficients of each chemical, in the order `function` takes them
+    Tmins : array-like
+        Minimum temperature at which each chemical's coefficients are valid;
+        NaN for no limit, [K]
+    Tmaxs : array-like
+        Maximum temperature at which each chemical's coefficients are valid;
+        NaN for no limit, [K]
+    function : callable
+        Correlation, called with an array of temperatures and an array for
+        each coefficient; it must work element-wise on arrays
+
+    Examples
+    --------
+    >>> Antoine_set = coefficient_sets['Psat'][ANTOINE_POLING]
+    >>> Antoine_set.evaluate(300., ['64-17-5', '71-43-2', 'notaCAS'])
+    array([ 8760.9371517 , 13809.15019709,            nan])
+    '''
+    def __init__(self, method, CASRNs, coefficients, Tmins, Tmaxs, function):
+        self.method = method
+        self.CASRNs = np.array(CASRNs, dtype=object)
+        self.coefficients = np.array(coefficients, dtype=float).reshape(len(self.CASRNs), -1)
+        self.Tmins = np.array(Tmins, dtype=float)
+        self.Tmaxs = np.array(Tmaxs, dtype=float)
+        self.function = function
+        self.index = {CASRN: i for i, CASRN in enumerate(self.CASRNs)}
+
+    @classmethod
+    def from_frame(cls, method, df, columns, Tmin, Tmax, function):
+        r'''Creates a set from a databank, whose index is the CAS numbers;
+        `Tmin` and `Tmax` are either column names or arrays of limits.'''
+        df = df[~df.index.duplicated()]
+        Tmins = df[Tmin].values if isinstance(Tmin, str) else Tmin
+        Tmaxs = df[Tmax].values if isinstance(Tmax, str) else Tmax
+        return cls(method, df.index, df[list(columns)].values, Tmins, Tmaxs, function)
+
+    def __len__(self):
+        return len(self.CASRNs)
+
+    def __contains__(self, CASRN):
+        return CASRN in self.index
+
+    def rows(self, CASRNs=None):
+        r'''Returns the rows of the chemicals, -1 for those not in the set;
+        all rows if `CASRNs` is None.'''
+        if CASRNs is None:
+            return np.arange(len(self.CASRNs))
+        index = self.index
+        return np.array([index.get(CASRN, -1) for CASRN in CASRNs], dtype=int)
+
+    def _select(self, T, CASRNs):
+        rows = self.rows(CASRNs)
+        missing = rows < 0
+        rows = np.where(missing, 0, rows)
+        T = np.asarray(T, dtype=float)
+        return T, rows, missing
+
+    def valid(self, T, CASRNs=None):
+        r'''Returns whether each chemical's coefficients are valid at `T`,
+        which may be a scalar or any array which broadcasts against the
+        chemicals; False for chemicals not in the set.'''
+        T, rows, missing = self._select(T, CASRNs)
+        Tmins, Tmaxs = self.Tmins[rows], self.Tmaxs[rows]
+        with np.errstate(invalid='ignore'):
+            return ~((T < Tmins) | (T > Tmaxs) | missing)
+
+    def evaluate(self, T, CASRNs=None, check_range=True):
+        r'''Evaluates the correlation for all of the chemicals of the set, or
+        for `CASRNs` only, in one array operation.
+
+        Parameters
+        ----------
+        T : float or array-like
+            Temperature, or temperatures broadcasting against the chemicals;
+            i.e. a column of temperatures gives one row of results per
+            temperature, [K]
+        CASRNs : list[str], optional
+            Chemicals to evaluate, in order; all of the set if not provided
+        check_range : bool, optional
+            Whether to give NaN outside each chemical's range of validity
+
+        Returns
+        -------
+        values : array
+            Values of the correlation; NaN for chemicals not in the set
+        '''
+        T, rows, missing = self._select(T, CASRNs)
+        coefficients = self.coefficients[rows].T
+        with np.errstate(all='ignore'):
+            values = self.function(T, *coefficients)
+            values = np.where(missing, np.nan, values)
+            if check_range:
+                values = np.where((T < self.Tmins[rows]) | (T > self.Tmaxs[rows]), np.nan, values)
+        return values
+
+
+def _COSTALD_Tcs(df):
+    # The fitted parameters are used with the critical constants of each
+    # chemical; they are valid below the critical temperature
+    constants = constants_table(list(df.index), ['Tc', 'Pc'])
+    return constants['Tc'].values, constants['Pc'].values
+
+
+def _load_coefficient_sets():
+    sets = OrderedDict()
+
+    WagnerPoling_Tmins = np.where(np.isnan(WagnerPoling['Tmin'].values),
+                                  0.1*WagnerPoling['Tmax'].values, WagnerPoling['Tmin'].values)
+    sets['Psat'] = [
+        CoefficientSet.from_frame(WAGNER_MCGARRY, WagnerMcGarry, ['Tc', 'Pc', 'A', 'B', 'C', 'D'],
+                                  'Tmin', 'Tc', _Wagner_original),
+        CoefficientSet.from_frame(WAGNER_POLING, WagnerPoling, ['Tc', 'Pc', 'A', 'B', 'C', 'D'],
+                                  WagnerPoling_Tmins, 'Tmax', _Wagner),
+        CoefficientSet.from_frame(ANTOINE_EXTENDED_POLING, AntoineExtended,
+                                  ['Tc', 'to', 'A', 'B', 'C', 'n', 'E', 'F'],
+                                  'Tmin', 'Tmax', _TRC_Antoine_extended),
+        CoefficientSet.from_frame(ANTOINE_POLING, AntoinePoling, ['A', 'B', 'C'],
+                                  'Tmin', 'Tmax', Antoine)]
+
+    Poling_Cp = Poling_data[Poling_data['a0'].notnull()]
+    sets['Cpgm'] = [
+        CoefficientSet.from_frame(TRCIG, TRC_gas_data, ['a0', 'a1', 'a2', 'a3', 'a4', 'a5', 'a6', 'a7'],
+                                  'Tmin', 'Tmax', _TRCCp),
+        CoefficientSet.from_frame(POLING, Poling_Cp, ['a0', 'a1', 'a2', 'a3', 'a4'],
+                                  'Tmin', 'Tmax', _Poling)]
+
+    COSTALD_fits = COSTALD_data[~COSTALD_data.index.duplicated()].copy()
+    COSTALD_fits['Tc'], COSTALD_fits['Pc'] = _COSTALD_Tcs(COSTALD_fits)
+    COSTALD_fits = COSTALD_fits[COSTALD_fits['Tc'].notnull()]
+    Rackett_fits = COSTALD_fits[COSTALD_fits['Pc'].notnull() & COSTALD_fits['Z_RA'].notnull()]
+    # The property objects consider these valid for T < Tc strictly
+    sets['Vml'] = [
+        CoefficientSet.from_frame(PERRYDIPPR, Perry_l_data, ['C1', 'C2', 'C3', 'C4'],
+                                  'Tmin', 'Tmax', _Perry_Vm),
+        CoefficientSet.from_frame(HTCOSTALDFIT, COSTALD_fits, ['Tc', 'Vchar', 'omega_SRK'],
+                                  np.zeros(len(COSTALD_fits)),
+                                  np.nextafter(COSTALD_fits['Tc'].values, 0), COSTALD),
+        CoefficientSet.from_frame(RACKETTFIT, Rackett_fits, ['Tc', 'Pc', 'Z_RA'],
+                                  np.zeros(len(Rackett_fits)),
+                                  np.nextafter(Rackett_fits['Tc'].values, 0), Rackett)]
+
+    sets['mul'] = [
+        CoefficientSet.from_frame(DUTT_PRASAD, Dutt_Prasad, ['A', 'B', 'C'],
+                                  'Tmin', 'Tmax', ViswanathNatarajan3),
+        CoefficientSet.from_frame(VISWANATH_NATARAJAN_3, VN3_data, ['A', 'B', 'C'],
+                                  'Tmin', 'Tmax', ViswanathNatarajan3),
+        CoefficientSet.from_frame(VISWANATH_NATARAJAN_2, VN2_data, ['A', 'B'],
+                                  'Tmin', 'Tmax', _ViswanathNatarajan2),
+        CoefficientSet.from_frame(VISWANATH_NATARAJAN_2E, VN2E_data, ['C', 'D'],
+                                  'Tmin', 'Tmax', ViswanathNatarajan2Exponential)]
+    return OrderedDict((prop, OrderedDict((s.method, s) for s in l)) for prop, l in sets.items())
+
+coefficient_sets = _load_coefficient_sets()
+'''dict: For each property ('Psat', 'Cpgm', 'Vml', 'mul'), an ordered dict of
+method name to :obj:`CoefficientSet`, in the order in which the property
+objects rank the methods.'''
+
+
+def evaluate_all(prop, T, CASRNs=None):
+    r'''Evaluates a property at one temperature for every chemical with
+    coefficients for it, or for `CASRNs` only, using the first method (in
+    the order the property objects rank them) whose coefficients are valid
+    at `T` for each chemical.
+
+    Only the coefficient-based methods of :obj:`coefficient_sets` are used;
+    the property objects may select a different method where they rank
+    CoolProp, tabular data, or an estimation method higher, or where a
+    chemical has none of the coefficients.
+
+    Parameters
+    ----------
+    prop : str
+        Property of :obj:`coefficient_sets`, i.e. 'Psat'
+    T : float
+        Temperature, [K]
+    CASRNs : list[str], optional
+        Chemicals to evaluate; all those with coefficients if not provided
+
+    Returns
+    -------
+    df : DataFrame
+        Indexed by CAS number, with the column `prop` of values (NaN where no
+        method is valid) and the column 'method' of the methods used
+
+    Examples
+    --------
+    >>> Psats = evaluate_all('Psat', 350., ['64-17-5', '71-43-2'])
+    >>> Psats['Psat'].round(1)
+    CAS
+    64-17-5    95723.2
+    71-43-2    91574.2
+    Name: Psat, dtype: float64
+    '''
+    sets = coefficient_sets[prop]
+    if CASRNs is None:
+        CASRNs = sorted(set().union(*(s.index for s in sets.values())))
+    CASRNs = list(CASRNs)
+    values = np.full(len(CASRNs), np.nan)
+    methods = np.full(len(CASRNs), None, dtype=object)
+    for method, coefficient_set in sets.items():
+        todo = np.isnan(values)
+        if not todo.any():
+            break
+        subset = [CASRN for CASRN, t in zip(CASRNs, todo) if t]
+        found = coefficient_set.evaluate(T, subset)
+        # A valid method giving NaN is skipped, as by the property objects
+        found_mask = ~np.isnan(found)
+        where = np.flatnonzero(todo)[found_mask]
+        values[where] = found[found_mask]
+        methods[where] = method
+    return pd.DataFrame({prop: values, 'method': methods}, index=pd.Index(CASRNs, name='CAS'))
@@ -21,6 +21,8 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 
 from __future__ import division
+import threading
+import numpy as np
 
 try:
     from CoolProp.CoolProp import PropsSI, PhaseSI
@@ -57,7 +59,7 @@ class CP_fluid(object):
     # Basic object to store constants for a coolprop fluid, much faster than
     # calling coolprop to retrieve the data when needed
     __slots__ = ['Tmin', 'Tmax', 'Pmax', 'has_melting_line', 'Tc', 'Pc', 'Tt',
-                 'omega', 'HEOS']
+                 'omega', 'HEOS', '_Tb']
 
     def __init__(self, Tmin, Tmax, Pmax, has_melting_line, Tc, Pc, Tt, omega,
                  HEOS):
@@ -70,6 +72,22 @@ class CP_fluid(object):
         self.Tt = Tt
         self.omega = omega
         self.HEOS = HEOS
+        self._Tb = None
+
+    @property
+    def Tb(self):
+        # Saturation temperature at 1 atm, or Tc for fluids whose critical
+        # pressure is under 1 atm. Calculated on first use only, as the
+        # saturation calculation would slow down importing the module.
+        # A new state is used, as `HEOS` belongs to the importing thread.
+        if self._Tb is None:
+            if self.Pc > 101325.:
+                state = AbstractState('HEOS', self.HEOS.name())
+                state.update(CP.PQ_INPUTS, 101325., 0.)
+                self._Tb = state.T()
+            else:
+                self._Tb = self.Tc
+        return self._Tb
 
 
 # Store the propoerties in a dict of CP_fluid instances
@@ -82,14 +100,388 @@ if has_CoolProp:
                        Tt=HEOS.Ttriple(), omega=HEOS.acentric_factor(), HEOS=HEOS)
 
 
-def CoolProp_T_dependent_property(T, CASRN, prop, phase):
+CoolProp_backends = ['HEOS', 'BICUBIC&HEOS', 'TTSE&HEOS']
+'''CoolProp backends which may be selected with :obj:`set_CoolProp_backend`:
+the full Helmholtz equations of state, or bicubic or TTSE interpolation in
+tables generated from them.'''
+CoolProp_backend = 'HEOS'
+'''Name of the CoolProp backend currently used for all property evaluations.'''
+
+# AbstractState objects hold the result of their last update, so each thread
+# has its own pool of them, and its own evaluation counts; the counts of all
+# threads are registered in _CP_stats to be summed by CoolProp_backend_info.
+_CP_local = threading.local()
+_CP_stats = []
+_CP_stats_lock = threading.Lock()
+_CP_output_keys = {}
+_CP_phase_names = {}
+if has_CoolProp:
+    for _name in ['liquid', 'supercritical', 'supercritical_gas',
+                  'supercritical_liquid', 'critical_point', 'gas', 'twophase',
+                  'unknown', 'not_imposed']:
+        _CP_phase_names[getattr(CP, 'iphase_' + _name)] = _name
+
+
+def _CoolProp_pool():
+    try:
+        return _CP_local.states, _CP_local.stats
+    except AttributeError:
+        states, stats = _CP_local.states, _CP_local.stats = {}, {'evaluations': {}, 'fallbacks': 0}
+        with _CP_stats_lock:
+            _CP_stats.append(stats)
+        return states, stats
+
+# The HEOS states created above are the pool of the importing thread
+for CASRN in coolprop_fluids:
+    _CoolProp_pool()[0][('HEOS', CASRN)] = coolprop_fluids[CASRN].HEOS
+
+
+def set_CoolProp_backend(backend='HEOS', tables_directory=None):
+    r'''Selects the CoolProp backend used by every CoolProp-based method in
+    the library. The tabular backends are 10-100 times faster than the full
+    equations of state, at a loss of accuracy, especially close to the
+    saturation line.
+
+    The states of the tabular backends are created lazily, the first time a
+    fluid is evaluated. CoolProp generates the tables for that fluid and
+    saves them on disk; later runs load them from there, which is much
+    faster than generating them again.
+
+    Evaluations which are outside the range of the tables are performed with
+    HEOS instead; see :obj:`CoolProp_backend_info`.
+
+    The backend of a single property object may be chosen instead by setting
+    its `CoolProp_backend` attribute, which overrides this selection; the
+    functions of this module also accept a `backend` argument.
+
+    Parameters
+    ----------
+    backend : str, optional
+        One of :obj:`CoolProp_backends`
+    tables_directory : str, optional
+        Directory in which CoolProp should store its tables; CoolProp's
+        default (~/.CoolProp) is used if not provided
+
+    Examples
+    --------
+    >>> set_CoolProp_backend('BICUBIC&HEOS')
+    >>> set_CoolProp_backend('HEOS')
+    '''
+    global CoolProp_backend
+    if backend not in CoolProp_backends:
+        raise Exception('Backend must be one of %s' %(CoolProp_backends))
+    if tables_directory is not None:
+        CP.set_config_string(CP.ALTERNATIVE_TABLES_DIRECTORY, tables_directory)
+    CoolProp_backend = backend
+
+
+def CoolProp_backend_info():
+    r'''Returns a summary of how CoolProp properties are being evaluated:
+    the selected backend, the backend of each fluid's state which has been
+    created by the calling thread, the number of property evaluations
+    performed with each backend, and the number of evaluations which fell
+    back to HEOS because they were outside the range of a tabular backend.
+    The counts are summed over all threads.
+
+    Returns
+    -------
+    info : dict
+        Keys 'backend', 'states', 'evaluations', and 'fallbacks'
+    '''
+    states = {}
+    for (backend, CASRN), state in _CoolProp_pool()[0].items():
+        states.setdefault(CASRN, []).append(state.backend_name())
+    evaluations, fallbacks = {}, 0
+    with _CP_stats_lock:
+        all_stats = list(_CP_stats)
+    for stats in all_stats:
+        for backend, count in list(stats['evaluations'].items()):
+            evaluations[backend] = evaluations.get(backend, 0) + count
+        fallbacks += stats['fallbacks']
+    return {'backend': CoolProp_backend, 'states': states,
+            'evaluations': evaluations, 'fallbacks': fallbacks}
+
+
+def CoolProp_state(CASRN, backend=None):
+    r'''Returns the pooled CoolProp `AbstractState` object used to evaluate
+    properties of a fluid with a backend. Reusing one state per fluid avoids
+    the string parsing and fluid lookup which every call to `PropsSI`
+    performs. States are created on first use; the HEOS states of the
+    importing thread are those of :obj:`coolprop_fluids`.
+
+    Each thread has its own pool, so the functions of this module may be
+    called from several threads at once. Within a thread, the returned state
+    is shared; callers must update it and read all the outputs they need
+    before any other evaluation for the same fluid.
+
+    Parameters
+    ----------
+    CASRN : str
+        CAS number of the fluid
+    backend : str, optional
+        Backend of the state; the one selected with
+        :obj:`set_CoolProp_backend` if not provided
+
+    Returns
+    -------
+    state : AbstractState
+        CoolProp state object for the fluid
+    '''
+    if not has_CoolProp:  # pragma: no cover
+        raise Exception('CoolProp library is not installed')
+    if backend is None:
+        backend = CoolProp_backend
+    if CASRN not in coolprop_fluids:
+        raise Exception('CASRN not in list of supported fluids')
+    states = _CoolProp_pool()[0]
+    try:
+        return states[(backend, CASRN)]
+    except KeyError:
+        state = states[(backend, CASRN)] = AbstractState(backend, CASRN)
+        return state
+
+
+def _CoolProp_output_key(prop):
+    try:
+        return _CP_output_keys[prop]
+    except KeyError:
+        key = _CP_output_keys[prop] = CP.get_parameter_index(prop)
+        return key
+
+
+def _CoolProp_update(CASRN, input_pair, value1, value2, backend=None):
+    # Updates and returns the pooled state of a backend, by default the
+    # selected one; points out of range of a tabular backend are evaluated
+    # with HEOS instead.
+    if backend is None:
+        backend = CoolProp_backend
+    stats = _CoolProp_pool()[1]
+    evaluations = stats['evaluations']
+    state = CoolProp_state(CASRN, backend)
+    try:
+        state.update(input_pair, value1, value2)
+    except ValueError:
+        if backend == 'HEOS':
+            raise
+        stats['fallbacks'] += 1
+        backend = 'HEOS'
+        state = CoolProp_state(CASRN, backend)
+        state.update(input_pair, value1, value2)
+    evaluations[backend] = evaluations.get(backend, 0) + 1
+    return state
+
+
+def _CoolProp_evaluate(CASRN, input_pair, value1, value2, props, saturated=None,
+                       backend=None):
+    # Common implementation of all evaluations through the pooled states.
+    # `props` is a CoolProp output string or a list of them; `saturated` is
+    # None for single-phase outputs, or 'l'/'g' for outputs of one of the
+    # phases after a two-phase update.
+    if backend is None:
+        backend = CoolProp_backend
+    single = not isinstance(props, (list, tuple))
+    keys = [_CoolProp_output_key(props)] if single else [_CoolProp_output_key(i) for i in props]
+
+    if not (hasattr(value1, '__len__') or hasattr(value2, '__len__')):
+        state = _CoolProp_update(CASRN, input_pair, value1, value2, backend)
+        if saturated is None:
+            output = state.keyed_output
+        elif saturated == 'l':
+            output = state.saturated_liquid_keyed_output
+        else:
+            output = state.saturated_vapor_keyed_output
+        if single:
+            return output(keys[0])
+        return [output(key) for key in keys]
+
+    value1, value2 = np.broadcast_arrays(np.asarray(value1, dtype=float),
+                                         np.asarray(value2, dtype=float))
+    values = np.empty((len(keys),) + value1.shape)
+    todo = np.ndindex(value1.shape)
+    if (backend != 'HEOS' and input_pair == CP.PT_INPUTS
+            and saturated is None):
+        # Tabular backends evaluate whole arrays in one call; points they
+        # cannot evaluate are done one at a time below
+        state = CoolProp_state(CASRN, backend)
+        flat = np.empty((value1.size, len(keys)))
+        status = np.empty(value1.size, dtype=np.int32)
+        state.fast_evaluate(input_pair, np.ascontiguousarray(value1.ravel()),
+                            np.ascontiguousarray(value2.ravel()),
+                            np.array([int(key) for key in keys], dtype=np.int32),
+                            flat, status)
+        values[...] = flat.T.reshape(values.shape)
+        evaluations = _CoolProp_pool()[1]['evaluations']
+        evaluations[backend] = evaluations.get(backend, 0) + int((status == 0).sum())
+        todo = [np.unravel_index(i, value1.shape) for i in np.flatnonzero(status)]
+    for index in todo:
+        state = _CoolProp_update(CASRN, input_pair, value1[index], value2[index], backend)
+        if saturated is None:
+            output = state.keyed_output
+        elif saturated == 'l':
+            output = state.saturated_liquid_keyed_output
+        else:
+            output = state.saturated_vapor_keyed_output
+        for i, key in enumerate(keys):
+            values[(i,) + index] = output(key)
+    if single:
+        return values[0]
+    return list(values)
+
+
+def CoolProp_TP(T, P, CASRN, props, backend=None):
+    r'''Calculates one or more properties of a fluid at a specified
+    temperature and pressure with CoolProp, using the fluid's pooled
+    `AbstractState`. All requested outputs are read from a single state
+    update. `T` and `P` may be arrays, in which case arrays are returned.
+
+    Parameters
+    ----------
+    T : float or array-like
+        Temperature of the fluid [K]
+    P : float or array-like
+        Pressure of the fluid [Pa]
+    CASRN : str
+        CAS number of the fluid
+    props : str or list[str]
+        CoolProp string shortcut(s) for the desired properties
+    backend : str, optional
+        CoolProp backend to use; the one selected with
+        :obj:`set_CoolProp_backend` if not provided
+
+    Returns
+    -------
+    values : float or ndarray or list
+        Desired properties, in the order requested, [units]
+
+    Examples
+    --------
+    >>> CoolProp_TP(298.15, 101325., '7732-18-5', ['DMOLAR', 'V'])
+    [55344.59086372442, 0.0008900224890776964]
+    '''
+    return _CoolProp_evaluate(CASRN, CP.PT_INPUTS, P, T, props, backend=backend)
+
+
+def CoolProp_TQ(T, Q, CASRN, props, backend=None):
+    r'''Calculates one or more properties of a fluid on its saturation line
+    at a specified temperature and vapor quality with CoolProp, using the
+    fluid's pooled `AbstractState`. All requested outputs are read from a
+    single state update. `T` and `Q` may be arrays.
+
+    Parameters
+    ----------
+    T : float or array-like
+        Temperature of the fluid [K]
+    Q : float or array-like
+        Vapor quality (0 for saturated liquid, 1 for saturated vapor) [-]
+    CASRN : str
+        CAS number of the fluid
+    props : str or list[str]
+        CoolProp string shortcut(s) for the desired properties
+    backend : str, optional
+        CoolProp backend to use; the one selected with
+        :obj:`set_CoolProp_backend` if not provided
+
+    Returns
+    -------
+    values : float or ndarray or list
+        Desired properties, in the order requested, [units]
+
+    Examples
+    --------
+    >>> CoolProp_TQ(298.15, 0, '7732-18-5', 'P')
+    3169.9293389430873
+    '''
+    return _CoolProp_evaluate(CASRN, CP.QT_INPUTS, Q, T, props, backend=backend)
+
+
+def CoolProp_saturation(T, CASRN, props, backend=None):
+    r'''Calculates one or more properties of both the saturated liquid and
+    the saturated vapor of a fluid at a specified temperature, from a single
+    saturation calculation with the fluid's pooled `AbstractState`.
+
+    Parameters
+    ----------
+    T : float or array-like
+        Temperature of the fluid [K]
+    CASRN : str
+        CAS number of the fluid
+    props : str or list[str]
+        CoolProp string shortcut(s) for the desired properties
+    backend : str, optional
+        CoolProp backend to use; the one selected with
+        :obj:`set_CoolProp_backend` if not provided
+
+    Returns
+    -------
+    liquid_values : float or ndarray or list
+        Desired properties of the saturated liquid, [units]
+    gas_values : float or ndarray or list
+        Desired properties of the saturated vapor, [units]
+
+    Examples
+    --------
+    >>> CoolProp_saturation(298.15, '7732-18-5', 'HMOLAR')
+    (1888.526534081881, 45875.977194348096)
+    '''
+    if hasattr(T, '__len__'):
+        # Array updates overwrite the state, so each phase needs its own pass
+        return (_CoolProp_evaluate(CASRN, CP.QT_INPUTS, 0., T, props, saturated='l', backend=backend),
+                _CoolProp_evaluate(CASRN, CP.QT_INPUTS, 0., T, props, saturated='g', backend=backend))
+    state = _CoolProp_update(CASRN, CP.QT_INPUTS, 0., T, backend)
+    if isinstance(props, (list, tuple)):
+        keys = [_CoolProp_output_key(i) for i in props]
+        return ([state.saturated_liquid_keyed_output(key) for key in keys],
+                [state.saturated_vapor_keyed_output(key) for key in keys])
+    key = _CoolProp_output_key(props)
+    return state.saturated_liquid_keyed_output(key), state.saturated_vapor_keyed_output(key)
+
+
+def CoolProp_phase(T, P, CASRN, backend=None):
+    r'''Determines the phase of a fluid at a specified temperature and
+    pressure with the fluid's pooled `AbstractState`. Returns the same
+    strings as CoolProp's `PhaseSI` function.
+
+    Parameters
+    ----------
+    T : float
+        Temperature of the fluid [K]
+    P : float
+        Pressure of the fluid [Pa]
+    CASRN : str
+        CAS number of the fluid
+    backend : str, optional
+        CoolProp backend to use; the one selected with
+        :obj:`set_CoolProp_backend` if not provided
+
+    Returns
+    -------
+    phase : str
+        One of 'liquid', 'gas', 'twophase', 'supercritical',
+        'supercritical_gas', 'supercritical_liquid', 'critical_point',
+        'unknown', or 'not_imposed'; 'unknown' also if CoolProp cannot
+        evaluate the state
+
+    Examples
+    --------
+    >>> CoolProp_phase(298.15, 101325., '7732-18-5')
+    'liquid'
+    '''
+    try:
+        state = _CoolProp_update(CASRN, CP.PT_INPUTS, P, T, backend)
+    except ValueError:
+        # `PhaseSI` does not raise for states CoolProp cannot evaluate
+        return 'unknown'
+    return _CP_phase_names[state.phase()]
+
+
+def CoolProp_T_dependent_property(T, CASRN, prop, phase, backend=None):
     r'''Calculates a property of a chemical in either the liquid or gas phase
     as a function of temperature only. This means that the property is
     either at 1 atm or along the saturation curve.
 
     Parameters
     ----------
-        T : float
+        T : float or array-like
             Temperature of the fluid [K]
         CASRN : str
             CAS number of the fluid
@@ -97,10 +489,13 @@ def CoolProp_T_dependent_property(T, CASRN, prop, phase):
             CoolProp string shortcut for desired property
         phase : str
             Either 'l' or 'g' for liquid or gas properties respectively
+        backend : str, optional
+            CoolProp backend to use; the one selected with
+            :obj:`set_CoolProp_backend` if not provided
 
     Returns
     -------
-        prop : float
+        prop : float or ndarray
             Desired chemical property, [units]
 
     Notes
@@ -110,6 +505,9 @@ def CoolProp_T_dependent_property(T, CASRN, prop, phase):
     property is calculated at 1 atm.
 
     No liquid calculations are permitted above the critical temperature.
+    The boiling point is calculated once per fluid and stored in its
+    `CP_fluid` object, so choosing between the two cases is a comparison of
+    temperatures. Arrays of temperatures are split between them with masks.
 
     For gases under the chemical's boiling point, the gas property is found
     on the saturation line (at sub-atmospheric pressures). Above the boiling
@@ -140,22 +538,30 @@ def CoolProp_T_dependent_property(T, CASRN, prop, phase):
         raise Exception('CoolProp library is not installed')
     if CASRN not in coolprop_dict:
         raise Exception('CASRN not in list of supported fluids')
-    Tc = coolprop_fluids[CASRN].Tc
+    if phase not in ('l', 'g'):
+        raise Exception('Error in CoolProp property function')
+    fluid = coolprop_fluids[CASRN]
+    Tc, Tb = fluid.Tc, fluid.Tb
+    if hasattr(T, '__len__'):
+        T = np.asarray(T, dtype=float)
+        if phase == 'l' and np.any(T > Tc):
+            raise Exception('For liquid properties, must be under the critical temperature.')
+        # Liquids under and gases over the boiling point are at 1 atm
+        at_1_atm = T < Tb if phase == 'l' else T > Tb
+        values = np.empty(T.shape)
+        if at_1_atm.any():
+            values[at_1_atm] = CoolProp_TP(T[at_1_atm], 101325., CASRN, prop, backend)
+        if not at_1_atm.all():
+            saturated = ~at_1_atm
+            values[saturated] = CoolProp_TQ(T[saturated], 0. if phase == 'l' else 1., CASRN, prop, backend)
+        return values
     if phase == 'l':
         if T > Tc:
             raise Exception('For liquid properties, must be under the critical temperature.')
-        if PhaseSI('T', T, 'P', 101325, CASRN) in [u'liquid', u'supercritical_liquid']:
-            return PropsSI(prop, 'T', T, 'P', 101325, CASRN)
-        else:
-            return PropsSI(prop, 'T', T, 'Q', 0, CASRN)
-    elif phase == 'g':
-        if PhaseSI('T', T, 'P', 101325, CASRN) == 'gas':
-            return PropsSI(prop, 'T', T, 'P', 101325, CASRN)
-        else:
-            if T < Tc:
-                return PropsSI(prop, 'T', T, 'Q', 1, CASRN)
-            else:
-                # catch supercritical_gas and friends
-                return PropsSI(prop, 'T', T, 'P', 101325, CASRN)
+        if T < Tb:
+            return CoolProp_TP(T, 101325., CASRN, prop, backend)
+        return CoolProp_TQ(T, 0., CASRN, prop, backend)
     else:
-        raise Exception('Error in CoolProp property function')
+        if T > Tb:
+            return CoolProp_TP(T, 101325., CASRN, prop, backend)
+        return CoolProp_TQ(T, 1., CASRN, prop, backend)
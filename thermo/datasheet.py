@@ -27,132 +27,98 @@ import pandas as pd
 from thermo.chemical import Chemical
 
 
+def _chemicals(chemical):
+    # A single chemical or a list of them, as identifiers or Chemical objects;
+    # objects which are provided are used as they are rather than recreated
+    single = isinstance(chemical, (str, Chemical))
+    chemicals = [chemical] if single else list(chemical)
+    return single, [i if isinstance(i, Chemical) else Chemical(i) for i in chemicals]
+
+
+def _tabulate(chemical, Tmin, Tmax, pts, columns, T_range):
+    # Evaluates the attributes in `columns` with one Chemical object per
+    # chemical, changing only its temperature between points. A list of
+    # chemicals gives one DataFrame, indexed by chemical name and temperature.
+    single, chemicals = _chemicals(chemical)
+    attrs = list(columns.values())
+    dfs = []
+    for chem in chemicals:
+        Tmin_default, Tmax_default = T_range(chem)
+        Ts = np.linspace(Tmin if Tmin else Tmin_default,
+                         Tmax if Tmax else Tmax_default, pts)
+        T_original = chem.T
+        # The property objects keep the method they last used; resetting them
+        # before each point gives the same results as a new Chemical at it
+        rows = []
+        for T in Ts:
+            chem.reset_T_methods()
+            chem.set_T(T)
+            rows.append([getattr(chem, attr) for attr in attrs])
+        chem.reset_T_methods()
+        chem.set_T(T_original)
+
+        df = pd.DataFrame(rows, index=Ts, columns=list(columns))
+        df.index.name = 'T, K'
+        dfs.append(df)
+    if single:
+        return dfs[0]
+    return pd.concat(dfs, keys=[chem.name for chem in chemicals],
+                     names=['Chemical', 'T, K'])
+
+
+def _T_range_solid(chem):
+    if chem.Tm:
+        return chem.Tm-100, chem.Tm
+    return 150., 350  # pragma: no cover
+
+
+def _T_range_fluid(chem):
+    Tmin = chem.Tm if chem.Tm else 273.15
+    Tmax = chem.Tc if chem.Tc else 450
+    return Tmin, Tmax
+
+
+_solid_columns = OrderedDict([
+    ('Density, kg/m^3', 'rhos'),
+    ('Constant-pressure heat capacity, J/kg/K', 'Cps')])
+
+_liquid_columns = OrderedDict([
+    ('Saturation pressure, Pa', 'Psat'),
+    ('Density, kg/m^3', 'rhol'),
+    ('Constant-pressure heat capacity, J/kg/K', 'Cpl'),
+    ('Heat of vaporization, J/kg', 'Hvap'),
+    ('Viscosity, Pa*S', 'mul'),
+    ('Thermal consuctivity, W/m/K', 'kl'),
+    ('Surface tension, N/m', 'sigma'),
+    ('Prandtl number', 'Prl'),
+    ('Thermal diffusivity, m^2/s', 'alphal'),
+    ('Isobaric expansion, 1/K', 'isobaric_expansion_l'),
+    ('Joule-Thompson expansion coefficient, K/Pa', 'JTg'),
+    ('Permittivity', 'permittivity')])
+
+_gas_columns = OrderedDict([
+    ('Density, kg/m^3', 'rhog'),
+    ('Constant-pressure heat capacity, J/kg/K', 'Cpg'),
+    ('Constant-volume heat capacity, J/kg/K', 'Cvg'),
+    ('Viscosity, Pa*S', 'mug'),
+    ('Thermal consuctivity, W/m/K', 'kg'),
+    ('Prandtl number', 'Prg'),
+    ('Thermal diffusivity, m^2/s', 'alphag'),
+    ('Isobaric expansion, 1/K', 'isobaric_expansion_g'),
+    ('Isentropic exponent', 'isentropic_exponent'),
+    ('Joule-Thompson expansion coefficient, K/Pa', 'JTg')])
+
+
 def tabulate_solid(chemical, Tmin=None, Tmax=None, pts=10):
-    chem = Chemical(chemical)
-
-    (rhos, Cps) = [[] for i in range(2)]
-    if not Tmin:  # pragma: no cover
-        if chem.Tm:
-            Tmin = chem.Tm-100
-        else:
-            Tmin = 150.
-    if not Tmax:  # pragma: no cover
-        if chem.Tm:
-            Tmax = chem.Tm
-        else:
-            Tmax = 350
-
-    Ts = np.linspace(Tmin, Tmax, pts)
-    for T in Ts:
-        chem = Chemical(chemical, T=T)
-        rhos.append(chem.rhos)
-        Cps.append(chem.Cps)
-
-    data = OrderedDict()
-    data['Density, kg/m^3'] = rhos
-    data['Constant-pressure heat capacity, J/kg/K'] = Cps
-
-    df = pd.DataFrame(data, index=Ts)
-    df.index.name = 'T, K'
-    return df
+    return _tabulate(chemical, Tmin, Tmax, pts, _solid_columns, _T_range_solid)
 
 
 def tabulate_liq(chemical, Tmin=None, Tmax=None, pts=10):
-    chem = Chemical(chemical)
-
-    (rhos, Cps, mugs, kgs, Prs, alphas, isobarics, JTs, Psats, sigmas, Hvaps,
-     permittivities) = [[] for i in range(12)]
-    if not Tmin:  # pragma: no cover
-        if chem.Tm:
-            Tmin = chem.Tm
-        else:
-            Tmin = 273.15
-    if not Tmax:  # pragma: no cover
-        if chem.Tc:
-            Tmax = chem.Tc
-        else:
-            Tmax = 450
-
-    Ts = np.linspace(Tmin, Tmax, pts)
-    for T in Ts:
-        chem = Chemical(chemical, T=T)
-
-        rhos.append(chem.rhol)
-        Cps.append(chem.Cpl)
-        mugs.append(chem.mul)
-        kgs.append(chem.kl)
-        Prs.append(chem.Prl)
-        alphas.append(chem.alphal)
-        isobarics.append(chem.isobaric_expansion_l)
-        JTs.append(chem.JTg)
-        Psats.append(chem.Psat)
-        Hvaps.append(chem.Hvap)
-        sigmas.append(chem.sigma)
-        permittivities.append(chem.permittivity)
-
-    data = OrderedDict()
-    data['Saturation pressure, Pa'] = Psats
-    data['Density, kg/m^3'] = rhos
-    data['Constant-pressure heat capacity, J/kg/K'] = Cps
-    data['Heat of vaporization, J/kg'] = Hvaps
-    data['Viscosity, Pa*S'] = mugs
-    data['Thermal consuctivity, W/m/K'] = kgs
-    data['Surface tension, N/m'] = sigmas
-    data['Prandtl number'] = Prs
-    data['Thermal diffusivity, m^2/s'] = alphas
-    data['Isobaric expansion, 1/K'] = isobarics
-    data['Joule-Thompson expansion coefficient, K/Pa'] = JTs
-    data['Permittivity'] = permittivities
-
-    df = pd.DataFrame(data, index=Ts)
-    df.index.name = 'T, K'
-    return df
+    return _tabulate(chemical, Tmin, Tmax, pts, _liquid_columns, _T_range_fluid)
 
 
 def tabulate_gas(chemical, Tmin=None, Tmax=None, pts=10):
-    chem = Chemical(chemical)
-
-    (rhos, Cps, Cvs, mugs, kgs, Prs, alphas, isobarics, isentropics, JTs) = [[] for i in range(10)]
-    if not Tmin:  # pragma: no cover
-        if chem.Tm:
-            Tmin = chem.Tm
-        else:
-            Tmin = 273.15
-    if not Tmax:  # pragma: no cover
-        if chem.Tc:
-            Tmax = chem.Tc
-        else:
-            Tmax = 450
-
-    Ts = np.linspace(Tmin, Tmax, pts)
-    for T in Ts:
-        chem = Chemical(chemical, T=T)
-
-        rhos.append(chem.rhog)
-        Cps.append(chem.Cpg)
-        Cvs.append(chem.Cvg)
-        mugs.append(chem.mug)
-        kgs.append(chem.kg)
-        Prs.append(chem.Prg)
-        alphas.append(chem.alphag)
-        isobarics.append(chem.isobaric_expansion_g)
-        isentropics.append(chem.isentropic_exponent)
-        JTs.append(chem.JTg)
-    data = OrderedDict()
-    data['Density, kg/m^3'] = rhos
-    data['Constant-pressure heat capacity, J/kg/K'] = Cps
-    data['Constant-volume heat capacity, J/kg/K'] = Cvs
-    data['Viscosity, Pa*S'] = mugs
-    data['Thermal consuctivity, W/m/K'] = kgs
-    data['Prandtl number'] = Prs
-    data['Thermal diffusivity, m^2/s'] = alphas
-    data['Isobaric expansion, 1/K'] = isobarics
-    data['Isentropic exponent'] = isentropics
-    data['Joule-Thompson expansion coefficient, K/Pa'] = JTs
-
-    df = pd.DataFrame(data, index=Ts)  # add orient='index'
-    df.index.name = 'T, K'
-    return df
+    return _tabulate(chemical, Tmin, Tmax, pts, _gas_columns, _T_range_fluid)
 
 
 def tabulate_constants(chemical, full=False, vertical=False):
@@ -161,13 +127,7 @@ def tabulate_constants(chemical, full=False, vertical=False):
 
     all_chemicals = OrderedDict()
 
-    if isinstance(chemical, str):
-        cs = [chemical]
-    else:
-        cs = chemical
-
-    for chemical in cs:
-        chem = Chemical(chemical)
+    for chem in _chemicals(chemical)[1]:
         data = OrderedDict()
         data['CAS'] = chem.CAS
         data['Formula'] = chem.formula
@@ -25,7 +25,8 @@ import os
 from math import exp, log10
 from scipy.constants import e, N_A
 from thermo.utils import to_num
-from scipy.interpolate import interp1d
+import numpy as np
+from scipy.interpolate import interp1d, make_interp_spline
 import pandas as pd
 
 
@@ -345,6 +346,16 @@ def Laliberte_density(T, ws, CASRNs):
 
 ### Laliberty Heat Capacity Functions
 
+_Laliberte_Cp_w_ts = [-15, -10, -5, 0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 80, 85, 90, 95, 100, 105, 110, 115, 120, 125, 130, 135, 140]
+_Laliberte_Cp_ws = [4294.03, 4256.88, 4233.58, 4219.44, 4204.95, 4195.45, 4189.1, 4184.8, 4181.9, 4180.02, 4178.95, 4178.86, 4178.77, 4179.56, 4180.89, 4182.77, 4185.17, 4188.1, 4191.55, 4195.52, 4200.01, 4205.02, 4210.57, 4216.64, 4223.23, 4230.36, 4238.07, 4246.37, 4255.28, 4264.84, 4275.08, 4286.04]
+_Laliberte_Cp_w_interp = interp1d(_Laliberte_Cp_w_ts, _Laliberte_Cp_ws, kind='cubic')
+# The same spline as interp1d's, for arrays and derivatives
+_Laliberte_Cp_w_spline = make_interp_spline(_Laliberte_Cp_w_ts, _Laliberte_Cp_ws, k=3)
+_Laliberte_dCp_w_dt_spline = _Laliberte_Cp_w_spline.derivative()
+_Laliberte_Cp_w_integral = _Laliberte_Cp_w_spline.antiderivative()
+# Gauss-Legendre quadrature for the enthalpy of solutes
+_Laliberte_nodes, _Laliberte_weights = np.polynomial.legendre.leggauss(20)
+
 
 def Laliberte_heat_capacity_w(T):
     r'''Calculate the heat capacity of water using the interpolation proposed by [1]_.
@@ -385,10 +396,7 @@ def Laliberte_heat_capacity_w(T):
        doi:10.1021/je8008123
     '''
     t = T-273.15
-    T_array = [-15, -10, -5, 0, 5, 10, 15, 20, 25, 30, 35, 40, 45, 50, 55, 60, 65, 70, 75, 80, 85, 90, 95, 100, 105, 110, 115, 120, 125, 130, 135, 140]
-    Cp_array = [4294.03, 4256.88, 4233.58, 4219.44, 4204.95, 4195.45, 4189.1, 4184.8, 4181.9, 4180.02, 4178.95, 4178.86, 4178.77, 4179.56, 4180.89, 4182.77, 4185.17, 4188.1, 4191.55, 4195.52, 4200.01, 4205.02, 4210.57, 4216.64, 4223.23, 4230.36, 4238.07, 4246.37, 4255.28, 4264.84, 4275.08, 4286.04]
-    interp = interp1d(T_array, Cp_array, kind='cubic')
-    Cp = float(interp(t))
+    Cp = float(_Laliberte_Cp_w_interp(t))
     return Cp
 
 
@@ -488,6 +496,369 @@ def Laliberte_heat_capacity(T, ws, CASRNs):
         Cp = Cp + ws[i]*Cp_i
     return Cp
 
+class LaliberteSolution(object):
+    r'''Aqueous solution of a set of electrolytes, for evaluating the density,
+    viscosity and heat capacity models of [1]_ with arrays. The parameters
+    of each solute are looked up once, and every property is evaluated for
+    arrays of temperatures and mass fractions at once, along with its
+    analytical derivative with respect to temperature.
+
+    The results match those of :obj:`Laliberte_density`,
+    :obj:`Laliberte_viscosity` and :obj:`Laliberte_heat_capacity`. The
+    inverse problems of the mass fraction of solutes giving a density, and
+    the temperature giving an enthalpy, are solved by
+    :obj:`mass_fraction_from_density` and :obj:`T_from_enthalpy`.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CAS numbers of the solutes
+
+    Attributes
+    ----------
+    density_coeffs : ndarray or None
+        Parameters `c0` to `c4` of each solute, one row each; None if any
+        solute has no density parameters
+    viscosity_coeffs : ndarray or None
+        Parameters `v1` to `v6` of each solute, as `density_coeffs`
+    heat_capacity_coeffs : ndarray or None
+        Parameters `a1` to `a6` of each solute, as `density_coeffs`
+    density_wMax : ndarray or None
+        Largest mass fraction of each solute in the data its density
+        parameters were fit to, as `density_coeffs`
+
+    Notes
+    -----
+    Every method takes temperatures `T` of any shape, and mass fractions
+    `ws` of the solutes along their last axis, with one column per solute;
+    the two are broadcast against each other, and a result has their
+    broadcast shape without that last axis. The heat capacity of water is
+    only tabulated from -15 to 140 degrees Celsius; it is NaN outside that
+    range. Temperature and concentration range checks are not performed.
+
+    Examples
+    --------
+    Density of brines of NaCl and KCl, at two temperatures each:
+
+    >>> brine = LaliberteSolution(['7647-14-5', '7447-40-7'])
+    >>> brine.density([[298.15], [323.15]], [[0.05, 0.02], [0.1, 0.]])
+    array([[1045.38412858, 1068.90981016],
+           [1034.9116123 , 1057.59073164]])
+    >>> brine.density(273.15, [0.0037838838, 0.])
+    1002.6250120185854
+
+    References
+    ----------
+    .. [1] Laliberte, Marc. "A Model for Calculating the Heat Capacity of
+       Aqueous Solutions, with Updated Density and Viscosity Data." Journal of
+       Chemical & Engineering Data 54, no. 6 (June 11, 2009): 1725-60.
+       doi:10.1021/je8008123
+    '''
+    def __init__(self, CASRNs):
+        self.CASRNs = list(CASRNs)
+        for CASRN in self.CASRNs:
+            if (CASRN not in _Laliberte_Density_ParametersDict
+                    and CASRN not in _Laliberte_Viscosity_ParametersDict
+                    and CASRN not in _Laliberte_Heat_Capacity_ParametersDict):
+                raise Exception('%s has no Laliberte parameters' %CASRN)
+        self.density_coeffs = self._coeffs(_Laliberte_Density_ParametersDict, ["C0", "C1", "C2", "C3", "C4"])
+        self.viscosity_coeffs = self._coeffs(_Laliberte_Viscosity_ParametersDict, ["V1", "V2", "V3", "V4", "V5", "V6"])
+        self.heat_capacity_coeffs = self._coeffs(_Laliberte_Heat_Capacity_ParametersDict, ["A1", "A2", "A3", "A4", "A5", "A6"])
+        self.density_wMax = self._coeffs(_Laliberte_Density_ParametersDict, ["wMax"])
+        # Solutions of the last inverse calculations, as initial guesses
+        self._last = {}
+
+    def _coeffs(self, parameters, keys):
+        try:
+            return np.array([[parameters[CASRN][key] for key in keys] for CASRN in self.CASRNs], dtype=float).reshape(-1, len(keys))
+        except KeyError:
+            return None
+
+    def _inputs(self, T, ws, coeffs, name):
+        if coeffs is None:
+            raise Exception('Laliberte %s parameters are not available for all solutes' %name)
+        ws = np.asarray(ws, dtype=float)
+        if ws.shape[-1:] != (len(self.CASRNs),):
+            raise Exception('Mass fractions must have one column per solute')
+        t = np.asarray(T, dtype=float) - 273.15
+        w_w = 1 - ws.sum(axis=-1)
+        # Each parameter as an array along the last axis, like the solutes
+        return t, ws, w_w, t[..., None], (1 - w_w)[..., None], coeffs.T
+
+    def _result(self, value):
+        return value if np.ndim(value) else float(value)
+
+    def density(self, T, ws):
+        r'''Calculates the density of the solution, [kg/m^3].'''
+        t, ws, w_w, ti, s, (c0, c1, c2, c3, c4) = self._inputs(T, ws, self.density_coeffs, 'density')
+        rho_w = Laliberte_density_w(t + 273.15)
+        rho_i = ((c0*s + c1)*np.exp(1E-6*(ti + c4)**2))/(s + c2 + c3*ti)
+        return self._result(1./(w_w/rho_w + (ws/rho_i).sum(axis=-1)))
+
+    def ddensity_dT(self, T, ws):
+        r'''Calculates the derivative of the density of the solution with
+        respect to temperature, [kg/m^3/K].'''
+        t, ws, w_w, ti, s, (c0, c1, c2, c3, c4) = self._inputs(T, ws, self.density_coeffs, 'density')
+        rho_w = Laliberte_density_w(t + 273.15)
+        num = ((((-2.8054253E-10*5*t + 1.0556302E-7*4)*t - 4.6170461E-5*3)*t - 0.0079870401*2)*t + 16.945176)
+        den = 1 + 0.01687985*t
+        drho_w = (num - rho_w*0.01687985)/den
+        rho_i = ((c0*s + c1)*np.exp(1E-6*(ti + c4)**2))/(s + c2 + c3*ti)
+        drho_i = rho_i*(2E-6*(ti + c4) - c3/(s + c2 + c3*ti))
+        rho = 1./(w_w/rho_w + (ws/rho_i).sum(axis=-1))
+        return self._result(rho*rho*(w_w*drho_w/(rho_w*rho_w) + (ws*drho_i/(rho_i*rho_i)).sum(axis=-1)))
+
+    def viscosity(self, T, ws):
+        r'''Calculates the viscosity of the solution, [Pa*s].'''
+        t, ws, w_w, ti, s, (v1, v2, v3, v4, v5, v6) = self._inputs(T, ws, self.viscosity_coeffs, 'viscosity')
+        mu_w = Laliberte_viscosity_w(t + 273.15)*1000.
+        mu_i = np.exp((v1*s**v2 + v3)/(v4*ti + 1))/(v5*s**v6 + 1)
+        return self._result(mu_w**w_w*(mu_i**ws).prod(axis=-1)/1000.)
+
+    def dviscosity_dT(self, T, ws):
+        r'''Calculates the derivative of the viscosity of the solution with
+        respect to temperature, [Pa*s/K].'''
+        t, ws, w_w, ti, s, (v1, v2, v3, v4, v5, v6) = self._inputs(T, ws, self.viscosity_coeffs, 'viscosity')
+        den = (0.05594*t + 5.2842)*t + 137.37
+        mu_w = (t + 246)/den
+        dlnmu_w = 1./(t + 246) - (2*0.05594*t + 5.2842)/den
+        X = v1*s**v2 + v3
+        mu_i = np.exp(X/(v4*ti + 1))/(v5*s**v6 + 1)
+        dlnmu_i = -X*v4/(v4*ti + 1)**2
+        mu = mu_w**w_w*(mu_i**ws).prod(axis=-1)/1000.
+        return self._result(mu*(w_w*dlnmu_w + (ws*dlnmu_i).sum(axis=-1)))
+
+    def _Cp_w(self, t, spline):
+        t = np.asarray(t, dtype=float)
+        inside = (t >= _Laliberte_Cp_w_ts[0]) & (t <= _Laliberte_Cp_w_ts[-1])
+        return np.where(inside, spline(np.where(inside, t, 0.)), np.nan)
+
+    def heat_capacity(self, T, ws):
+        r'''Calculates the heat capacity of the solution, [J/kg/K].'''
+        t, ws, w_w, ti, s, (a1, a2, a3, a4, a5, a6) = self._inputs(T, ws, self.heat_capacity_coeffs, 'heat capacity')
+        alpha = a2*ti + a3*np.exp(0.01*ti) + a4*s
+        # Pure water has no solute terms, which are singular for negative a6
+        with np.errstate(divide='ignore', invalid='ignore'):
+            Cp_i = np.where(ws == 0., 0., ws*(a1*np.exp(alpha) + a5*s**a6)*1000.)
+        return self._result(w_w*self._Cp_w(t, _Laliberte_Cp_w_spline) + Cp_i.sum(axis=-1))
+
+    def dheat_capacity_dT(self, T, ws):
+        r'''Calculates the derivative of the heat capacity of the solution
+        with respect to temperature, [J/kg/K^2].'''
+        t, ws, w_w, ti, s, (a1, a2, a3, a4, a5, a6) = self._inputs(T, ws, self.heat_capacity_coeffs, 'heat capacity')
+        exp_t = np.exp(0.01*ti)
+        dCp_i = a1*np.exp(a2*ti + a3*exp_t + a4*s)*(a2 + 0.01*a3*exp_t)*1000.
+        return self._result(w_w*self._Cp_w(t, _Laliberte_dCp_w_dt_spline) + (ws*dCp_i).sum(axis=-1))
+
+    def _solution_volume(self, t, w, fractions):
+        # Specific volume of the solution and its derivative with respect to
+        # the total mass fraction of solutes, at fixed relative fractions
+        c0, c1, c2, c3, c4 = self.density_coeffs.T
+        rho_w = Laliberte_density_w(t + 273.15)
+        # 1 - (1 - w) as in Laliberte_density
+        s, ti = (1 - (1 - w))[..., None], t[..., None]
+        num = c0*s + c1
+        den = s + c2 + c3*ti
+        rho_i = num*np.exp(1E-6*(ti + c4)**2)/den
+        dlnrho_i = c0/num - 1./den
+        V = (1 - w)/rho_w + (w[..., None]*fractions/rho_i).sum(axis=-1)
+        dV = -1./rho_w + (fractions*(1. - s*dlnrho_i)/rho_i).sum(axis=-1)
+        return V, dV
+
+    def mass_fraction_from_density(self, rho, T, fractions=None, w0=None,
+                                   xtol=1E-13, maxiter=50):
+        r'''Solves for the total mass fraction of solutes giving a density at
+        a temperature, with the solutes in fixed relative proportions; the
+        inverse of :obj:`density`. Newton's method is used, on the specific
+        volume of the solution which is nearly linear in the mass fraction,
+        with its analytical derivative; all the elements of the inputs are
+        solved at once.
+
+        If no initial guess is given, the solution of the previous call is
+        used if it had the same shape, so samples streamed one at a time or
+        in same-sized blocks converge in one or two iterations.
+
+        Parameters
+        ----------
+        rho : float or array
+            Densities of the solution, [kg/m^3]
+        T : float or array
+            Temperatures of the solution, [K]
+        fractions : list[float], optional
+            Relative mass fractions of the solutes, normalized to sum to 1;
+            required if there is more than one solute
+        w0 : float or array, optional
+            Initial guesses of the total mass fraction of solutes
+        xtol : float, optional
+            Absolute tolerance in mass fraction
+        maxiter : int, optional
+            Maximum number of iterations
+
+        Returns
+        -------
+        w : float or array
+            Total mass fraction of solutes; NaN for elements which could not
+            be solved, such as NaN densities, and for those whose solution is
+            negative (densities below that of water) or more than any solute's
+            mass fraction in `density_wMax` allows, [-]
+
+        Examples
+        --------
+        >>> NaCl = LaliberteSolution(['7647-14-5'])
+        >>> ws = NaCl.mass_fraction_from_density([1020., 1100.], 298.15)
+        >>> ws
+        array([0.03269606, 0.14128552])
+        >>> NaCl.density(298.15, ws[:, None])
+        array([1020., 1100.])
+        >>> NaCl.mass_fraction_from_density([990., 1300.], 298.15)
+        array([nan, nan])
+        '''
+        if self.density_coeffs is None:
+            raise Exception('Laliberte density parameters are not available for all solutes')
+        if fractions is None:
+            if len(self.CASRNs) != 1:
+                raise Exception('The relative fractions of the solutes are required')
+            fractions = [1.]
+        fractions = np.asarray(fractions, dtype=float)
+        fractions = fractions/fractions.sum()
+        rho, T = np.broadcast_arrays(np.asarray(rho, dtype=float), np.asarray(T, dtype=float))
+        t = T - 273.15
+        w = self._guess('w', w0, rho.shape)
+        if w is None or not np.all(np.isfinite(w)):
+            # The specific volume of a solution is nearly linear in w
+            V, dV = self._solution_volume(t, np.zeros(rho.shape), fractions)
+            with np.errstate(all='ignore'):
+                guess = (1./rho - V)/dV
+            w = guess if w is None else np.where(np.isfinite(w), w, guess)
+
+        def step(w):
+            V, dV = self._solution_volume(t, w, fractions)
+            return (V - 1./rho)/dV
+        w = self._newton(w, step, xtol, maxiter, 'Mass fraction from density did not converge')
+        # Solutions outside of the data the parameters were fit to; round-off
+        # below pure water is kept, as zero
+        w_max = (self.density_wMax[:, 0][fractions > 0]/fractions[fractions > 0]).min()
+        with np.errstate(invalid='ignore'):
+            w[(w < -xtol) | (w > w_max)] = np.nan
+            w = np.where(w < 0., 0., w)
+        self._last['w'] = w
+        return self._result(w)
+
+    def _guess(self, name, guess, shape):
+        if guess is not None:
+            return np.broadcast_to(np.asarray(guess, dtype=float), shape).copy()
+        last = self._last.get(name)
+        if last is not None and last.shape == shape:
+            return last.copy()
+        return None
+
+    @staticmethod
+    def _newton(x, step, xtol, maxiter, message):
+        # Newton's method on all the elements at once; each element stops
+        # changing once it has converged, and is NaN if it cannot be solved
+        # (not finite, or not converged after maxiter iterations), so one bad
+        # sample does not fail the others. Raises only if none converged.
+        x = np.array(x, dtype=float)
+        active = np.isfinite(x)
+        solved = np.zeros(x.shape, dtype=bool)
+        for _ in range(maxiter):
+            if not active.any():
+                break
+            with np.errstate(all='ignore'):
+                dx = step(x)
+            x = np.where(active, x - dx, x)
+            converged = active & (np.abs(dx) <= xtol)
+            solved |= converged
+            active &= ~converged & np.isfinite(x)
+        if not solved.any() and np.isfinite(x).any():
+            raise Exception(message)
+        x[~solved] = np.nan
+        return x
+
+    def enthalpy(self, T, ws, T_ref=298.15):
+        r'''Calculates the enthalpy of the solution relative to that at
+        `T_ref` at the same composition, the integral of :obj:`heat_capacity`
+        from `T_ref` to `T`, [J/kg]. The integrals of the water heat capacity
+        spline and of the constant term of each solute are exact; the rest
+        is integrated by Gauss-Legendre quadrature, exact to rounding for
+        these smooth forms.
+
+        Examples
+        --------
+        >>> NaCl = LaliberteSolution(['7647-14-5'])
+        >>> round(NaCl.enthalpy(308.15, [0.1]), 4)
+        37366.4209
+        '''
+        t, ws, w_w, ti, s, (a1, a2, a3, a4, a5, a6) = self._inputs(T, ws, self.heat_capacity_coeffs, 'heat capacity')
+        t_ref = T_ref - 273.15
+        inside = ((t >= _Laliberte_Cp_w_ts[0]) & (t <= _Laliberte_Cp_w_ts[-1])
+                  & (_Laliberte_Cp_w_ts[0] <= t_ref <= _Laliberte_Cp_w_ts[-1]))
+        H_w = _Laliberte_Cp_w_integral(np.where(inside, t, t_ref)) - _Laliberte_Cp_w_integral(t_ref)
+        H_w = np.where(inside, H_w, np.nan)
+        # Quadrature of a1*exp(alpha) from t_ref to t, with the nodes along
+        # a new first axis
+        half = (ti - t_ref)/2.
+        tk = (ti + t_ref)/2. + half*_Laliberte_nodes.reshape((-1,) + (1,)*ti.ndim)
+        exp_part = (_Laliberte_weights.reshape((-1,) + (1,)*ti.ndim)
+                    *a1*np.exp(a2*tk + a3*np.exp(0.01*tk) + a4*s)).sum(axis=0)*half
+        with np.errstate(divide='ignore', invalid='ignore'):
+            H_i = np.where(ws == 0., 0., ws*(exp_part + a5*s**a6*(ti - t_ref))*1000.)
+        return self._result(w_w*H_w + H_i.sum(axis=-1))
+
+    def T_from_enthalpy(self, H, ws, T_ref=298.15, T0=None, xtol=1E-10,
+                        maxiter=50):
+        r'''Solves for the temperature at which the solution has an enthalpy
+        relative to `T_ref`, at a fixed composition; the inverse of
+        :obj:`enthalpy`. Newton's method is used, with the heat capacity as
+        the analytical derivative; all the elements of the inputs are solved
+        at once.
+
+        If no initial guess is given, the solution of the previous call is
+        used if it had the same shape; otherwise the guess assumes the heat
+        capacity is constant at `T_ref`.
+
+        Parameters
+        ----------
+        H : float or array
+            Enthalpies of the solution relative to `T_ref`, [J/kg]
+        ws : array
+            Mass fractions of the solutes, one column per solute, [-]
+        T_ref : float, optional
+            Reference temperature of the enthalpies, [K]
+        T0 : float or array, optional
+            Initial guesses of the temperature, [K]
+        xtol : float, optional
+            Absolute tolerance in temperature, [K]
+        maxiter : int, optional
+            Maximum number of iterations
+
+        Returns
+        -------
+        T : float or array
+            Temperatures of the solution; NaN for elements which could not be
+            solved, such as NaN enthalpies, [K]
+
+        Examples
+        --------
+        >>> NaCl = LaliberteSolution(['7647-14-5'])
+        >>> round(NaCl.T_from_enthalpy(37366.4209, [0.1]), 6)
+        308.15
+        '''
+        ws = np.asarray(ws, dtype=float)
+        H = np.asarray(H, dtype=float)
+        shape = np.broadcast(H, ws[..., 0]).shape
+        T = self._guess('T', T0, shape)
+        if T is None or not np.all(np.isfinite(T)):
+            with np.errstate(all='ignore'):
+                guess = T_ref + H/self.heat_capacity(np.full(shape, T_ref), ws)
+            T = guess if T is None else np.where(np.isfinite(T), T, guess)
+
+        def step(T):
+            return (self.enthalpy(T, ws, T_ref) - H)/self.heat_capacity(T, ws)
+        T = self._newton(T, step, xtol, maxiter, 'Temperature from enthalpy did not converge')
+        self._last['T'] = T
+        return self._result(T)
+
 #print Laliberte_heat_capacity(298.15, [0.1], ['7664-41-7']) #4186.0988
 
 ## Aqueous HCl, trying to find heat capacity of Cl- as H+ is zero.
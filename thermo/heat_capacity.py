@@ -22,16 +22,18 @@ SOFTWARE.'''
 
 from __future__ import division
 import os
+from bisect import bisect_left
 from math import log, exp
 import numpy as np
 import pandas as pd
 
 from scipy.constants import R, calorie
 from scipy.integrate import quad
+from scipy.special import spence
 
 from thermo.utils import (to_num, property_molar_to_mass, none_and_length_check,
                           mixing_simple, property_mass_to_molar)
-from thermo.miscdata import _VDISaturationDict, VDI_tabular_data
+from thermo.miscdata import _VDISaturationDict, VDI_tabular_arrays
 from thermo.electrochem import (Laliberte_heat_capacity,
                                 _Laliberte_Heat_Capacity_ParametersDict)
 from thermo.utils import TDependentProperty
@@ -397,10 +399,10 @@ class HeatCapacityGas(TDependentProperty):
             # pressure; it is normally substantially higher than the ideal gas
             # value
             methods.append(VDI_TABULAR)
-            Ts, props = VDI_tabular_data(self.CASRN, 'Cp (g)')
-            self.VDI_Tmin = Ts[0]
-            self.VDI_Tmax = Ts[-1]
-            self.tabular_data[VDI_TABULAR] = (Ts, props)
+            Ts, props = VDI_data = VDI_tabular_arrays(self.CASRN, 'Cp (g)')
+            self.VDI_Tmin = float(Ts[0])
+            self.VDI_Tmax = float(Ts[-1])
+            self.tabular_data[VDI_TABULAR] = VDI_data
             Tmins.append(self.VDI_Tmin); Tmaxs.append(self.VDI_Tmax)
         if has_CoolProp and self.CASRN in coolprop_dict:
             methods.append(COOLPROP)
@@ -436,7 +438,7 @@ class HeatCapacityGas(TDependentProperty):
             a0, a1, a2, a3, a4, a5, a6, a7 = self.TRCIG_coefs
             Cp = TRCCp(T, a0, a1, a2, a3, a4, a5, a6, a7)
         elif method == COOLPROP:
-            Cp = PropsSI('Cp0molar', 'T', T,'P', 101325.0, self.CASRN)
+            Cp = CoolProp_TP(T, 101325.0, self.CASRN, 'Cp0molar', self.CoolProp_backend)
         elif method == POLING:
             Cp = R*(self.POLING_coefs[0] + self.POLING_coefs[1]*T
             + self.POLING_coefs[2]*T**2 + self.POLING_coefs[3]*T**3
@@ -670,61 +672,6 @@ def Dadgostar_Shaw(T, similarity_variable):
     return Cp
 
 
-_ZabranskySats = {}
-_ZabranskyConsts = {}
-_ZabranskyIsos = {}
-
-_ZabranskySatp = {}
-_ZabranskyConstp = {}
-_ZabranskyIsop = {}
-
-
-def _append2dict(maindict, newdict):
-    '''
-    Inputs: Dict entry or []; and the dict type
-    '''
-    data = None
-    for datum in maindict:  # list of dicts
-        if newdict["Tmin"] < datum["Tmin"]:
-            data = maindict  # list of dicts
-            data.insert(data.index(datum), newdict)
-            break
-    if not data:  # Run if Tmin never under Tmins in dict (put at end)
-        data = maindict
-        data.extend([newdict])
-    return data
-
-
-with open(os.path.join(folder, 'Zabransky.csv')) as f:
-    next(f)
-    for line in f:
-        values = to_num(line.strip('\n').split('\t'))
-        # s for spline, p for quasipolynomial
-        (CASRN, _name, Type, Uncertainty, Tmin, Tmax, a1s, a2s, a3s, a4s, a1p, a2p, a3p, a4p, a5p, a6p, Tc) = values
-
-        _ZabranskyDict = {"name" : _name , "Type" : Type,
-        "Uncertainty" : Uncertainty, "Tmin": Tmin, "Tmax" : Tmax, "a1s" : a1s,
-        "a2s" : a2s, "a3s": a3s, "a4s" : a4s, "a1p" : a1p, "a2p" : a2p,
-        "a3p" : a3p, "a4p" : a4p,  "a5p" : a5p, "a6p" : a6p, "Tc" : Tc }
-        # dict[CASRN] = [subdict1, subdict2] where each is sorted
-        if Type == 'sat':
-            if a1s: # sat, spline ONLY
-                _ZabranskySats[CASRN] = _append2dict((_ZabranskySats[CASRN] if CASRN in _ZabranskySats else []), _ZabranskyDict)
-            elif a1p: # sat, polynomial ONLY
-                _ZabranskySatp[CASRN] = _append2dict((_ZabranskySatp[CASRN] if CASRN in _ZabranskySatp else []), _ZabranskyDict)
-        elif Type == 'p':
-            if a1s: # sat, spline ONLY
-                _ZabranskyConsts[CASRN] = _append2dict((_ZabranskyConsts[CASRN] if CASRN in _ZabranskyConsts else []), _ZabranskyDict)
-            elif a1p: # sat, polynomial ONLY
-                _ZabranskyConstp[CASRN] = _append2dict((_ZabranskyConstp[CASRN] if CASRN in _ZabranskyConstp else []), _ZabranskyDict)
-        elif Type == 'C':
-            if a1s: # sat, spline ONLY
-                _ZabranskyIsos[CASRN] = _append2dict((_ZabranskyIsos[CASRN] if CASRN in _ZabranskyIsos else []), _ZabranskyDict)
-            elif a1p: # sat, polynomial ONLY
-                _ZabranskyIsop[CASRN] = _append2dict((_ZabranskyIsop[CASRN] if CASRN in _ZabranskyIsop else []), _ZabranskyDict)
-
-
-
 def Zabransky_quasi_polynomial(T, Tc, a1, a2, a3, a4, a5, a6):
     r'''Calculates liquid heat capacity using the model developed in [1]_.
 
@@ -769,6 +716,100 @@ def Zabransky_quasi_polynomial(T, Tc, a1, a2, a3, a4, a5, a6):
     return R*(a1*log(1-Tr) + a2/(1-Tr) + a3 + a4*Tr + a5*Tr**2 + a6*Tr**3)
 
 
+def Zabransky_quasi_polynomial_integral(T, Tc, a1, a2, a3, a4, a5, a6):
+    r'''Calculates the integral of liquid heat capacity using the
+    quasi-polynomial model developed in [1]_.
+
+    .. math::
+        \int C dT = RT_c\left[A_1\left((1-T_r) - (1-T_r)\ln(1-T_r)\right)
+        - A_2\ln(1-T_r) + A_3 T_r + \frac{A_4 T_r^2}{2} + \frac{A_5 T_r^3}{3}
+        + \frac{A_6 T_r^4}{4}\right]
+
+    Parameters
+    ----------
+    T : float
+        Temperature [K]
+    Tc : float
+        Critical temperature of fluid, [K]
+    a1-a6 : float
+        Coefficients
+
+    Returns
+    -------
+    H : float
+        Difference in enthalpy from a reference point, [J/mol]
+
+    Notes
+    -----
+    Only differences of this function are meaningful, as with
+    :obj:`Zabransky_cubic_integral`.
+
+    Examples
+    --------
+    >>> H1 = Zabransky_quasi_polynomial_integral(300, 591.79, -3.12743, 0.0857315, 13.7282, 1.28971, 6.42297, 4.10989)
+    >>> H2 = Zabransky_quasi_polynomial_integral(330, 591.79, -3.12743, 0.0857315, 13.7282, 1.28971, 6.42297, 4.10989)
+    >>> round(H2 - H1, 4)
+    4843.6557
+
+    References
+    ----------
+    .. [1] Zabransky, M., V. Ruzicka Jr, V. Majer, and Eugene S. Domalski.
+       Heat Capacity of Liquids: Critical Review and Recommended Values.
+       2 Volume Set. Washington, D.C.: Amer Inst of Physics, 1996.
+    '''
+    Tr = T/Tc
+    tau = 1. - Tr
+    log_tau = log(tau)
+    return R*Tc*(a1*(tau - tau*log_tau) - a2*log_tau
+                 + Tr*(a3 + Tr*(a4/2. + Tr*(a5/3. + Tr*a6/4.))))
+
+
+def Zabransky_quasi_polynomial_integral_over_T(T, Tc, a1, a2, a3, a4, a5, a6):
+    r'''Calculates the integral of liquid heat capacity over T using the
+    quasi-polynomial model developed in [1]_.
+
+    .. math::
+        \int \frac{C}{T} dT = R\left[-A_1 \text{Li}_2(T_r) + A_2\ln\frac{T_r}
+        {1-T_r} + A_3\ln T_r + A_4 T_r + \frac{A_5 T_r^2}{2}
+        + \frac{A_6 T_r^3}{3}\right]
+
+    Parameters
+    ----------
+    T : float
+        Temperature [K]
+    Tc : float
+        Critical temperature of fluid, [K]
+    a1-a6 : float
+        Coefficients
+
+    Returns
+    -------
+    S : float
+        Difference in entropy from a reference point, [J/mol/K]
+
+    Notes
+    -----
+    The dilogarithm :math:`\text{Li}_2` is evaluated with SciPy's `spence`.
+
+    Examples
+    --------
+    >>> S1 = Zabransky_quasi_polynomial_integral_over_T(300, 591.79, -3.12743, 0.0857315, 13.7282, 1.28971, 6.42297, 4.10989)
+    >>> S2 = Zabransky_quasi_polynomial_integral_over_T(330, 591.79, -3.12743, 0.0857315, 13.7282, 1.28971, 6.42297, 4.10989)
+    >>> round(S2 - S1, 6)
+    15.382358
+
+    References
+    ----------
+    .. [1] Zabransky, M., V. Ruzicka Jr, V. Majer, and Eugene S. Domalski.
+       Heat Capacity of Liquids: Critical Review and Recommended Values.
+       2 Volume Set. Washington, D.C.: Amer Inst of Physics, 1996.
+    '''
+    Tr = T/Tc
+    log_Tr = log(Tr)
+    return R*(-a1*float(spence(1. - Tr)) + a2*(log_Tr - log(1. - Tr)) + a3*log_Tr
+              + Tr*(a4 + Tr*(a5/2. + Tr*a6/3.)))
+
+
 def Zabransky_cubic(T, a1, a2, a3, a4):
     r'''Calculates liquid heat capacity using the model developed in [1]_.
 
@@ -807,28 +848,256 @@ def Zabransky_cubic(T, a1, a2, a3, a4):
     return R*(a1 + a2*T**1 + a3*T**2 + a4*T**3)
 
 
-def _ZabranskyDictChoser(T, diclist, strict=False):
-    ans = None
-    if len(diclist) == 1: # one entry
-            ans = diclist[0]
-    else:
-        for data in diclist:
-            if T < data["Tmin"]: # multiple entries, under Tmin
-                ans = data
-                break
-            elif T >= data["Tmin"] and T <= data["Tmax"]: # Tmin < T < Tmax
-                ans = data
-                break
-        if not ans:
-            ans = diclist[-1] # last entry; T > Tmax, last case
+def Zabransky_cubic_integral(T, a1, a2, a3, a4):
+    r'''Calculates the integral of liquid heat capacity using the model
+    developed in [1]_.
 
-#    if strict:
-#        if T < ans["Tmin"] or T > ans["Tmax"]: # either side error
-#            ans = None
-    return ans
+    .. math::
+        \int C dT = 100R\sum_{j=0}^3 \frac{A_{j+1}}{j+1}
+        \left(\frac{T}{100}\right)^{j+1}
 
+    Parameters
+    ----------
+    T : float
+        Temperature [K]
+    a1-a4 : float
+        Coefficients
 
+    Returns
+    -------
+    H : float
+        Difference in enthalpy from a reference point, [J/mol]
 
+    Examples
+    --------
+    >>> round(Zabransky_cubic_integral(298.15, 20.9634, -10.1344, 2.8253, -0.256738), 4)
+    31051.6904
+
+    References
+    ----------
+    .. [1] Zabransky, M., V. Ruzicka Jr, V. Majer, and Eugene S. Domalski.
+       Heat Capacity of Liquids: Critical Review and Recommended Values.
+       2 Volume Set. Washington, D.C.: Amer Inst of Physics, 1996.
+    '''
+    T = T/100.
+    return 100.*R*T*(a1 + T*(a2/2. + T*(a3/3. + T*a4/4.)))
+
+
+def Zabransky_cubic_integral_over_T(T, a1, a2, a3, a4):
+    r'''Calculates the integral of liquid heat capacity over T using the
+    model developed in [1]_.
+
+    .. math::
+        \int \frac{C}{T} dT = R\left[A_1\ln T + \sum_{j=1}^3 \frac{A_{j+1}}{j}
+        \left(\frac{T}{100}\right)^{j}\right]
+
+    Parameters
+    ----------
+    T : float
+        Temperature [K]
+    a1-a4 : float
+        Coefficients
+
+    Returns
+    -------
+    S : float
+        Difference in entropy from a reference point, [J/mol/K]
+
+    Examples
+    --------
+    >>> round(Zabransky_cubic_integral_over_T(298.15, 20.9634, -10.1344, 2.8253, -0.256738), 6)
+    827.410892
+
+    References
+    ----------
+    .. [1] Zabransky, M., V. Ruzicka Jr, V. Majer, and Eugene S. Domalski.
+       Heat Capacity of Liquids: Critical Review and Recommended Values.
+       2 Volume Set. Washington, D.C.: Amer Inst of Physics, 1996.
+    '''
+    logT = log(T)
+    T = T/100.
+    return R*(a1*logT + T*(a2 + T*(a3/2. + T*a4/3.)))
+
+
+class ZabranskySpline(object):
+    r'''Liquid heat capacity correlation of one chemical from [1]_, as the
+    segments of :obj:`Zabransky_cubic` it is tabulated in; each segment has
+    its own coefficients and range of temperatures.
+
+    The segment used at a temperature is the first one whose maximum
+    temperature is not below it, or the last one above all of them; the
+    first and last segments extrapolate. It is found by bisection.
+    Integrals are calculated analytically over each segment spanned.
+
+    Parameters
+    ----------
+    Tmins : list[float]
+        Minimum temperatures of the segments, [K]
+    Tmaxs : list[float]
+        Maximum temperatures of the segments, [K]
+    coeffs : list[list[float]]
+        Coefficients of each segment
+
+    Attributes
+    ----------
+    Tmins : ndarray
+        Minimum temperatures of the segments, sorted, [K]
+    Tmaxs : ndarray
+        Maximum temperatures of the segments, in the same order, [K]
+    coeffs : ndarray
+        Coefficients of each segment, one row each, in the same order
+    bounds : ndarray
+        Temperatures separating the segments; segment `i` is used up to and
+        including `bounds[i]`, [K]
+
+    Examples
+    --------
+    The first two segments of water at constant pressure:
+
+    >>> water = ZabranskySpline([273.6, 380.], [380., 590.],
+    ...     [[20.9634, -10.1344, 2.8253, -0.256738],
+    ...      [-22.0666, 23.8366, -6.11445, 0.52745]])
+    >>> water.calculate(300.), water.calculate(400.)
+    (75.29555729257993, 76.53795418373718)
+    >>> water.calculate_array([300., 400.])
+    array([75.29555729, 76.53795418])
+    >>> water.calculate_integral(300., 400.)
+    7571.437418624177
+
+    References
+    ----------
+    .. [1] Zabransky, M., V. Ruzicka Jr, V. Majer, and Eugene S. Domalski.
+       Heat Capacity of Liquids: Critical Review and Recommended Values.
+       2 Volume Set. Washington, D.C.: Amer Inst of Physics, 1996.
+    '''
+    function = staticmethod(Zabransky_cubic)
+    integral = staticmethod(Zabransky_cubic_integral)
+    integral_over_T = staticmethod(Zabransky_cubic_integral_over_T)
+
+    def __init__(self, Tmins, Tmaxs, coeffs):
+        # Segments with the same Tmin keep the order they were given in
+        order = np.argsort(Tmins, kind='mergesort')
+        self.Tmins = np.array(Tmins, dtype=float)[order]
+        self.Tmaxs = np.array(Tmaxs, dtype=float)[order]
+        self.coeffs = np.array(coeffs, dtype=float)[order]
+        # A segment is used up to its Tmax, or that of any segment before it
+        self.bounds = np.maximum.accumulate(self.Tmaxs)[:-1]
+        self._bounds = self.bounds.tolist()
+        # Missing coefficients stay None, failing as they always have
+        self._coeffs = [tuple(coeffs[i]) for i in order]
+
+    def __len__(self):
+        return len(self._coeffs)
+
+    def segment(self, T):
+        r'''Returns the index of the segment used at a temperature.'''
+        return bisect_left(self._bounds, T)
+
+    def calculate(self, T):
+        r'''Calculates the heat capacity at a temperature, [J/mol/K].'''
+        return self.function(T, *self._coeffs[bisect_left(self._bounds, T)])
+
+    def _calculate_array(self, Ts, coeffs):
+        a1, a2, a3, a4 = coeffs
+        Ts = Ts/100.
+        return R*(a1 + a2*Ts + a3*Ts**2 + a4*Ts**3)
+
+    def calculate_array(self, Ts):
+        r'''Calculates the heat capacity at each of an array of
+        temperatures, [J/mol/K].'''
+        Ts = np.asarray(Ts, dtype=float)
+        coeffs = self.coeffs[np.searchsorted(self.bounds, Ts, side='left')]
+        return self._calculate_array(Ts, np.moveaxis(coeffs, -1, 0))
+
+    def _integrate(self, T1, T2, integral):
+        if T2 < T1:
+            return -self._integrate(T2, T1, integral)
+        start, end = bisect_left(self._bounds, T1), bisect_left(self._bounds, T2)
+        total = 0.
+        for i in range(start, end):
+            coeffs = self._coeffs[i]
+            T_end = self._bounds[i]
+            total += integral(T_end, *coeffs) - integral(T1, *coeffs)
+            T1 = T_end
+        coeffs = self._coeffs[end]
+        return total + integral(T2, *coeffs) - integral(T1, *coeffs)
+
+    def calculate_integral(self, T1, T2):
+        r'''Calculates the integral of heat capacity from `T1` to `T2`,
+        through every segment in between, [J/mol].'''
+        return self._integrate(T1, T2, self.integral)
+
+    def calculate_integral_over_T(self, T1, T2):
+        r'''Calculates the integral of heat capacity over T from `T1` to
+        `T2`, through every segment in between, [J/mol/K].'''
+        return self._integrate(T1, T2, self.integral_over_T)
+
+
+class ZabranskyQuasipolynomial(ZabranskySpline):
+    r'''Liquid heat capacity correlation of one chemical from [1]_, as the
+    segments of :obj:`Zabransky_quasi_polynomial` it is tabulated in; see
+    :obj:`ZabranskySpline`. The first coefficient of each segment is the
+    critical temperature it uses, followed by `a1` to `a6`.
+
+    Examples
+    --------
+    >>> Cp = ZabranskyQuasipolynomial([278.], [591.],
+    ...     [[591.79, -3.12743, 0.0857315, 13.7282, 1.28971, 6.42297, 4.10989]])
+    >>> Cp.calculate(330)
+    165.47287877563326
+
+    References
+    ----------
+    .. [1] Zabransky, M., V. Ruzicka Jr, V. Majer, and Eugene S. Domalski.
+       Heat Capacity of Liquids: Critical Review and Recommended Values.
+       2 Volume Set. Washington, D.C.: Amer Inst of Physics, 1996.
+    '''
+    function = staticmethod(Zabransky_quasi_polynomial)
+    integral = staticmethod(Zabransky_quasi_polynomial_integral)
+    integral_over_T = staticmethod(Zabransky_quasi_polynomial_integral_over_T)
+
+    def _calculate_array(self, Ts, coeffs):
+        Tc, a1, a2, a3, a4, a5, a6 = coeffs
+        Tr = Ts/Tc
+        return R*(a1*np.log(1-Tr) + a2/(1-Tr) + a3 + a4*Tr + a5*Tr**2 + a6*Tr**3)
+
+
+# dict[CASRN] = ZabranskySpline or ZabranskyQuasipolynomial
+_ZabranskySats = {}
+_ZabranskyConsts = {}
+_ZabranskyIsos = {}
+
+_ZabranskySatp = {}
+_ZabranskyConstp = {}
+_ZabranskyIsop = {}
+
+
+def _load_Zabransky():
+    # Segments of each table and chemical, as (Tmin, Tmax, coefficients)
+    segments = {}
+    tables = {('sat', True): _ZabranskySats, ('sat', False): _ZabranskySatp,
+              ('p', True): _ZabranskyConsts, ('p', False): _ZabranskyConstp,
+              ('C', True): _ZabranskyIsos, ('C', False): _ZabranskyIsop}
+    with open(os.path.join(folder, 'Zabransky.csv')) as f:
+        next(f)
+        for line in f:
+            values = to_num(line.strip('\n').split('\t'))
+            # s for spline, p for quasipolynomial
+            (CASRN, _name, Type, Uncertainty, Tmin, Tmax, a1s, a2s, a3s, a4s, a1p, a2p, a3p, a4p, a5p, a6p, Tc) = values
+            if a1s: # spline ONLY
+                key, coeffs = (Type, True), (a1s, a2s, a3s, a4s)
+            elif a1p: # polynomial ONLY
+                key, coeffs = (Type, False), (Tc, a1p, a2p, a3p, a4p, a5p, a6p)
+            else:
+                continue
+            if key in tables:
+                segments.setdefault((key, CASRN), []).append((Tmin, Tmax, coeffs))
+    for ((Type, spline), CASRN), rows in segments.items():
+        Tmins, Tmaxs, coeffs = zip(*rows)
+        cls = ZabranskySpline if spline else ZabranskyQuasipolynomial
+        tables[(Type, spline)][CASRN] = cls(Tmins, Tmaxs, coeffs)
+
+_load_Zabransky()
 
 
 POST_CRITICAL = 'Post-critical'
@@ -1065,10 +1334,10 @@ class HeatCapacityLiquid(TDependentProperty):
             # pressure; it is normally substantially higher than the ideal gas
             # value
             methods.append(VDI_TABULAR)
-            Ts, props = VDI_tabular_data(self.CASRN, 'Cp (l)')
-            self.VDI_Tmin = Ts[0]
-            self.VDI_Tmax = Ts[-1]
-            self.tabular_data[VDI_TABULAR] = (Ts, props)
+            Ts, props = VDI_data = VDI_tabular_arrays(self.CASRN, 'Cp (l)')
+            self.VDI_Tmin = float(Ts[0])
+            self.VDI_Tmax = float(Ts[-1])
+            self.tabular_data[VDI_TABULAR] = VDI_data
             Tmins.append(self.VDI_Tmin); Tmaxs.append(self.VDI_Tmax)
         if self.Tc and self.omega:
             methods.extend([ROWLINSON_POLING, ROWLINSON_BONDI])
@@ -1104,25 +1373,19 @@ class HeatCapacityLiquid(TDependentProperty):
             Heat capacity of the liquid at T, [J/mol/K]
         '''
         if method == ZABRANSKY_SPLINE:
-            data = _ZabranskyDictChoser(T, self.ZABRANSKY_SPLINE_data)
-            Cp = Zabransky_cubic(T, data["a1s"], data["a2s"], data["a3s"], data["a4s"])
+            Cp = self.ZABRANSKY_SPLINE_data.calculate(T)
         elif method == ZABRANSKY_QUASIPOLYNOMIAL:
-            data = _ZabranskyDictChoser(T, self.ZABRANSKY_QUASIPOLYNOMIAL_data)
-            Cp = Zabransky_quasi_polynomial(T, data["Tc"], data["a1p"], data["a2p"], data["a3p"], data["a4p"], data["a5p"], data["a6p"])
+            Cp = self.ZABRANSKY_QUASIPOLYNOMIAL_data.calculate(T)
         elif method == ZABRANSKY_SPLINE_C:
-            data = _ZabranskyDictChoser(T,self.ZABRANSKY_SPLINE_C_data)
-            Cp = Zabransky_cubic(T, data["a1s"], data["a2s"], data["a3s"], data["a4s"])
+            Cp = self.ZABRANSKY_SPLINE_C_data.calculate(T)
         elif method == ZABRANSKY_QUASIPOLYNOMIAL_C:
-            data = _ZabranskyDictChoser(T, self.ZABRANSKY_QUASIPOLYNOMIAL_C_data)
-            Cp = Zabransky_quasi_polynomial(T, data["Tc"], data["a1p"], data["a2p"], data["a3p"], data["a4p"], data["a5p"], data["a6p"])
+            Cp = self.ZABRANSKY_QUASIPOLYNOMIAL_C_data.calculate(T)
         elif method == ZABRANSKY_SPLINE_SAT:
-            data = _ZabranskyDictChoser(T, self.ZABRANSKY_SPLINE_SAT_data)
-            Cp = Zabransky_cubic(T, data["a1s"], data["a2s"], data["a3s"], data["a4s"])
+            Cp = self.ZABRANSKY_SPLINE_SAT_data.calculate(T)
         elif method == ZABRANSKY_QUASIPOLYNOMIAL_SAT:
-            data = _ZabranskyDictChoser(T, self.ZABRANSKY_QUASIPOLYNOMIAL_SAT_data)
-            Cp = Zabransky_quasi_polynomial(T, data["Tc"], data["a1p"], data["a2p"], data["a3p"], data["a4p"], data["a5p"], data["a6p"])
+            Cp = self.ZABRANSKY_QUASIPOLYNOMIAL_SAT_data.calculate(T)
         elif method == COOLPROP:
-            Cp = CoolProp_T_dependent_property(T, self.CASRN , 'CPMOLAR', 'l')
+            Cp = CoolProp_T_dependent_property(T, self.CASRN , 'CPMOLAR', 'l', self.CoolProp_backend)
         elif method == POLING_CONST:
             Cp = self.POLING_constant
         elif method == CRCSTD:
@@ -1140,6 +1403,78 @@ class HeatCapacityLiquid(TDependentProperty):
             Cp = self.interpolate(T, method)
         return Cp
 
+    def calculate_integral(self, T1, T2, method):
+        r'''Method to calculate the integral of a property with respect to
+        temperature, using a specified method. Implements the analytical
+        integrals of all Zabransky methods, through each of their segments
+        between the limits; other methods use the numerical implementation
+        in :obj:`TDependentProperty.calculate_integral`.
+
+        Parameters
+        ----------
+        T1 : float
+            Lower limit of integration, [K]
+        T2 : float
+            Upper limit of integration, [K]
+        method : str
+            Method for which to find the integral
+
+        Returns
+        -------
+        integral : float
+            Calculated integral of the property over the given range,
+            [J/mol]
+        '''
+        if method == ZABRANSKY_SPLINE:
+            return self.ZABRANSKY_SPLINE_data.calculate_integral(T1, T2)
+        elif method == ZABRANSKY_QUASIPOLYNOMIAL:
+            return self.ZABRANSKY_QUASIPOLYNOMIAL_data.calculate_integral(T1, T2)
+        elif method == ZABRANSKY_SPLINE_C:
+            return self.ZABRANSKY_SPLINE_C_data.calculate_integral(T1, T2)
+        elif method == ZABRANSKY_QUASIPOLYNOMIAL_C:
+            return self.ZABRANSKY_QUASIPOLYNOMIAL_C_data.calculate_integral(T1, T2)
+        elif method == ZABRANSKY_SPLINE_SAT:
+            return self.ZABRANSKY_SPLINE_SAT_data.calculate_integral(T1, T2)
+        elif method == ZABRANSKY_QUASIPOLYNOMIAL_SAT:
+            return self.ZABRANSKY_QUASIPOLYNOMIAL_SAT_data.calculate_integral(T1, T2)
+        return super(HeatCapacityLiquid, self).calculate_integral(T1, T2, method)
+
+    def calculate_integral_over_T(self, T1, T2, method):
+        r'''Method to calculate the integral of a property over temperature
+        with respect to temperature, using a specified method. Implements the
+        analytical integrals of all Zabransky methods, through each of their
+        segments between the limits; other methods use the numerical
+        implementation in :obj:`TDependentProperty.calculate_integral_over_T`.
+
+        Parameters
+        ----------
+        T1 : float
+            Lower limit of integration, [K]
+        T2 : float
+            Upper limit of integration, [K]
+        method : str
+            Method for which to find the integral
+
+        Returns
+        -------
+        integral : float
+            Calculated integral of the property over the given range,
+            [J/mol/K]
+        '''
+        if method == ZABRANSKY_SPLINE:
+            return self.ZABRANSKY_SPLINE_data.calculate_integral_over_T(T1, T2)
+        elif method == ZABRANSKY_QUASIPOLYNOMIAL:
+            return self.ZABRANSKY_QUASIPOLYNOMIAL_data.calculate_integral_over_T(T1, T2)
+        elif method == ZABRANSKY_SPLINE_C:
+            return self.ZABRANSKY_SPLINE_C_data.calculate_integral_over_T(T1, T2)
+        elif method == ZABRANSKY_QUASIPOLYNOMIAL_C:
+            return self.ZABRANSKY_QUASIPOLYNOMIAL_C_data.calculate_integral_over_T(T1, T2)
+        elif method == ZABRANSKY_SPLINE_SAT:
+            return self.ZABRANSKY_SPLINE_SAT_data.calculate_integral_over_T(T1, T2)
+        elif method == ZABRANSKY_QUASIPOLYNOMIAL_SAT:
+            return self.ZABRANSKY_QUASIPOLYNOMIAL_SAT_data.calculate_integral_over_T(T1, T2)
+        return super(HeatCapacityLiquid, self).calculate_integral_over_T(T1, T2, method)
+
 
     def test_method_validity(self, T, method):
         r'''Method to check the validity of a method. Follows the given
@@ -1170,8 +1505,9 @@ class HeatCapacityLiquid(TDependentProperty):
         if method in [ZABRANSKY_SPLINE, ZABRANSKY_QUASIPOLYNOMIAL,
                       ZABRANSKY_SPLINE_C, ZABRANSKY_QUASIPOLYNOMIAL_C,
                       ZABRANSKY_SPLINE_SAT, ZABRANSKY_QUASIPOLYNOMIAL_SAT]:
-            data = _ZabranskyDictChoser(T, ZABRANSKY_TO_DICT[method][self.CASRN])
-            Tmin, Tmax = data['Tmin'], data['Tmax']
+            data = ZABRANSKY_TO_DICT[method][self.CASRN]
+            i = data.segment(T)
+            Tmin, Tmax = data.Tmins[i], data.Tmaxs[i]
             if T < Tmin or T > Tmax:
                 validity = False
         elif method == COOLPROP:
@@ -22,6 +22,18 @@ SOFTWARE.'''
 
 from __future__ import division
 import os
+import re
+import json
+import mmap
+import struct
+import zlib
+from bisect import bisect_left
+from collections import OrderedDict
+try:
+    from collections.abc import Mapping
+except ImportError:  # pragma: no cover
+    from collections import Mapping
+import numpy as np
 from thermo.utils import to_num
 
 folder = os.path.join(os.path.dirname(__file__), 'Identifiers')
@@ -77,66 +89,347 @@ def checkCAS(CASRN):
 
 
 
-_cas_from_pubchem_dict = {}
-_cas_from_smiles_dict = {}
-_cas_from_inchi_dict = {}
-_cas_from_inchikey_dict = {}
-_cas_from_name_dict = {}
-_cas_from_iupacname_dict = {}
+_normalize_re = re.compile(r'[\W_]+', re.UNICODE)
 
+def normalize_name(name):
+    '''Returns the form of a name used as a key in the normalized name index:
+    lowercase, with all whitespace and punctuation removed.
 
-pubchem_dict = {}
+    >>> normalize_name(' 1,2-Dichloro Ethane ')
+    '12dichloroethane'
+    '''
+    return _normalize_re.sub('', name.lower())
 
 
-with open(os.path.join(folder, 'chemical identifiers.csv')) as f:
-    for line in f:
-        values = line.rstrip('\n').split('\t')
-        (pubchemid, CAS, formula, mw, smiles, inchi, inchikey, iupac_name, common_name) = values[0:9]
-        allnames = values[7:]
-        pubchemid = int(pubchemid)
-        mw = float(mw)
-        # Create lookup dictionaries
-        _cas_from_pubchem_dict[pubchemid] = CAS
-        _cas_from_smiles_dict[smiles] = CAS
-        _cas_from_inchi_dict[inchi] = CAS
-        _cas_from_inchikey_dict[inchikey] = CAS
-        if iupac_name in _cas_from_iupacname_dict:
-            # TODO: make unnecessary by removing previously unique identifiers,
-            # which are no longer unique after making them lower case.
+### Identifier database
+# The identifiers of the chemicals are kept in a packed file, built from
+# 'chemical identifiers.csv' the first time it is needed (and again whenever
+# the csv file changes), and memory-mapped; processes using it share one copy
+# of it in memory. It has the strings of each chemical in one UTF-8 table,
+# and sorted arrays of hashes of the strings by which chemicals are looked up.
+# If the package folder is not writable, the file is kept in the user's cache
+# folder instead.
+
+_identifiers_path = os.path.join(folder, 'chemical identifiers.csv')
+_packed_path = os.path.join(folder, 'chemical identifiers.packed')
+_cache_folder = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.environ.get('LOCALAPPDATA')
+                             or os.path.join(os.path.expanduser('~'), '.cache'), 'thermo')
+_cache_packed_path = os.path.join(_cache_folder, 'chemical identifiers.packed')
+_packed_version = 3
+
+# Position of each field among the strings of a chemical; the names of the
+# chemical are all of the strings from the IUPAC name on
+_CAS, _FORMULA, _SMILES, _INCHI, _INCHIKEY, _IUPAC, _COMMON = range(7)
+
+
+def _replace(source, destination):
+    # os.replace is atomic, but Python 3 only; os.rename is atomic on POSIX,
+    # but on Windows cannot overwrite a file
+    try:
+        replace = os.replace
+    except AttributeError:  # pragma: no cover
+        if os.name == 'nt' and os.path.exists(destination):
+            os.remove(destination)
+        os.rename(source, destination)
+    else:
+        replace(source, destination)
+
+
+def _write_packed(path, arrays, meta):
+    # A header of the length of a JSON description of the arrays, the
+    # description, then the arrays, each aligned to 8 bytes
+    specs, offset = [], 0
+    for key, array in arrays.items():
+        specs.append([key, array.dtype.str, list(array.shape), offset])
+        offset += -(-array.nbytes//8)*8
+    header = json.dumps({'meta': meta, 'arrays': specs}).encode('utf-8')
+    header += b' '*(-len(header) % 8)
+    temporary = '%s.%d.tmp' %(path, os.getpid())
+    try:
+        with open(temporary, 'wb') as f:
+            f.write(struct.pack('<Q', len(header)))
+            f.write(header)
+            for key, array in arrays.items():
+                f.write(np.ascontiguousarray(array).tobytes())
+                f.write(b'\0'*(-array.nbytes % 8))
+        # Atomic, so other processes never read a partly written file
+        _replace(temporary, path)
+    except:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def _read_packed(path):
+    with open(path, 'rb') as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    length = struct.unpack_from('<Q', buffer, 0)[0]
+    header = json.loads(buffer[8:8+length].decode('utf-8'))
+    arrays = {}
+    for key, dtype, shape, offset in header['arrays']:
+        count = int(np.prod(shape))
+        arrays[key] = np.frombuffer(buffer, dtype=dtype, count=count,
+                                    offset=8 + length + offset).reshape(shape)
+    return header['meta'], arrays
+
+
+def _hash(key):
+    return zlib.crc32(key) & 0xffffffff
+
+
+def _pack_identifiers(path):
+    strings, pubchem_ids, MWs, row_offsets = [], [], [], [0]
+    # Each lookup keeps either the first or the last chemical with a key
+    firsts = OrderedDict([('IUPAC name', {}), ('name', {})])
+    lasts = {'CAS': {}, 'SMILES': {}, 'InChI': {}, 'InChI Key': {}}
+    with open(path) as f:
+        for line in f:
+            values = line.rstrip('\n').split('\t')
+            row, start = len(pubchem_ids), len(strings)
+            pubchem_ids.append(int(values[0]))
+            MWs.append(float(values[3]))
+            strings.extend(i.encode('utf-8') for i in values[1:3] + values[4:])
+            row_offsets.append(len(strings))
+            for key, field in (('CAS', _CAS), ('SMILES', _SMILES), ('InChI', _INCHI), ('InChI Key', _INCHIKEY)):
+                lasts[key][strings[start + field]] = (start + field, row)
+            firsts['IUPAC name'].setdefault(strings[start + _IUPAC], (start + _IUPAC, row))
+            for i in range(start + _IUPAC, len(strings)):
+                firsts['name'].setdefault(strings[i], (i, row))
+
+    # Keys which are the normalized form of names of different chemicals are
+    # left out, so a normalized lookup is never ambiguous
+    normalized, ambiguous = OrderedDict(), set()
+    for name, (i, row) in firsts['name'].items():
+        key = normalize_name(name.decode('utf-8')).encode('utf-8')
+        if normalized.setdefault(key, row) != row:
+            ambiguous.add(key)
+    for key in ambiguous:
+        del normalized[key]
+    normalized.pop(b'', None)
+    # The normalized names are stored after those of the chemicals
+    firsts['normalized'] = OrderedDict()
+    for key, row in normalized.items():
+        firsts['normalized'][key] = (len(strings), row)
+        strings.append(key)
+
+    arrays = OrderedDict()
+    arrays['offsets'] = np.cumsum([0] + [len(i) for i in strings], dtype=np.int64)
+    arrays['strings'] = np.frombuffer(b''.join(strings), dtype=np.uint8)
+    arrays['rows'] = np.array(row_offsets, dtype=np.int64)
+    arrays['pubchem'] = np.array(pubchem_ids, dtype=np.int64)
+    arrays['MW'] = np.array(MWs, dtype=np.float64)
+    # PubChem ids are unique; the last chemical with each is kept
+    order = np.argsort(arrays['pubchem'], kind='mergesort')[::-1]
+    ids, first = np.unique(arrays['pubchem'][order], return_index=True)
+    arrays['pubchem index'] = ids
+    arrays['pubchem index rows'] = order[first]
+    for key, index in list(lasts.items()) + list(firsts.items()):
+        keys = np.array([_hash(k) for k in index], dtype=np.uint32)
+        located = np.array(list(index.values()), dtype=np.int64).reshape(-1, 2)
+        order = np.argsort(keys, kind='mergesort')
+        arrays[key + ' hashes'] = keys[order]
+        arrays[key + ' strings'] = located[order, 0]
+        arrays[key + ' rows'] = located[order, 1]
+    return arrays
+
+
+def _load_identifiers():
+    stat = os.stat(_identifiers_path)
+    # The path distinguishes installations sharing the cache folder
+    meta = {'version': _packed_version, 'size': stat.st_size, 'mtime': int(stat.st_mtime),
+            'path': os.path.abspath(_identifiers_path)}
+    paths = (_packed_path, _cache_packed_path)
+    for path in paths:
+        try:
+            packed_meta, arrays = _read_packed(path)
+            if packed_meta == meta:
+                return arrays
+        except (IOError, OSError, ValueError):
+            pass
+    arrays = _pack_identifiers(_identifiers_path)
+    for path in paths:
+        try:
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            _write_packed(path, arrays, meta)
+            return _read_packed(path)[1]
+        except (IOError, OSError):
+            pass
+    # Neither folder is writable; the arrays are kept in memory
+    return arrays
+
+
+class _IdentifierStore(object):
+    def __init__(self, arrays):
+        self.arrays = arrays
+        self.offsets = arrays['offsets']
+        self.data = arrays['strings']
+        self.rows = arrays['rows']
+        self.pubchem = arrays['pubchem']
+        self.MW = arrays['MW']
+        # Hashes of each index as lists, made when first searched, as bisect
+        # on a list is much faster than numpy for single keys; and the rows
+        # of the keys, and the names of the rows, found so far in this process
+        self.hash_lists = {}
+        self.found = {}
+        self.found_names = {}
+
+    def __len__(self):
+        return len(self.pubchem)
+
+    def string(self, i):
+        return self.data[self.offsets[i]:self.offsets[i+1]].tobytes().decode('utf-8')
+
+    def field(self, row, field):
+        return self.string(self.rows[row] + field)
+
+    def names(self, row):
+        try:
+            return list(self.found_names[row])
+        except KeyError:
+            pass
+        # Decoded from one slice of the table
+        offsets = self.offsets[self.rows[row] + _IUPAC:self.rows[row+1] + 1].tolist()
+        data = self.data[offsets[0]:offsets[-1]].tobytes()
+        start = offsets[0]
+        names = self.found_names[row] = [data[i-start:j-start].decode('utf-8')
+                                         for i, j in zip(offsets[:-1], offsets[1:])]
+        return list(names)
+
+    def column(self, field):
+        return [self.field(row, field) for row in range(len(self))]
+
+    def find(self, index, key):
+        # Returns the row of the chemical with a string key in an index
+        try:
+            return self.found[index][key]
+        except KeyError:
             pass
+        try:
+            encoded = key.encode('utf-8')
+        except AttributeError:
+            raise KeyError(key)
+        try:
+            hashes = self.hash_lists[index]
+        except KeyError:
+            hashes = self.hash_lists[index] = self.arrays[index + ' hashes'].tolist()
+        strings = self.arrays[index + ' strings']
+        h = _hash(encoded)
+        i = bisect_left(hashes, h)
+        while i < len(hashes) and hashes[i] == h:
+            s = strings[i]
+            if self.data[self.offsets[s]:self.offsets[s+1]].tobytes() == encoded:
+                row = int(self.arrays[index + ' rows'][i])
+                self.found.setdefault(index, {})[key] = row
+                return row
+            i += 1
+        raise KeyError(key)
+
+    def find_pubchem(self, pubchemid):
+        ids = self.arrays['pubchem index']
+        i = int(np.searchsorted(ids, pubchemid))
+        if i == len(ids) or ids[i] != pubchemid:
+            raise KeyError(pubchemid)
+        return int(self.arrays['pubchem index rows'][i])
+
+    def row(self, CASRN):
+        return self.find('CAS', CASRN)
+
+
+class _CASLookup(Mapping):
+    # Read-only dict of the CAS numbers of the chemicals by one identifier
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    def __getitem__(self, key):
+        if self.index == 'pubchem':
+            return self.store.field(self.store.find_pubchem(key), _CAS)
+        return self.store.field(self.store.find(self.index, key), _CAS)
+
+    def __iter__(self):
+        store = self.store
+        if self.index == 'pubchem':
+            for i in store.arrays['pubchem index']:
+                yield int(i)
         else:
-            _cas_from_iupacname_dict[iupac_name] = CAS
-        for name in allnames:
-            # TODO: make unnecessary by removing previously unique identifiers,
-            # which are no longer unique after making them lower case.
-            if name in _cas_from_name_dict:
-                pass
-            else:
-                _cas_from_name_dict[name] = CAS
+            for i in store.arrays[self.index + ' strings']:
+                yield store.string(i)
+
+    def __len__(self):
+        return len(self.store.arrays[self.index + (' index' if self.index == 'pubchem' else ' hashes')])
+
+    def items(self):
+        store = self.store
+        rows = store.arrays[self.index + (' index rows' if self.index == 'pubchem' else ' rows')]
+        CASs = [store.field(row, _CAS) for row in rows]
+        return list(zip(self, CASs))
+
+
+class _PubChemRecords(Mapping):
+    # Read-only dict of the identifiers of each chemical by CAS number; each
+    # record is made when accessed
+    def __init__(self, store):
+        self.store = store
+
+    def __getitem__(self, CASRN):
+        store = self.store
+        row = store.row(CASRN)
+        return {'Pubchem ID': int(store.pubchem[row]), 'formula': store.field(row, _FORMULA),
+                'MW': float(store.MW[row]), 'SMILES': store.field(row, _SMILES),
+                'InChI': store.field(row, _INCHI), 'InChI Key': store.field(row, _INCHIKEY),
+                'IUPAC name': store.field(row, _IUPAC), 'common name': store.field(row, _COMMON),
+                'Names': store.names(row)}
+
+    def __iter__(self):
+        return iter(self.store.column(_CAS))
 
-        pubchem_dict[CAS] = {'Pubchem ID': pubchemid, 'formula': formula,
-        'MW': mw, 'SMILES': smiles, 'InChI': inchi, 'InChI Key': inchikey,
-        'IUPAC name': iupac_name, 'common name': common_name, 'Names': allnames}
-#        _pubchem_info(int(pubchemid), formula, float(mw), smiles, inchi, inchikey, iupac_name, common_name, allnames)
+    def __len__(self):
+        return len(self.store)
 
-del pubchemid, formula, mw, smiles, inchi, inchikey, iupac_name, \
-    common_name, allnames, name, line, f, CAS, values
-#print len(_cas_from_name_dict)/float(len(_cas_from_pubchem_dict))
-#print _cas_from_name_dict['Water'.lower()]
-#print _pubchem_dict['7732-18-5']
 
+_identifiers = _IdentifierStore(_load_identifiers())
+
+_cas_from_pubchem_dict = _CASLookup(_identifiers, 'pubchem')
+_cas_from_smiles_dict = _CASLookup(_identifiers, 'SMILES')
+_cas_from_inchi_dict = _CASLookup(_identifiers, 'InChI')
+_cas_from_inchikey_dict = _CASLookup(_identifiers, 'InChI Key')
+_cas_from_name_dict = _CASLookup(_identifiers, 'name')
+_cas_from_iupacname_dict = _CASLookup(_identifiers, 'IUPAC name')
+_cas_from_normalized_dict = _CASLookup(_identifiers, 'normalized')
+
+pubchem_dict = _PubChemRecords(_identifiers)
+
+
+# The most recently used identifiers and their CAS numbers, least recent first
+_CASfromAny_cache = OrderedDict()
+_CASfromAny_cache_size = 65536
 
 def CASfromAny(ID):
     '''Input must be string
     First check if input is InChI, best defined format
     TODO: if int, format as rest-2digits-1digit and see if in dict. All CASs are in there.
+
+    Names not found as given are looked up last by their normalized form;
+    see :obj:`normalize_name`. Results are cached.
     '''
+    try:
+        CASRN = _CASfromAny_cache.pop(ID)
+    except KeyError:
+        CASRN = _CASfromAny(ID)
+        if len(_CASfromAny_cache) >= _CASfromAny_cache_size:
+            _CASfromAny_cache.popitem(last=False)
+    _CASfromAny_cache[ID] = CASRN
+    return CASRN
+
+
+def _CASfromAny(ID):
     CASRN = None
     ID = ID.strip()
     if checkCAS(ID):
 #        print 'CAS'
         try:
-            a = pubchem_dict[ID]
+            _identifiers.row(ID)
             CASRN = ID
         except:
             try:
@@ -197,11 +490,36 @@ def CASfromAny(ID):
                     ID = ID.replace('-', '')
                     CASRN = _cas_from_name_dict[ID.lower()]
                 except:
-                    CASRN = None
+                    CASRN = _cas_from_normalized_dict.get(normalize_name(ID))
 #            raise Exception('Not Found')
     return CASRN
 
 
+def CASfromAny_many(IDs):
+    '''Resolves many identifiers to CAS numbers, as :obj:`CASfromAny`; each
+    distinct identifier is resolved only once. Identifiers which are not
+    recognized, or are not strings, give None.
+
+    >>> CASfromAny_many(['water', 'Ethanol', 'water', 'not a chemical name', None])
+    ['7732-18-5', '64-17-5', '7732-18-5', None, None]
+    '''
+    resolved = {}
+    CASRNs = []
+    for ID in IDs:
+        try:
+            CASRN = resolved[ID]
+        except KeyError:
+            try:
+                CASRN = CASfromAny(ID)
+            except:
+                CASRN = None
+            resolved[ID] = CASRN
+        except TypeError:
+            CASRN = None
+        CASRNs.append(CASRN)
+    return CASRNs
+
+
 
 
 
@@ -234,7 +552,7 @@ def PubChem(CASRN):
     .. [1] Pubchem.
 
     '''
-    pubchem = pubchem_dict[CASRN]['Pubchem ID']
+    pubchem = int(_identifiers.pubchem[_identifiers.row(CASRN)])
     return pubchem
 
 
@@ -266,7 +584,7 @@ def MW(CASRN):
     .. [1] Pubchem.
     '''
 
-    MolecularWeight = pubchem_dict[CASRN]['MW']
+    MolecularWeight = float(_identifiers.MW[_identifiers.row(CASRN)])
     return MolecularWeight
 
 
@@ -275,7 +593,7 @@ def formula(CASRN):
     >>> formula('7732-18-5')
     'H2O'
     '''
-    Formula = pubchem_dict[CASRN]['formula']
+    Formula = _identifiers.field(_identifiers.row(CASRN), _FORMULA)
     return Formula
 
 
@@ -284,7 +602,7 @@ def smiles(CASRN):
     >>> smiles('7732-18-5')
     'O'
     '''
-    Smiles = pubchem_dict[CASRN]['SMILES']
+    Smiles = _identifiers.field(_identifiers.row(CASRN), _SMILES)
     return Smiles
 
 
@@ -293,7 +611,7 @@ def InChI(CASRN):
     >>> InChI('7732-18-5')
     'H2O/h1H2'
     '''
-    inchi = pubchem_dict[CASRN]['InChI']
+    inchi = _identifiers.field(_identifiers.row(CASRN), _INCHI)
     return inchi
 
 
@@ -302,7 +620,7 @@ def InChI_Key(CASRN):
     >>> InChI_Key('7732-18-5')
     'XLYOFNOQVPJJNP-UHFFFAOYSA-N'
     '''
-    inchikey = pubchem_dict[CASRN]['InChI Key']
+    inchikey = _identifiers.field(_identifiers.row(CASRN), _INCHIKEY)
     return inchikey
 
 
@@ -311,7 +629,7 @@ def IUPAC_name(CASRN):
     >>> IUPAC_name('7732-18-5')
     'oxidane'
     '''
-    iupac_name = pubchem_dict[CASRN]['IUPAC name']
+    iupac_name = _identifiers.field(_identifiers.row(CASRN), _IUPAC)
     return iupac_name
 
 def name(CASRN):
@@ -319,7 +637,7 @@ def name(CASRN):
     >>> name('7732-18-5')
     'water'
     '''
-    common_name = pubchem_dict[CASRN]['common name']
+    common_name = _identifiers.field(_identifiers.row(CASRN), _COMMON)
     return common_name
 
 
@@ -328,7 +646,7 @@ def synonyms(CASRN):
     >>> synonyms('98-00-0')
     ['furan-2-ylmethanol', 'furfuryl alcohol', '2-furanmethanol', '2-furancarbinol', '2-furylmethanol', '2-furylcarbinol', '98-00-0', '2-furanylmethanol', 'furfuranol', 'furan-2-ylmethanol', '2-furfuryl alcohol', '5-hydroxymethylfuran', 'furfural alcohol', 'alpha-furylcarbinol', '2-hydroxymethylfuran', 'furfuralcohol', 'furylcarbinol', 'furyl alcohol', '2-(hydroxymethyl)furan', 'furan-2-yl-methanol', 'furfurylalcohol', 'furfurylcarb', 'methanol, (2-furyl)-', '2-furfurylalkohol', 'furan-2-methanol', '2-furane-methanol', '2-furanmethanol, homopolymer', '(2-furyl)methanol', '2-hydroxymethylfurane', 'furylcarbinol (van)', '2-furylmethan-1-ol', '25212-86-6', '93793-62-5', 'furanmethanol', 'polyfurfuryl alcohol', 'pffa', 'poly(furfurylalcohol)', 'poly-furfuryl alcohol', '(fur-2-yl)methanol', '.alpha.-furylcarbinol', '2-hydroxymethyl-furan', 'poly(furfuryl alcohol)', '.alpha.-furfuryl alcohol', 'agn-pc-04y237', 'h159', 'omega-hydroxypoly(furan-2,5-diylmethylene)', '(2-furyl)-methanol (furfurylalcohol)', '40795-25-3', '88161-36-8']
     '''
-    _synonyms = pubchem_dict[CASRN]['Names']
+    _synonyms = _identifiers.names(_identifiers.row(CASRN))
     return _synonyms
 
 
@@ -357,7 +675,32 @@ with open(os.path.join(folder, 'Mixtures Compositions.csv')) as f:
                                "Names": _names, "ws": _ws, "zs": _zs,
                                "Synonyms": _syns}
 
+# Inverted indexes of the synonyms of the mixtures, built once; each synonym
+# gives the first mixture in the file with it. Normalized synonyms shared by
+# different mixtures are left out.
+_mixture_order = {}
+_mixture_synonyms = {}
+_mixture_normalized = {}
+_ambiguous = set()
+for _name in _MixtureDict:
+    _mixture_order[_name] = len(_mixture_order)
+    for _syn in _MixtureDict[_name]["Synonyms"]:
+        _mixture_synonyms.setdefault(_syn, _name)
+        if _mixture_normalized.setdefault(normalize_name(_syn), _name) != _name:
+            _ambiguous.add(normalize_name(_syn))
+for _syn in _ambiguous:
+    del _mixture_normalized[_syn]
+del _ambiguous
+
 def mixture_from_any(ID):
+    '''Looks up a mixture by any of its synonyms, ignoring case, or with its
+    spaces or dashes removed, or at last by its normalized form (see
+    :obj:`normalize_name`); returns the name of the mixture, a key of
+    `_MixtureDict`, or None if it is not found.
+
+    >>> mixture_from_any('R-410A')
+    'R410A'
+    '''
     if type(ID) == type([]):
         if len(ID) == 1:
             ID = ID[0]
@@ -368,10 +711,30 @@ def mixture_from_any(ID):
     ID2 = ID.replace(' ', '')
     ID3 = ID.replace('-', '')
 
-    for i in _MixtureDict:
-        d = _MixtureDict[i]["Synonyms"]
-        if ID in d or ID2 in d or ID3 in d:
-            return i
+    # The first mixture matching any of the forms
+    found = [_mixture_synonyms[i] for i in (ID, ID2, ID3) if i in _mixture_synonyms]
+    if found:
+        return min(found, key=_mixture_order.get)
+    return _mixture_normalized.get(normalize_name(ID))
+
+
+def mixture_from_any_many(IDs):
+    '''Looks up many mixtures, as :obj:`mixture_from_any`, returning for
+    each the record of the mixture in `_MixtureDict`, with its CAS numbers
+    `CASs` and mass and mole fractions `ws` and `zs` already parsed, or None
+    if it is not found or not a string.
+
+    >>> [i['CASs'] if i else None for i in mixture_from_any_many(['air', 'water'])]
+    [['7727-37-9', '7440-37-1', '7782-44-7'], None]
+    '''
+    records = []
+    for ID in IDs:
+        try:
+            name = mixture_from_any(ID)
+        except:
+            name = None
+        records.append(_MixtureDict[name] if name else None)
+    return records
 
 # TODO LIST OF REFRIGERANTS FOR USE IN HEAT TRANSFER CORRELATIONS
 
@@ -27,7 +27,7 @@ from math import log, exp
 
 from thermo.utils import mixing_simple, none_and_length_check
 from scipy.constants import N_A, k
-from thermo.miscdata import _VDISaturationDict, VDI_tabular_data
+from thermo.miscdata import _VDISaturationDict, VDI_tabular_arrays
 import pandas as pd
 from thermo.utils import TDependentProperty
 
@@ -768,10 +768,10 @@ class SurfaceTension(TDependentProperty):
             Tmins.append(self.SOMAYAJULU_Tt); Tmaxs.append(self.SOMAYAJULU_Tc)
         if self.CASRN in _VDISaturationDict:
             methods.append(VDI_TABULAR)
-            Ts, props = VDI_tabular_data(self.CASRN, 'sigma')
-            self.VDI_Tmin = Ts[0]
-            self.VDI_Tmax = Ts[-1]
-            self.tabular_data[VDI_TABULAR] = (Ts, props)
+            Ts, props = VDI_data = VDI_tabular_arrays(self.CASRN, 'sigma')
+            self.VDI_Tmin = float(Ts[0])
+            self.VDI_Tmax = float(Ts[-1])
+            self.tabular_data[VDI_TABULAR] = VDI_data
             Tmins.append(self.VDI_Tmin); Tmaxs.append(self.VDI_Tmax)
         if self.CASRN in Jasper_Lange_data.index:
             methods.append(JASPER)
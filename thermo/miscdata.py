@@ -22,9 +22,9 @@ SOFTWARE.'''
 
 from __future__ import division
 import os
-import copy
+import numpy as np
 import pandas as pd
-from thermo.utils import to_num, rho_to_Vm
+from thermo.utils import rho_to_Vm, SharedTabularData
 
 folder = os.path.join(os.path.dirname(__file__), 'Misc')
 
@@ -40,49 +40,96 @@ CRC_organic_data = pd.read_csv(os.path.join(folder,
 
 ### VDI Saturation
 
-emptydict = {"Name": None, "MW": None, "Tc": None, "T": [], "P": [],
-             "Density (l)": [], "Density (g)": [], "Hvap": [], "Cp (l)": [],
-            "Cp (g)": [], "Mu (l)": [], "Mu (g)": [], "K (l)": [], "K (g)": [],
-            "Pr (l)": [], "Pr (g)": [], "sigma": [], "Beta": [],
-            "Volume (l)": [], "Volume (g)": []}
-
-# After some consideration, it has been devided to keep this load method as is.
+# Columns of the file after the CAS number, name, MW and Tc
+_VDI_columns = ["T", "P", "Density (l)", "Density (g)", "Hvap", "Cp (l)",
+                "Cp (g)", "Mu (l)", "Mu (g)", "K (l)", "K (g)", "Pr (l)",
+                "Pr (g)", "sigma", "Beta"]
 
 _VDISaturationDict = {}
-with open(os.path.join(folder, 'VDI Saturation Compounds Data.csv')) as f:
+def _load_VDI_saturation():
     '''Read in a dict of assorted chemical properties at saturation for 58
     industrially important chemicals, from:
-    Gesellschaft, V. D. I., ed. VDI Heat Atlas. 2E. Berlin : Springer, 2010.
+    Gesellschaft, V. D. I., ed. VDI Heat Atlas. 2E. Berlin : Springer, 2010.
     This listing is the successor to that in:
     Schlunder, Ernst U, and International Center for Heat and Mass Transfer.
     Heat Exchanger Design Handbook. Washington: Hemisphere Pub. Corp., 1983.
+
+    Each property of a chemical is a read-only array over its temperatures,
+    with NaN where a value is missing.
     '''
-    next(f)
-    for line in f:
-        values = to_num(line.strip('\n').split('\t'))
-        (CASRN, _name, _MW, _Tc, T, P, rhol, rhog, Hvap, cpl, cpg, mul, mug, kl, kg, prl, prg, sigma, Beta) = values
-        newdict = (_VDISaturationDict[CASRN] if CASRN in _VDISaturationDict else copy.deepcopy(emptydict))
-        newdict["Name"] = _name
-        newdict["MW"] = _MW
-        newdict["Tc"] = _Tc
-        newdict["T"].append(T)
-        newdict["P"].append(P)
-        newdict["Density (l)"].append(rhol)
-        newdict["Density (g)"].append(rhog)  # Not actually used
-        newdict["Hvap"].append(Hvap)
-        newdict["Cp (l)"].append(cpl)  # Molar
-        newdict["Cp (g)"].append(cpg)  # Molar
-        newdict["Mu (l)"].append(mul)
-        newdict["Mu (g)"].append(mug)
-        newdict["K (l)"].append(kl)
-        newdict["K (g)"].append(kg)
-        newdict["Pr (l)"].append(prl)
-        newdict["Pr (g)"].append(prl)
-        newdict["sigma"].append(sigma)
-        newdict["Beta"].append(Beta)
-        newdict["Volume (l)"].append(rho_to_Vm(rhol, _MW))
-        newdict["Volume (g)"].append(rho_to_Vm(rhog, _MW))
-        _VDISaturationDict[CASRN] = newdict
+    df = pd.read_csv(os.path.join(folder, 'VDI Saturation Compounds Data.csv'),
+                     sep='\t', float_precision='round_trip')
+    CASRNs = df.iloc[:, 0].values
+    names = df.iloc[:, 1].values
+    MWs, Tcs = df.iloc[:, 2].values, df.iloc[:, 3].values
+    values = df.iloc[:, 4:].values.astype(float)
+    for CASRN, rows in pd.Series(CASRNs).groupby(CASRNs, sort=False).indices.items():
+        i, MW = rows[0], MWs[rows[0]]
+        d = {"Name": names[i].strip(), "MW": MW, "Tc": Tcs[i]}
+        for column, prop in enumerate(_VDI_columns):
+            d[prop] = values[rows, column]
+        d["Pr (g)"] = d["Pr (l)"]  # Pr (g) has always been read from the Pr (l) column
+        d["Volume (l)"] = np.array([rho_to_Vm(rho, MW) for rho in d["Density (l)"]])
+        d["Volume (g)"] = np.array([rho_to_Vm(rho, MW) for rho in d["Density (g)"]])
+        for prop in d:
+            if isinstance(d[prop], np.ndarray):
+                d[prop].flags.writeable = False
+        _VDISaturationDict[CASRN] = d
+
+_load_VDI_saturation()
+
+_VDI_tables = {}
+
+def VDI_tabular_arrays(CASRN, prop):
+    r'''This function retrieves the tabular data available for a given chemical
+    and a given property as arrays, as :obj:`VDI_tabular_data` does. The
+    data set of each chemical and property is created once, and is shared
+    by every property object using it along with its interpolators; see
+    :obj:`thermo.utils.SharedTabularData`. The arrays are read-only.
+
+    Parameters
+    ----------
+    CASRN : string
+        CASRN [-]
+    prop : string
+        Property [-]
+
+    Returns
+    -------
+    data : SharedTabularData
+        Temperatures where property data is available, [K] and properties at
+        each temperature, [various]
+
+    Examples
+    --------
+    >>> Ts, props = VDI_tabular_arrays('67-56-1', 'Mu (g)')
+    >>> Ts
+    array([337.63, 360.  , 385.  , 410.  , 435.  , 460.  , 500.  ])
+    >>> VDI_tabular_arrays('67-56-1', 'Mu (g)') is VDI_tabular_arrays('67-56-1', 'Mu (g)')
+    True
+    '''
+    try:
+        return _VDI_tables[(CASRN, prop)]
+    except KeyError:
+        pass
+    try:
+        d = _VDISaturationDict[CASRN]
+    except KeyError:
+        raise Exception('CASRN not in VDI tabulation')
+    try:
+        props, Ts = d[prop], d['T']
+    except:
+        raise Exception('Proprty not specified correctly')
+    valid = ~np.isnan(props) & (props != 0)
+    Ts, props = Ts[valid], props[valid]
+
+    # Not all data series convererge to correct values
+    if prop == 'sigma':
+        Ts = np.append(Ts, d['Tc'])
+        props = np.append(props, 0.)
+    Ts.flags.writeable = props.flags.writeable = False
+    data = _VDI_tables[(CASRN, prop)] = SharedTabularData(Ts, props)
+    return data
 
 
 def VDI_tabular_data(CASRN, prop):
@@ -125,22 +172,8 @@ def VDI_tabular_data(CASRN, prop):
     ----------
     .. [1] Gesellschaft, VDI, ed. VDI Heat Atlas. 2E. Berlin : Springer, 2010.
     '''
-    try:
-        d = _VDISaturationDict[CASRN]
-    except KeyError:
-        raise Exception('CASRN not in VDI tabulation')
-    try:
-        props, Ts = d[prop], d['T']
-    except:
-        raise Exception('Proprty not specified correctly')
-    Ts = [T for p, T in zip(props, Ts) if p]
-    props = [p for p in props if p]
-
-    # Not all data series convererge to correct values
-    if prop == 'sigma':
-        Ts.append(d['Tc'])
-        props.append(0)
-    return Ts, props
+    Ts, props = VDI_tabular_arrays(CASRN, prop)
+    return Ts.tolist(), props.tolist()
 #print VDI_tabular_data('67-56-1', 'Mu (g)')
 # Mercury surface tension is missing.
 
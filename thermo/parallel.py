@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.'''
+
+from __future__ import division
+
+__all__ = ['tabulate', 'tabulate_chunks']
+
+from math import ceil
+from time import time
+import multiprocessing
+import pandas as pd
+# Importing Chemical loads all of the databanks in this process; with the
+# fork start method, worker processes share them instead of loading them again
+from thermo.chemical import Chemical
+
+
+def _tabulate_chunk(task):
+    # Evaluates one chunk of chemicals; run in the worker processes. A
+    # chemical which cannot be created, or a temperature at which it cannot be
+    # evaluated, gives a row of None.
+    CASRNs, Ts, props, P = task
+    start = time()
+    rows = []
+    for CASRN in CASRNs:
+        try:
+            chem = Chemical(CASRN, T=Ts[0], P=P)
+        except:
+            chem = None
+        for i, T in enumerate(Ts):
+            if chem is not None:
+                try:
+                    # The object was created at the first temperature; the
+                    # methods are reset so each row matches a new object
+                    if i:
+                        chem.reset_T_methods()
+                        chem.set_T(T)
+                except:
+                    pass
+                else:
+                    rows.append([getattr(chem, prop) for prop in props])
+                    continue
+            rows.append([None]*len(props))
+    return rows, time() - start
+
+
+def _pool(workers):
+    try:
+        context = multiprocessing.get_context('fork')
+    except (AttributeError, ValueError):  # pragma: no cover
+        # Python 2, or platforms without fork; each worker loads the
+        # databanks once when it starts
+        context = multiprocessing
+    return context.Pool(workers)
+
+
+def tabulate_chunks(CASRNs, Ts, props, P=101325., workers=None, chunksize=None):
+    r'''Evaluates properties of many chemicals over a range of temperatures
+    in parallel, as a generator. The chemicals are split into chunks, which
+    are evaluated by a pool of worker processes; the results of each chunk
+    are yielded in order, as soon as they and all previous chunks are
+    complete.
+
+    Each chemical is created once as a :obj:`thermo.chemical.Chemical`, and
+    evaluated at each temperature with its `set_T` method. On platforms
+    supporting it, the workers are forked from the current process, and so
+    share the databanks already loaded in it rather than loading them again.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CAS numbers (or any other identifiers) of the chemicals
+    Ts : list[float]
+        Temperatures at which to evaluate each chemical, [K]
+    props : list[str]
+        Names of the attributes of `Chemical` to tabulate, i.e. 'rhol'
+    P : float, optional
+        Pressure at which to evaluate the chemicals, [Pa]
+    workers : int, optional
+        Number of worker processes; all processors are used if not provided.
+        With 1 or fewer, the chunks are evaluated in this process.
+    chunksize : int, optional
+        Number of chemicals in each chunk; by default the chemicals are split
+        into about four chunks per worker, of up to 50 chemicals each
+
+    Yields
+    ------
+    CASRNs : list[str]
+        Identifiers of the chemicals in the chunk
+    rows : list[list]
+        Values of `props` for each chemical of the chunk at each temperature;
+        None where they could not be calculated
+    elapsed : float
+        Time taken by the worker to evaluate the chunk, [s]
+    '''
+    CASRNs, Ts, props = list(CASRNs), [float(T) for T in Ts], list(props)
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    if chunksize is None:
+        chunksize = max(1, min(50, int(ceil(len(CASRNs)/(4.*max(workers, 1))))))
+    tasks = [(CASRNs[i:i+chunksize], Ts, props, P)
+             for i in range(0, len(CASRNs), chunksize)]
+    if workers <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            rows, elapsed = _tabulate_chunk(task)
+            yield task[0], rows, elapsed
+        return
+
+    pool = _pool(min(workers, len(tasks)))
+    try:
+        for task, (rows, elapsed) in zip(tasks, pool.imap(_tabulate_chunk, tasks)):
+            yield task[0], rows, elapsed
+        pool.close()
+    finally:
+        # Also stops the workers if the generator is not exhausted
+        pool.terminate()
+        pool.join()
+
+
+def tabulate(CASRNs, Ts, props, P=101325., workers=None, chunksize=None,
+             callback=None):
+    r'''Evaluates properties of many chemicals over a range of temperatures
+    in parallel, and returns them as a DataFrame indexed by identifier and
+    temperature. See :obj:`tabulate_chunks`, which this function collects
+    the results of, for the details.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CAS numbers (or any other identifiers) of the chemicals
+    Ts : list[float]
+        Temperatures at which to evaluate each chemical, [K]
+    props : list[str]
+        Names of the attributes of `Chemical` to tabulate, i.e. 'rhol'
+    P : float, optional
+        Pressure at which to evaluate the chemicals, [Pa]
+    workers : int, optional
+        Number of worker processes; all processors are used if not provided
+    chunksize : int, optional
+        Number of chemicals in each chunk
+    callback : callable, optional
+        Called with the identifiers of each chunk and the time taken to
+        evaluate it, [s], as the chunks complete; for reporting progress
+
+    Returns
+    -------
+    df : DataFrame
+        Properties, one column for each of `props`, and one row for each
+        chemical at each temperature; NaN where they could not be calculated
+
+    Examples
+    --------
+    >>> tabulate(['7732-18-5', '64-17-5'], [300., 350.], ['MW', 'Tc'], workers=1) # doctest: +NORMALIZE_WHITESPACE
+                            MW      Tc
+    CAS       T, K
+    7732-18-5 300.0  18.01528  647.14
+              350.0  18.01528  647.14
+    64-17-5   300.0  46.06844  514.00
+              350.0  46.06844  514.00
+    '''
+    CASRNs, Ts = list(CASRNs), [float(T) for T in Ts]
+    all_rows = []
+    for chunk, rows, elapsed in tabulate_chunks(CASRNs, Ts, props, P=P,
+                                                workers=workers,
+                                                chunksize=chunksize):
+        if callback is not None:
+            callback(chunk, elapsed)
+        all_rows.extend(rows)
+    index = pd.MultiIndex.from_product([CASRNs, Ts], names=['CAS', 'T, K'])
+    return pd.DataFrame(all_rows, index=index, columns=list(props))
@@ -29,11 +29,11 @@ import numpy as np
 import pandas as pd
 
 from thermo.miscdata import CRC_organic_data, CRC_inorganic_data
-from thermo.miscdata import _VDISaturationDict, VDI_tabular_data
+from thermo.miscdata import _VDISaturationDict, VDI_tabular_arrays
 from thermo.utils import property_molar_to_mass, mixing_simple, none_and_length_check, TDependentProperty
 from thermo.vapor_pressure import VaporPressure
 
-from thermo.coolprop import has_CoolProp, PropsSI, coolprop_dict, coolprop_fluids
+from thermo.coolprop import has_CoolProp, coolprop_dict, coolprop_fluids, CoolProp_saturation
 
 
 folder = os.path.join(os.path.dirname(__file__), 'Phase Change')
@@ -1074,10 +1074,10 @@ class EnthalpyVaporization(TDependentProperty):
             Tmins.append(self.CP_f.Tt); Tmaxs.append(self.CP_f.Tc)
         if self.CASRN in _VDISaturationDict:
             methods.append(VDI_TABULAR)
-            Ts, props = VDI_tabular_data(self.CASRN, 'Hvap')
-            self.VDI_Tmin = Ts[0]
-            self.VDI_Tmax = Ts[-1]
-            self.tabular_data[VDI_TABULAR] = (Ts, props)
+            Ts, props = VDI_data = VDI_tabular_arrays(self.CASRN, 'Hvap')
+            self.VDI_Tmin = float(Ts[0])
+            self.VDI_Tmax = float(Ts[-1])
+            self.tabular_data[VDI_TABULAR] = VDI_data
             Tmins.append(self.VDI_Tmin); Tmaxs.append(self.VDI_Tmax)
         if self.CASRN in CRCHvap_data.index and not np.isnan(CRCHvap_data.at[self.CASRN, 'HvapTb']):
             methods.append(CRC_HVAP_TB)
@@ -1122,7 +1122,8 @@ class EnthalpyVaporization(TDependentProperty):
             Heat of vaporization of the liquid at T, [J/mol]
         '''
         if method == COOLPROP:
-            Hvap = PropsSI('HMOLAR', 'T', T, 'Q', 1, self.CASRN) - PropsSI('HMOLAR', 'T', T, 'Q', 0, self.CASRN)
+            Hl, Hg = CoolProp_saturation(T, self.CASRN, 'HMOLAR')
+            Hvap = Hg - Hl
         # CSP methods
         elif method == MORGAN_KOBAYASHI:
             Hvap = MK(T, self.Tc, self.omega)
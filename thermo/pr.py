@@ -21,15 +21,38 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.'''
 
 from __future__ import division
-from scipy.constants import R
-from scipy.optimize import fsolve
-from numpy import roots
-from math import log, exp
+from math import sqrt, cos, acos, pi, copysign, log
+import numpy as np
 
 R = 8.3145
 
+def kappa(omega):
+    r'''Calculates the `kappa` parameter of the Peng-Robinson alpha function
+    from a component's acentric factor. It does not depend on temperature,
+    so it can be computed once per component.
+
+    .. math::
+        \kappa = 0.37464 + 1.54226\omega - 0.26992\omega^2
+
+    Parameters
+    ----------
+    omega : float
+        Acentric factor, [-]
+
+    Returns
+    -------
+    kappa : float
+        Peng-Robinson alpha function parameter, [-]
+
+    Examples
+    --------
+    >>> kappa(0.251)
+    0.74474203008
+    '''
+    return 0.37464 + 1.54226*omega - 0.26992*omega*omega
+
 def alpha(omega,Tr):  # pragma: no cover
-    return (1+(0.37464+1.54226*omega-0.26992*omega**2)*(1-Tr**0.5))**2
+    return (1+kappa(omega)*(1-Tr**0.5))**2
 
 def a(Tc, Pc):  # pragma: no cover
     a_calc = 0.45724*(R*Tc)**2/Pc
@@ -52,20 +75,399 @@ def A(T, P, Tc, Pc, omega):  # pragma: no cover
     A_calc = a_alpha(T, Tc, Pc, omega)*P/(R*T)**2
     return A_calc
 
+
+def cubic_roots_min_max(c2, c1, c0):
+    r'''Solves the monic cubic :math:`x^3 + c_2x^2 + c_1x + c_0 = 0`
+    analytically and returns its smallest and largest real roots. If there
+    is only one real root, it is returned twice. Cardano's formula is used
+    when there is one real root, and the trigonometric form when there are
+    three. Each root is then polished with one Newton step on the original
+    polynomial, which removes the round-off of the closed form.
+
+    .. math::
+        p = c_1 - \frac{c_2^2}{3}
+
+        q = \frac{2c_2^3}{27} - \frac{c_2 c_1}{3} + c_0
+
+        D = \left(\frac{q}{2}\right)^2 + \left(\frac{p}{3}\right)^3
+
+    Parameters
+    ----------
+    c2 : float
+        Coefficient of the squared term, [-]
+    c1 : float
+        Coefficient of the linear term, [-]
+    c0 : float
+        Constant term, [-]
+
+    Returns
+    -------
+    x_min : float
+        Smallest real root, [-]
+    x_max : float
+        Largest real root, [-]
+
+    Notes
+    -----
+    Much faster than `numpy.roots`, which computes the eigenvalues of the
+    companion matrix.
+
+    Examples
+    --------
+    >>> cubic_roots_min_max(-6., 11., -6.)
+    (1.0000000000000002, 3.0)
+    '''
+    shift = c2/3.
+    p = c1 - c2*shift
+    q = (2./27.)*c2*c2*c2 - shift*c1 + c0
+    D = 0.25*q*q + p*p*p/27.
+    if D > 0.:
+        u = -0.5*q - copysign(sqrt(D), q)
+        u = copysign(abs(u)**(1./3.), u)
+        roots = [u - p/(3.*u) - shift]
+    elif p == 0.:
+        roots = [copysign(abs(q)**(1./3.), -q) - shift]
+    else:
+        m = 2.*sqrt(-p/3.)
+        arg = 3.*q/(p*m)
+        arg = 1. if arg > 1. else (-1. if arg < -1. else arg)
+        theta = acos(arg)/3.
+        roots = [m*cos(theta - 4.*pi/3.) - shift, m*cos(theta) - shift]
+    polished = []
+    for x in roots:
+        f = ((x + c2)*x + c1)*x + c0
+        df = (3.*x + 2.*c2)*x + c1
+        if df != 0.:
+            x -= f/df
+        polished.append(x)
+    return polished[0], polished[-1]
+
+
+def cubic_roots_min_max_array(c2, c1, c0):
+    r'''Vectorized version of :obj:`cubic_roots_min_max`, accepting arrays of
+    coefficients and returning arrays of the smallest and largest real roots
+    of each cubic. Both closed forms are evaluated for every element and the
+    applicable one is selected, so there is no Python-level loop.
+
+    Parameters
+    ----------
+    c2 : array-like
+        Coefficients of the squared term, [-]
+    c1 : array-like
+        Coefficients of the linear term, [-]
+    c0 : array-like
+        Constant terms, [-]
+
+    Returns
+    -------
+    x_min : ndarray
+        Smallest real roots, [-]
+    x_max : ndarray
+        Largest real roots, [-]
+
+    Examples
+    --------
+    >>> cubic_roots_min_max_array([-7., -1.], [14., 1.], [-8., -1.])
+    (array([1., 1.]), array([4., 1.]))
+    '''
+    c2, c1, c0 = np.broadcast_arrays(np.asarray(c2, dtype=float),
+                                     np.asarray(c1, dtype=float),
+                                     np.asarray(c0, dtype=float))
+    shift = c2/3.
+    p = c1 - c2*shift
+    q = (2./27.)*c2*c2*c2 - shift*c1 + c0
+    D = 0.25*q*q + p*p*p/27.
+    one_root = D > 0.
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Cardano's formula, one real root
+        u = np.cbrt(-0.5*q - np.copysign(np.sqrt(np.where(one_root, D, 0.)), q))
+        x_one = np.where(u != 0., u - p/(3.*u), np.cbrt(-q)) - shift
+        # Trigonometric form, three real roots
+        m = 2.*np.sqrt(np.where(one_root, 0., -p/3.))
+        arg = np.clip(np.where(m != 0., 3.*q/(p*m), 0.), -1., 1.)
+        theta = np.arccos(arg)/3.
+        x_min = np.where(one_root, x_one, m*np.cos(theta - 4.*pi/3.) - shift)
+        x_max = np.where(one_root, x_one, m*np.cos(theta) - shift)
+        for x in (x_min, x_max):
+            f = ((x + c2)*x + c1)*x + c0
+            df = (3.*x + 2.*c2)*x + c1
+            x -= np.where(df != 0., f/df, 0.)
+    return x_min, x_max
+
+
+def PR_Vm_roots(T, P, a, b, kappa, Tc):
+    r'''Calculates the liquid-like and vapor-like molar volume roots of the
+    Peng-Robinson equation of state from precomputed component parameters
+    `a`, `b`, and `kappa`. These do not depend on temperature or pressure,
+    so callers evaluating many states of one component should compute them
+    once. If `T` and `P` are both scalars, the pure-Python solver is used;
+    otherwise they are broadcast together and solved with NumPy.
+
+    .. math::
+        Z^3 - (1-B)Z^2 + (A - 3B^2 - 2B)Z - (AB - B^2 - B^3) = 0
+
+        A = \frac{a\alpha P}{(RT)^2}, \;\; B = \frac{bP}{RT}
+
+        \alpha = \left[1 + \kappa\left(1 - \sqrt{T/T_c}\right)\right]^2
+
+    Parameters
+    ----------
+    T : float or array-like
+        Temperature, [K]
+    P : float or array-like
+        Pressure, [Pa]
+    a : float
+        Peng-Robinson `a` parameter, as from :obj:`a`, [Pa*m^6/mol^2]
+    b : float
+        Peng-Robinson `b` parameter, as from :obj:`b`, [m^3/mol]
+    kappa : float
+        Peng-Robinson `kappa` parameter, as from :obj:`kappa`, [-]
+    Tc : float
+        Critical temperature, [K]
+
+    Returns
+    -------
+    Vml : float or ndarray
+        Molar volume of the smallest real root (liquid-like), [m^3/mol]
+    Vmg : float or ndarray
+        Molar volume of the largest real root (vapor-like), [m^3/mol]
+
+    Notes
+    -----
+    Where only one real root exists, it is returned as both `Vml` and `Vmg`.
+
+    Examples
+    --------
+    >>> PR_Vm_roots(305., 1E5, a(430.8, 7884098.25), b(430.8, 7884098.25),
+    ... kappa(0.251), 430.8)
+    (4.7026527116290734e-05, 0.0250244217720803)
+    '''
+    if not (hasattr(T, '__len__') or hasattr(P, '__len__')):
+        RT = R*T
+        x = 1. + kappa*(1. - sqrt(T/Tc))
+        A_calc = a*x*x*P/(RT*RT)
+        B_calc = b*P/RT
+        Zl, Zg = cubic_roots_min_max(B_calc - 1., A_calc - B_calc*(3.*B_calc + 2.),
+                                     -B_calc*(A_calc - B_calc*(B_calc + 1.)))
+        return Zl*RT/P, Zg*RT/P
+    T = np.asarray(T, dtype=float)
+    P = np.asarray(P, dtype=float)
+    RT = R*T
+    x = 1. + kappa*(1. - np.sqrt(T/Tc))
+    A_calc = a*x*x*P/(RT*RT)
+    B_calc = b*P/RT
+    Zl, Zg = cubic_roots_min_max_array(B_calc - 1., A_calc - B_calc*(3.*B_calc + 2.),
+                                       -B_calc*(A_calc - B_calc*(B_calc + 1.)))
+    return Zl*RT/P, Zg*RT/P
+
+
 # This is the function imported by density
-def PR_Vm(T, P, Tc, Pc, omega, phase=''):  # pragma: no cover
-    A_calc = A(T, P, Tc, Pc, omega)
-    B_calc = B(T, P, Tc, Pc)
-    coeffs = [1, -(1-B_calc), (A_calc-3*B_calc**2-2*B_calc), -(A_calc*B_calc-B_calc**2-B_calc**3)]
-    numpyroots = roots(coeffs)
-    liq_z = min(numpyroots)
-    gas_z = max(numpyroots)
-    liq = float(liq_z*R*T/P)
-    gas = float(gas_z*R*T/P)
+def PR_Vm(T, P, Tc, Pc, omega, phase=''):
+    r'''Calculates the molar volume of a pure component with the
+    Peng-Robinson equation of state. If `phase` is 'l' or 'g', only the
+    liquid or gas root is returned. Otherwise the gas root is returned above
+    the critical temperature or pressure, and both roots below it. `T` and `P`
+    may be arrays; then, if no phase is specified, both roots are returned as
+    arrays. See :obj:`PR_Vm_roots` for the formulas.
+
+    Parameters
+    ----------
+    T : float or array-like
+        Temperature, [K]
+    P : float or array-like
+        Pressure, [Pa]
+    Tc : float
+        Critical temperature, [K]
+    Pc : float
+        Critical pressure, [Pa]
+    omega : float
+        Acentric factor, [-]
+    phase : str, optional
+        'l' or 'g' to select a root, [-]
+
+    Returns
+    -------
+    Vm : float or ndarray or tuple
+        Molar volume(s) of the requested phase(s), [m^3/mol]
+
+    Examples
+    --------
+    >>> PR_Vm(305., 1E5, 430.8, 7884098.25, 0.251, phase='g')
+    0.0250244217720803
+    >>> PR_Vm([305., 400.], 1E5, 430.8, 7884098.25, 0.251, phase='g')
+    array([0.02502442, 0.03305664])
+    '''
+    liq, gas = PR_Vm_roots(T, P, a(Tc, Pc), b(Tc, Pc), kappa(omega), Tc)
     if phase=='liquid' or phase.lower( )== 'l':
-        soln = liq
-    elif phase=='gas' or phase.lower() == 'g' or T >= Tc or P > Pc:
-        soln = gas
-    else:
+        return liq
+    elif phase=='gas' or phase.lower() == 'g':
+        return gas
+    elif isinstance(liq, np.ndarray):
         return liq, gas
-    return soln
+    elif T >= Tc or P > Pc:
+        return gas
+    return liq, gas
+
+
+class PRMIX(object):
+    r'''Peng-Robinson equation of state for a mixture, with the van der Waals
+    one-fluid mixing rules and optional binary interaction parameters.
+    Everything which does not depend on temperature, pressure, or
+    composition is computed once on creation: the component `a`, `b`, and
+    `kappa` parameters and the matrix :math:`(1-k_{ij})\sqrt{a_i a_j}`.
+    Because the Peng-Robinson alpha function is a square, the temperature
+    dependence of every :math:`a\alpha_{ij}` reduces to a vector of
+    :math:`\sqrt{\alpha_i}`, so re-evaluating `a_alpha` at a new temperature
+    takes two matrix-vector products.
+
+    .. math::
+        a\alpha = \sum_i\sum_j z_i z_j (1-k_{ij})\sqrt{a_i a_j}
+        \sqrt{\alpha_i \alpha_j}
+
+        b = \sum_i z_i b_i
+
+    Call :obj:`solve` to compute the state; its results are stored as
+    attributes of the object, for both the liquid-like and vapor-like roots:
+
+    * `Z_l`, `Z_g`: compressibility factors, [-]
+    * `V_l`, `V_g`: molar volumes, [m^3/mol]
+    * `H_dep_l`, `H_dep_g`: departure enthalpies, [J/mol]
+    * `S_dep_l`, `S_dep_g`: departure entropies, [J/mol/K]
+    * `phis_l`, `phis_g`: component fugacity coefficients, [-]
+
+    Parameters
+    ----------
+    Tcs : list[float]
+        Critical temperatures of all components, [K]
+    Pcs : list[float]
+        Critical pressures of all components, [Pa]
+    omegas : list[float]
+        Acentric factors of all components, [-]
+    kijs : list[list[float]], optional
+        Binary interaction parameters; zero if not given, [-]
+
+    Notes
+    -----
+    Where only one real root exists, or the smallest root is not above `B`,
+    the liquid and gas attributes are the same.
+
+    .. math::
+        \frac{H^{dep}}{RT} = Z - 1 + \frac{T\frac{d(a\alpha)}{dT}
+        - a\alpha}{2\sqrt{2}bRT}\ln\left[\frac{Z + (1+\sqrt{2})B}
+        {Z + (1-\sqrt{2})B}\right]
+
+        \frac{S^{dep}}{R} = \ln(Z-B) + \frac{\frac{d(a\alpha)}{dT}}
+        {2\sqrt{2}bR}\ln\left[\frac{Z + (1+\sqrt{2})B}{Z + (1-\sqrt{2})B}
+        \right]
+
+        \ln \phi_i = \frac{b_i}{b}(Z-1) - \ln(Z-B) - \frac{A}{2\sqrt{2}B}
+        \left(\frac{2\sum_j z_j a\alpha_{ij}}{a\alpha} - \frac{b_i}{b}\right)
+        \ln\left[\frac{Z + (1+\sqrt{2})B}{Z + (1-\sqrt{2})B}\right]
+
+    Examples
+    --------
+    Methane and ethane, with a small interaction parameter:
+
+    >>> eos = PRMIX(Tcs=[190.56, 305.32], Pcs=[4599000., 4872000.],
+    ... omegas=[0.011, 0.098], kijs=[[0, 0.01], [0.01, 0]])
+    >>> eos.solve(T=250., P=1E6, zs=[0.7, 0.3])
+    >>> eos.V_g, eos.Z_g
+    (0.001948616170266075, 0.9374544086913584)
+    >>> eos.phis_g
+    array([0.96516859, 0.88385586])
+    '''
+    def __init__(self, Tcs, Pcs, omegas, kijs=None):
+        self.N = len(Tcs)
+        self.Tcs = np.array(Tcs, dtype=float)
+        self.Pcs = np.array(Pcs, dtype=float)
+        self.omegas = np.array(omegas, dtype=float)
+        if kijs is None:
+            kijs = np.zeros((self.N, self.N))
+        self.kijs = np.array(kijs, dtype=float)
+
+        self.ais = a(self.Tcs, self.Pcs)
+        self.bs = b(self.Tcs, self.Pcs)
+        self.kappas = kappa(self.omegas)
+        sqrt_ais = np.sqrt(self.ais)
+        self.a0_ijs = (1. - self.kijs)*np.outer(sqrt_ais, sqrt_ais)
+        self._kappas_sqrt_Tcs = self.kappas/np.sqrt(self.Tcs)
+
+    def a_alpha_and_derivative(self, T, zs):
+        r'''Calculates the mixture `a_alpha` term and its temperature
+        derivative. Also returns the vector
+        :math:`\sum_j z_j a\alpha_{ij}`, which the fugacity coefficients
+        need.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        zs : array-like
+            Mole fractions of all components, [-]
+
+        Returns
+        -------
+        a_alpha : float
+            Mixture `a_alpha` term, [Pa*m^6/mol^2]
+        da_alpha_dT : float
+            Temperature derivative of `a_alpha`, [Pa*m^6/mol^2/K]
+        a_alpha_js : ndarray
+            Composition-weighted sums of `a_alpha_ij` for each component,
+            [Pa*m^6/mol^2]
+        '''
+        sqrt_T = sqrt(T)
+        # Square roots of alpha, and their temperature derivatives
+        sqrt_alphas = 1. + self.kappas - self._kappas_sqrt_Tcs*sqrt_T
+        dsqrt_alphas_dT = -0.5*self._kappas_sqrt_Tcs/sqrt_T
+        z_sqrt_alphas = zs*sqrt_alphas
+        a0_z_sqrt_alphas = np.dot(self.a0_ijs, z_sqrt_alphas)
+        a_alpha_js = sqrt_alphas*a0_z_sqrt_alphas
+        a_alpha = np.dot(zs, a_alpha_js)
+        da_alpha_dT = 2.*np.dot(zs*dsqrt_alphas_dT, a0_z_sqrt_alphas)
+        return a_alpha, da_alpha_dT, a_alpha_js
+
+    def solve(self, T, P, zs):
+        r'''Solves the equation of state at the given temperature, pressure,
+        and composition. The results for both roots are stored as attributes;
+        see the class documentation.
+
+        Parameters
+        ----------
+        T : float
+            Temperature, [K]
+        P : float
+            Pressure, [Pa]
+        zs : list[float]
+            Mole fractions of all components, [-]
+        '''
+        zs = np.asarray(zs, dtype=float)
+        self.T, self.P, self.zs = T, P, zs
+        a_alpha, da_alpha_dT, a_alpha_js = self.a_alpha_and_derivative(T, zs)
+        b_mix = float(np.dot(zs, self.bs))
+        RT = R*T
+        A_calc = a_alpha*P/(RT*RT)
+        B_calc = b_mix*P/RT
+        self.a_alpha, self.da_alpha_dT, self.b = a_alpha, da_alpha_dT, b_mix
+        self.A, self.B = A_calc, B_calc
+
+        Z_l, Z_g = cubic_roots_min_max(B_calc - 1., A_calc - B_calc*(3.*B_calc + 2.),
+                                       -B_calc*(A_calc - B_calc*(B_calc + 1.)))
+        # At high reduced temperatures the smallest root can be below the
+        # covolume, where the fluid cannot exist; the largest root is always
+        # above it
+        if Z_l <= B_calc:
+            Z_l = Z_g
+        self.Z_l, self.Z_g = Z_l, Z_g
+        self.V_l, self.V_g = self.Z_l*RT/P, self.Z_g*RT/P
+
+        bs_b = self.bs/b_mix
+        phi_term = A_calc/(2.*sqrt(2.)*B_calc)*(2.*a_alpha_js/a_alpha - bs_b)
+        for phase, Z in (('l', self.Z_l), ('g', self.Z_g)):
+            log_term = log((Z + (1. + sqrt(2.))*B_calc)/(Z + (1. - sqrt(2.))*B_calc))
+            log_Z_B = log(Z - B_calc)
+            H_dep = RT*(Z - 1.) + (T*da_alpha_dT - a_alpha)/(2.*sqrt(2.)*b_mix)*log_term
+            S_dep = R*log_Z_B + da_alpha_dT/(2.*sqrt(2.)*b_mix)*log_term
+            phis = np.exp(bs_b*(Z - 1.) - log_Z_B - phi_term*log_term)
+            setattr(self, 'H_dep_' + phase, H_dep)
+            setattr(self, 'S_dep_' + phase, S_dep)
+            setattr(self, 'phis_' + phase, phis)
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Queries over the constants of every chemical in the databanks, such as all
+chemicals with a normal boiling point between 300 and 350 K, a critical
+temperature above 500 K, and which are not listed as carcinogens::
+
+    >>> CASRNs = query_constants(Tb=(300, 350), Tc=(500, None), logP=(None, 1),
+    ...                          Carcinogen=False)
+    >>> '67-64-1' in CASRNs # acetone
+    True
+'''
+
+from __future__ import division
+
+__all__ = ['ConstantIndex', 'query_constants']
+
+import numpy as np
+import pandas as pd
+from thermo.identifiers import checkCAS
+from thermo.safety import IARC_data, IARC_codes, NTP_data, NTP_codes, UNLISTED
+from thermo.bulk import constant_sources, constants_table, all_CASRNs
+
+
+# IARC groups 1, 2A and 2B; the NTP lists only known or reasonably
+# anticipated carcinogens
+_IARC_carcinogenic = (1, 11, 12)
+
+
+def _fingerprint():
+    # Cheap summary of the databanks the index is built from; it changes if
+    # any of them is replaced, resized, or has values changed in place
+    sources = []
+    frames = [(IARC_data, 'group'), (NTP_data, 'Listing')]
+    for name, name_sources in constant_sources.items():
+        sources.append((name, len(name_sources)))
+        frames.extend(source[:2] for source in name_sources if not isinstance(source, str))
+    for frame, column in frames:
+        if callable(frame):
+            frame = frame()
+        values = frame[column].values
+        sources.append((id(frame), id(frame.index), frame.shape,
+                        hash(values.tobytes()) if values.dtype.kind in 'fiub' else id(values)))
+    return tuple(sources)
+
+
+class ConstantIndex(object):
+    r'''Index over a table of the constants of many chemicals, for
+    answering compound queries with array operations only. The constants are
+    resolved with :obj:`thermo.bulk.constants_table`; for the carcinogen
+    status, the columns 'IARC' and 'NTP' hold the status strings of
+    :obj:`thermo.safety.Carcinogen`, and the column 'Carcinogen' is True for
+    chemicals in IARC groups 1, 2A or 2B or listed by the NTP.
+
+    Each numeric column is kept sorted, so a range is found by bisection;
+    each other column has the rows of each of its values. The index is
+    rebuilt when any of the databanks it was built from has changed, checked
+    before each query unless `auto_refresh` is False.
+
+    Parameters
+    ----------
+    CASRNs : list[str], optional
+        Chemicals to index; all of :obj:`thermo.bulk.all_CASRNs` and those
+        with a carcinogen listing if not provided
+    constants : list[str], optional
+        Constants to index, keys of :obj:`thermo.bulk.constant_sources`; all
+        of them if not provided
+    auto_refresh : bool, optional
+        Whether to check for changed data before each query
+
+    Examples
+    --------
+    >>> index = ConstantIndex(constants=['Tb', 'Tc'])
+    >>> list(index.query(Tb=(373.1, 373.2), Tc=(640, 650)))
+    ['7732-18-5']
+    '''
+    def __init__(self, CASRNs=None, constants=None, auto_refresh=True):
+        self.requested_CASRNs = None if CASRNs is None else list(CASRNs)
+        self.constants = list(constant_sources) if constants is None else list(constants)
+        self.auto_refresh = auto_refresh
+        self.fingerprint = None
+        self.refresh()
+
+    def refresh(self, force=False):
+        r'''Rebuilds the index if any of the data it was built from has
+        changed since, or if `force` is True; returns whether it was
+        rebuilt.'''
+        fingerprint = _fingerprint()
+        if not force and fingerprint == self.fingerprint:
+            return False
+        self.build()
+        self.fingerprint = fingerprint
+        return True
+
+    def build(self):
+        r'''Resolves the constants and builds the index of each column.'''
+        CASRNs = self.requested_CASRNs
+        if CASRNs is None:
+            listed = [CASRN for CASRN in IARC_data.index.union(NTP_data.index) if checkCAS(CASRN)]
+            CASRNs = set(all_CASRNs()).union(listed)
+        CASRNs = sorted(set(CASRNs))
+        table = constants_table(CASRNs, self.constants)
+        IARC_groups = IARC_data['group'].reindex(table.index)
+        NTP_listings = NTP_data['Listing'].reindex(table.index)
+        table['IARC'] = IARC_groups.map(IARC_codes).fillna(UNLISTED).values
+        table['NTP'] = NTP_listings.map(NTP_codes).fillna(UNLISTED).values
+        table['Carcinogen'] = (IARC_groups.isin(_IARC_carcinogenic) | NTP_listings.notnull()).values
+        self.table = table
+        self.CASRNs = np.array(table.index, dtype=object)
+
+        self.sorted = {}
+        self.groups = {}
+        for column in table.columns:
+            values = table[column].values
+            if values.dtype.kind == 'f':
+                order = np.argsort(values, kind='mergesort')
+                count = int((~np.isnan(values)).sum())
+                # NaNs are sorted last, and never match a range
+                self.sorted[column] = (values[order][:count], order[:count])
+            else:
+                self.groups[column] = {key: np.asarray(rows) for key, rows in
+                                       pd.Series(values).groupby(values).indices.items()}
+
+    def rows(self, column, condition):
+        r'''Returns the rows matching one condition on a column: a tuple
+        (low, high) of inclusive limits, either of which may be None; a list
+        or set of values, any of which matches; or a single value.'''
+        if column in self.sorted:
+            values, order = self.sorted[column]
+            if isinstance(condition, tuple):
+                low, high = condition
+                start = 0 if low is None else np.searchsorted(values, low, side='left')
+                end = len(values) if high is None else np.searchsorted(values, high, side='right')
+                return order[start:end]
+            if not isinstance(condition, (list, set, frozenset)):
+                condition = [condition]
+            return np.concatenate([self.rows(column, (value, value)) for value in condition] + [np.zeros(0, dtype=int)])
+        elif column in self.groups:
+            groups = self.groups[column]
+            if isinstance(condition, tuple):
+                raise Exception('Ranges are not supported for column %s' %column)
+            if not isinstance(condition, (list, set, frozenset)):
+                condition = [condition]
+            return np.concatenate([groups.get(value, np.zeros(0, dtype=int)) for value in condition] + [np.zeros(0, dtype=int)])
+        raise Exception('Column %s is not indexed' %column)
+
+    def mask(self, **conditions):
+        r'''Returns a boolean array, True for the chemicals matching all of
+        the conditions; see :obj:`rows` for their forms.'''
+        if self.auto_refresh:
+            self.refresh()
+        mask = np.ones(len(self.CASRNs), dtype=bool)
+        for column, condition in conditions.items():
+            matches = np.zeros(len(self.CASRNs), dtype=bool)
+            matches[self.rows(column, condition)] = True
+            mask &= matches
+        return mask
+
+    def query(self, **conditions):
+        r'''Returns the CAS numbers of the chemicals matching all of the
+        conditions, in sorted order. Each keyword is a column of the table;
+        its value is a tuple (low, high) of inclusive limits, either of which
+        may be None; a list of values, any of which matches; or a single
+        value.
+
+        Chemicals without a value for a constant never match a condition on
+        it.
+        '''
+        return self.CASRNs[self.mask(**conditions)]
+
+
+_default_index = None
+
+def query_constants(**conditions):
+    r'''Returns the CAS numbers of the chemicals in the databanks matching
+    all of the conditions, using a :obj:`ConstantIndex` of all chemicals and
+    constants which is built on first use. See :obj:`ConstantIndex.query`
+    for the conditions.
+
+    Examples
+    --------
+    >>> list(query_constants(Tc=(647, 648), Pc=(2.2E7, 2.21E7)))
+    ['7732-18-5']
+    '''
+    global _default_index
+    if _default_index is None:
+        _default_index = ConstantIndex()
+    return _default_index.query(**conditions)
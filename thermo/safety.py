@@ -955,6 +955,118 @@ def UFL_mixture(ys=None, UFLs=None, CASRNs=None, AvailableMethods=False,
     return _UFL
 
 
+class FuelSet(object):
+    r'''Set of components of gas mixtures, for which the lower and upper
+    flammability limits of many compositions are calculated at once. The
+    limit of each component is resolved once, with :obj:`LFL` and
+    :obj:`UFL` and the same order of methods, unless they are provided.
+    Inert gases, those in `inerts`, have no limits and are not fuels.
+
+    The limits of a composition are those of its fuels by Le Chatelier's
+    mixing rule, as in :obj:`LFL_mixture` and :obj:`UFL_mixture`:
+
+    .. math::
+        \text{FL}_{mix} = \frac{\sum_{fuels} y_i}{\sum_{fuels}
+        \frac{y_i}{\text{FL}_i}}
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs of the components [-]
+    Hcs : list[float], optional
+        Heats of combustion of the components, for the `Suzuki_LFL` and
+        `Suzuki_UFL` methods, [J/mol]
+    atomss : list[dict], optional
+        Dictionaries of atoms and atom counts of the components, for the
+        `Crowl_Louvar_LFL` and `Crowl_Louvar_UFL` methods [-]
+    LFLs : list[float], optional
+        Lower flammability limits of the components, to use instead of
+        looking them up, [fraction]
+    UFLs : list[float], optional
+        Upper flammability limits of the components, to use instead of
+        looking them up, [fraction]
+
+    Notes
+    -----
+    Compositions are arrays with the mole fractions of the components along
+    their last axis; a matrix has one composition per row. The limits of a
+    composition depend only on the relative amounts of its fuels. They are NaN
+    if the composition has no fuels, or if a fuel present has no known limit.
+
+    Inert gases are treated as diluents only; the narrowing of the flammable
+    range by large amounts of inerts, i.e. the limiting oxygen concentration,
+    is not considered.
+
+    Examples
+    --------
+    Methane and ethane in air:
+
+    >>> fuels = FuelSet(['74-82-8', '74-84-0', '132259-10-0'])
+    >>> fuels.LFLs, fuels.UFLs
+    (array([0.044, 0.024,   nan]), array([0.17 , 0.155,   nan]))
+    >>> fuels.LFL([[0.03, 0.01, 0.96], [0.01, 0.01, 0.98]])
+    array([0.03641379, 0.03105882])
+    >>> fuels.flammable([[0.03, 0.01, 0.96], [0.01, 0.01, 0.98]])
+    array([ True, False])
+    '''
+    def __init__(self, CASRNs, Hcs=None, atomss=None, LFLs=None, UFLs=None):
+        self.CASRNs = list(CASRNs)
+        N = len(self.CASRNs)
+        self.inert = np.array([CASRN in inerts for CASRN in self.CASRNs], dtype=bool)
+        self.fuel = ~self.inert
+        Hcs = [None]*N if Hcs is None else Hcs
+        atomss = [{}]*N if atomss is None else atomss
+        if LFLs is None:
+            LFLs = [None if self.inert[i] else LFL(Hc=Hcs[i], atoms=atomss[i], CASRN=self.CASRNs[i])
+                    for i in range(N)]
+        if UFLs is None:
+            UFLs = [None if self.inert[i] else UFL(Hc=Hcs[i], atoms=atomss[i], CASRN=self.CASRNs[i])
+                    for i in range(N)]
+        self.LFLs = np.array([np.nan if i is None else i for i in LFLs], dtype=float)
+        self.UFLs = np.array([np.nan if i is None else i for i in UFLs], dtype=float)
+        self.LFLs[self.inert] = np.nan
+        self.UFLs[self.inert] = np.nan
+
+    @staticmethod
+    def _result(values):
+        return float(values) if np.ndim(values) == 0 else values
+
+    def _mixing(self, ys, FLs):
+        ys = np.asarray(ys, dtype=float)[..., self.fuel]
+        FLs = FLs[self.fuel]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Absent components do not need a known limit
+            inverse = np.where(ys > 0., ys/FLs, 0.).sum(axis=-1)
+            return ys.sum(axis=-1)/inverse
+
+    def fuel_fraction(self, ys):
+        r'''Returns the total mole fraction of the fuels of one or many
+        compositions.'''
+        return self._result(np.asarray(ys, dtype=float)[..., self.fuel].sum(axis=-1))
+
+    def LFL(self, ys):
+        r'''Returns the lower flammability limits of one or many
+        compositions, as mole fractions of all of their fuels.'''
+        return self._result(self._mixing(ys, self.LFLs))
+
+    def UFL(self, ys):
+        r'''Returns the upper flammability limits of one or many
+        compositions, as mole fractions of all of their fuels.'''
+        return self._result(self._mixing(ys, self.UFLs))
+
+    def flammable(self, ys):
+        r'''Returns whether one or many compositions are flammable, that is,
+        whether the total mole fraction of their fuels is between their lower
+        and upper flammability limits, inclusive. Compositions without
+        limits are not flammable.'''
+        ys = np.asarray(ys, dtype=float)
+        fraction = ys[..., self.fuel].sum(axis=-1)
+        with np.errstate(invalid='ignore'):
+            flammable = ((fraction >= self._mixing(ys, self.LFLs))
+                         & (fraction <= self._mixing(ys, self.UFLs)))
+        return bool(flammable) if np.ndim(flammable) == 0 else flammable
+
+
 def Suzuki_LFL(Hc=None):
     r'''Calculates lower flammability limit, using the Suzuki [1]_ correlation.
     Uses heat of combustion only.
@@ -1169,6 +1281,100 @@ def Crowl_Louvar_UFL(atoms):
     return UFL
 
 
+### Combined hazard data
+
+hazard_columns = ['TWA', 'TWA units', 'STEL', 'STEL units', 'Ceiling',
+                  'Ceiling units', 'Skin', 'IARC', 'NTP', 'Tflash',
+                  'Tautoignition', 'LFL', 'UFL']
+_hazard_object_columns = ['TWA units', 'STEL units', 'Ceiling units', 'Skin']
+
+
+def _load_hazard_data():
+    limits = {}
+    for CASRN, values in _OntarioExposureLimits.items():
+        row = []
+        for limit in ('TWA', 'STEL', 'Ceiling'):
+            # Same preference as `TWA`, `STEL` and `Ceiling`
+            if values[limit + ' (ppm)']:
+                row.extend([values[limit + ' (ppm)'], 'ppm'])
+            elif values[limit + ' (mg/m^3)']:
+                row.extend([values[limit + ' (mg/m^3)'], 'mg/m^3'])
+            else:
+                row.extend([np.nan, None])
+        row.append(values['Skin'])
+        limits.setdefault(CASRN.strip(), row)
+    limits = pd.DataFrame.from_dict(limits, orient='index', columns=hazard_columns[:7])
+
+    carcinogens = pd.DataFrame({'IARC': IARC_data['group'].map(IARC_codes),
+                                'NTP': NTP_data['Listing'].map(NTP_codes)})
+    # IEC values, or the NFPA ones where they are missing
+    fire_columns = ['Tflash', 'Tautoignition', 'LFL', 'UFL']
+    fire = IEC_2010[fire_columns].astype(float).combine_first(NFPA_2008[fire_columns].astype(float))
+
+    data = pd.concat([limits, carcinogens, fire], axis=1).sort_index()
+    return _fill_hazard_data(data)
+
+
+def _fill_hazard_data(data):
+    for column in ('IARC', 'NTP'):
+        if column in data:
+            data[column] = data[column].fillna(UNLISTED)
+    for column in _hazard_object_columns:
+        if column in data:
+            values = data[column].astype(object)
+            data[column] = values.where(values.notnull(), None)
+    return data
+
+hazard_data = _load_hazard_data()
+
+
+def hazard_profile_many(CASRNs, columns=None):
+    r'''Looks up the exposure limits, carcinogen status, and fire hazard data
+    of many chemicals at once, from the table `hazard_data` which is merged
+    from all of the sources of this module when it is loaded. The values are
+    those of the functions for single chemicals, with their default methods.
+
+    The columns are, in order:
+
+        * **TWA**, **STEL**, **Ceiling**: Exposure limits of :obj:`TWA`,
+          :obj:`STEL` and :obj:`Ceiling`, NaN if not listed; and their units,
+          in the columns 'TWA units', 'STEL units' and 'Ceiling units',
+          'ppm' or 'mg/m^3', or None if not listed.
+        * **Skin**: Status of :obj:`Skin`, None if not listed.
+        * **IARC**, **NTP**: Carcinogen status from each source, as returned
+          by :obj:`Carcinogen`, 'Unlisted' if not listed.
+        * **Tflash**, **Tautoignition**, **LFL**, **UFL**: Values of
+          :obj:`Tflash`, :obj:`Tautoignition`, :obj:`LFL` and :obj:`UFL` from
+          the IEC data, or else the NFPA data; NaN if not listed.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs of the chemicals; may be repeated [-]
+    columns : list[str], optional
+        Columns to return; all of them if not provided
+
+    Returns
+    -------
+    profile : DataFrame
+        One row for each chemical, indexed by the given CASRNs
+
+    Notes
+    -----
+    Surrounding whitespace is removed from the CASRNs of the Ontario
+    exposure limits when the table is built; a few of them have some.
+
+    Examples
+    --------
+    >>> hazard_profile_many(['67-64-1', '71-43-2'], ['TWA', 'TWA units', 'NTP', 'Tflash'])
+               TWA TWA units       NTP  Tflash
+    67-64-1  500.0       ppm  Unlisted  253.15
+    71-43-2    0.5       ppm     Known  262.15
+    '''
+    data = hazard_data if columns is None else hazard_data[list(columns)]
+    return _fill_hazard_data(data.reindex(list(CASRNs)))
+
+
 #CAS = ['71-43-2', '8006-61-9'] # methanol, gasoline
 #for i in CAS:
 #    print Tflash(i)
@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+'''Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2016, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+Long-running property server, so other programs can query properties without
+paying the import time of the library for each query. It requires Python 3.7
+or later, for asyncio; the rest of the library does not. Run it with::
+
+    python -m thermo.server --port 8765
+    python -m thermo.server --unix /tmp/thermo.sock --preload water ethanol
+
+It speaks HTTP/1.1 on localhost or on a Unix socket, with the endpoints:
+
+* `GET /health` - status, uptime, and number of chemicals loaded
+* `GET /metrics` - request, evaluation, and error counts, and timings;
+  requests to unknown paths are counted under 'other'
+* `POST /evaluate` - a batch of evaluations, as JSON (or msgpack, if it is
+  installed, with the content type `application/msgpack`), either as a list
+  or as an object with the key `requests`. Each evaluation is an object with
+  the keys `ID`, `property`, and optionally `T` and `P`, or a list in that
+  order. The answer is an object with the list `results`, in which failed
+  evaluations are null, and the list `errors` of [index, message] pairs.
+
+Example::
+
+    $ curl -d '[["water", "rhol", 300], ["ethanol", "Psat", 350]]' localhost:8765/evaluate
+    {"results": [996.5575990734005, 95723.15555025394], "errors": []}
+'''
+
+from __future__ import division
+
+__all__ = ['PropertyServer', 'main']
+
+import argparse
+import asyncio
+import json
+from collections import OrderedDict
+from math import isnan
+from numbers import Integral, Real
+from time import time
+from thermo.chemical import Chemical
+from thermo.identifiers import CASfromAny
+
+try:
+    import msgpack
+    has_msgpack = True
+except ImportError:  # pragma: no cover
+    has_msgpack = False
+
+# Requests to any other path are counted together in the metrics
+_routes = ('/health', '/metrics', '/evaluate')
+_other_route = 'other'
+
+_reasons = {200: 'OK', 400: 'Bad Request', 404: 'Not Found',
+            405: 'Method Not Allowed', 415: 'Unsupported Media Type',
+            500: 'Internal Server Error'}
+
+
+class PropertyServer(object):
+    r'''Property server which keeps a :obj:`thermo.chemical.Chemical` object
+    for each chemical queried, so later queries are answered from the
+    property objects and caches already loaded in it. Identifiers are
+    resolved with :obj:`thermo.identifiers.CASfromAny` once each; different
+    identifiers of the same chemical share its object.
+
+    Evaluations are performed in the thread running the event loop, one
+    batch at a time; the objects are not shared with any other thread. The
+    methods of the property objects are reset before each change of state,
+    so every answer is the same as that of a new `Chemical` at its
+    conditions, whichever requests were served before. Up to
+    `max_chemicals` objects and `max_identifiers` resolved identifiers are
+    kept, the least recently used being discarded first.
+
+    Only scalar properties (numbers, strings, booleans, and None) can be
+    evaluated.
+
+    Parameters
+    ----------
+    preload : list[str], optional
+        Identifiers of chemicals to load when the server is created
+    max_chemicals : int, optional
+        Maximum number of chemical objects kept
+    max_identifiers : int, optional
+        Maximum number of resolved identifiers kept
+
+    Examples
+    --------
+    >>> server = PropertyServer()
+    >>> server.evaluate([['water', 'MW'], {'ID': 'water', 'property': 'Tc'}])
+    ([18.01528, 647.14], [])
+    '''
+    def __init__(self, preload=(), max_chemicals=1000, max_identifiers=100000):
+        self.started = time()
+        self.max_chemicals = max_chemicals
+        self.max_identifiers = max_identifiers
+        self.chemicals = OrderedDict()
+        self.CASs = OrderedDict()
+        self.requests = {}
+        self.evaluations = 0
+        self.errors = 0
+        self.evaluation_time = 0.0
+        for ID in preload:
+            self.chemical(ID)
+
+    def chemical(self, ID):
+        r'''Returns the cached `Chemical` for an identifier, creating it if
+        it has not yet been queried.'''
+        CASs, chemicals = self.CASs, self.chemicals
+        try:
+            CAS = CASs.pop(ID)
+        except KeyError:
+            CAS = CASfromAny(ID)
+            if len(CASs) >= self.max_identifiers:
+                CASs.popitem(last=False)
+        CASs[ID] = CAS
+        try:
+            chem = chemicals.pop(CAS)
+        except KeyError:
+            chem = Chemical(CAS)
+            if len(chemicals) >= self.max_chemicals:
+                chemicals.popitem(last=False)
+        chemicals[CAS] = chem
+        return chem
+
+    def evaluate_one(self, ID, prop, T=298.15, P=101325.):
+        r'''Evaluates one property of a chemical at a temperature and
+        pressure; the chemical's state is only updated if either changed
+        since its last evaluation.'''
+        if prop.startswith('_'):
+            raise Exception('Property %s is not available' %prop)
+        chem = self.chemical(ID)
+        T, P = float(T), float(P)
+        if chem.T != T or chem.P != P:
+            chem.P = P
+            chem.reset_T_methods()
+            chem.set_T(T)
+        value = getattr(chem, prop)
+        if callable(value):
+            raise Exception('Property %s is not available' %prop)
+        if value is None or isinstance(value, (bool, str)):
+            return value
+        elif isinstance(value, Integral):
+            return int(value)
+        elif isinstance(value, Real):
+            value = float(value)
+            return None if isnan(value) else value
+        raise Exception('Property %s is not a scalar' %prop)
+
+    def evaluate(self, requests):
+        r'''Evaluates a batch of requests, each a dict with the keys `ID`,
+        `property`, and optionally `T` and `P`, or a list in that order.
+
+        Returns
+        -------
+        results : list
+            Calculated values, None for the failed requests
+        errors : list[list]
+            Index and message of each failed request
+        '''
+        start = time()
+        results, errors = [], []
+        for i, request in enumerate(requests):
+            try:
+                if isinstance(request, dict):
+                    args = (request['ID'], request['property'],
+                            request.get('T', 298.15), request.get('P', 101325.))
+                else:
+                    args = tuple(request)
+                results.append(self.evaluate_one(*args))
+            except Exception as e:
+                results.append(None)
+                errors.append([i, '%s: %s' %(type(e).__name__, e)])
+        self.evaluations += len(requests)
+        self.errors += len(errors)
+        self.evaluation_time += time() - start
+        return results, errors
+
+    def health(self):
+        return {'status': 'ok', 'uptime': time() - self.started,
+                'chemicals': len(self.chemicals)}
+
+    def metrics(self):
+        return {'uptime': time() - self.started, 'requests': dict(self.requests),
+                'evaluations': self.evaluations, 'errors': self.errors,
+                'evaluation_time': self.evaluation_time,
+                'chemicals': sorted(self.chemicals)}
+
+    def respond(self, method, path, content_type, body):
+        r'''Answers one HTTP request; returns the status code, content type,
+        and body of the response. Unexpected failures give a response with
+        the status 500.'''
+        try:
+            return self._respond(method, path, content_type, body)
+        except Exception as e:
+            return self._error(500, '%s: %s' %(type(e).__name__, e))
+
+    def _respond(self, method, path, content_type, body):
+        path = path.split('?', 1)[0]
+        route = path if path in _routes else _other_route
+        self.requests[route] = self.requests.get(route, 0) + 1
+        if path == '/health' or path == '/metrics':
+            if method != 'GET':
+                return self._error(405, 'Use GET')
+            return 200, 'application/json', json.dumps(self.health() if path == '/health' else self.metrics()).encode('utf-8')
+        elif path != '/evaluate':
+            return self._error(404, 'Unknown endpoint %s' %path)
+        if method != 'POST':
+            return self._error(405, 'Use POST')
+
+        use_msgpack = (content_type or '').startswith('application/msgpack')
+        if use_msgpack and not has_msgpack:  # pragma: no cover
+            return self._error(415, 'msgpack is not installed')
+        try:
+            if use_msgpack:
+                requests = msgpack.unpackb(body, raw=False)
+            else:
+                requests = json.loads(body.decode('utf-8'))
+            if isinstance(requests, dict):
+                requests = requests['requests']
+            if not isinstance(requests, list):
+                raise ValueError('Requests must be a list')
+        except Exception as e:
+            return self._error(400, 'Could not parse request: %s' %e)
+
+        results, errors = self.evaluate(requests)
+        answer = {'results': results, 'errors': errors}
+        if use_msgpack:
+            return 200, 'application/msgpack', msgpack.packb(answer, use_bin_type=True)
+        return 200, 'application/json', json.dumps(answer).encode('utf-8')
+
+    def _error(self, status, message):
+        self.errors += 1
+        return status, 'application/json', json.dumps({'error': message}).encode('utf-8')
+
+    async def handle(self, reader, writer):
+        r'''Serves the HTTP requests of one connection, until the client
+        closes it.'''
+        try:
+            while True:
+                line = await reader.readline()
+                if not line.strip():
+                    break
+                method, path, version = line.decode('latin-1').split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if not line.strip():
+                        break
+                    key, value = line.decode('latin-1').split(':', 1)
+                    headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get('content-length', 0)))
+
+                status, content_type, payload = self.respond(method, path, headers.get('content-type'), body)
+                close = version == 'HTTP/1.0' or headers.get('connection', '').lower() == 'close'
+                writer.write(('HTTP/1.1 %d %s\r\nContent-Type: %s\r\nContent-Length: %d\r\n%s\r\n'
+                              %(status, _reasons[status], content_type, len(payload),
+                                'Connection: close\r\n' if close else '')).encode('latin-1') + payload)
+                await writer.drain()
+                if close:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host='127.0.0.1', port=8765, path=None):
+        r'''Starts listening on a TCP port, or on a Unix socket if `path` is
+        given; returns the asyncio server.'''
+        if path is not None:
+            return await asyncio.start_unix_server(self.handle, path=path)
+        return await asyncio.start_server(self.handle, host=host, port=port)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m thermo.server',
+                                     description='Serve thermo properties over HTTP.')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on')
+    parser.add_argument('--unix', default=None, help='Listen on this Unix socket instead')
+    parser.add_argument('--preload', nargs='*', default=(), help='Chemicals to load at startup')
+    args = parser.parse_args(argv)
+
+    async def serve():
+        server = await PropertyServer(preload=args.preload).start(args.host, args.port, args.unix)
+        async with server:
+            await server.serve_forever()
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:  # pragma: no cover
+        pass
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -24,8 +24,8 @@ from __future__ import division
 from scipy.constants import R
 from math import exp, log
 from thermo.utils import mixing_simple, none_and_length_check, TPDependentProperty
-from thermo.miscdata import _VDISaturationDict, VDI_tabular_data
-from thermo.coolprop import has_CoolProp, coolprop_dict, coolprop_fluids, CoolProp_T_dependent_property, PropsSI, PhaseSI
+from thermo.miscdata import _VDISaturationDict, VDI_tabular_arrays
+from thermo.coolprop import has_CoolProp, coolprop_dict, coolprop_fluids, CoolProp_T_dependent_property, CoolProp_TP, CoolProp_phase
 from thermo.electrochem import thermal_conductivity_Magomedov, Magomedovk_thermal_cond
 from scipy.interpolate import interp2d
 import numpy as np
@@ -622,10 +622,10 @@ class ThermalConductivityLiquid(TPDependentProperty):
         Tmins, Tmaxs = [], []
         if self.CASRN in _VDISaturationDict:
             methods.append(VDI_TABULAR)
-            Ts, props = VDI_tabular_data(self.CASRN, 'K (l)')
-            self.VDI_Tmin = Ts[0]
-            self.VDI_Tmax = Ts[-1]
-            self.tabular_data[VDI_TABULAR] = (Ts, props)
+            Ts, props = VDI_data = VDI_tabular_arrays(self.CASRN, 'K (l)')
+            self.VDI_Tmin = float(Ts[0])
+            self.VDI_Tmax = float(Ts[-1])
+            self.tabular_data[VDI_TABULAR] = VDI_data
             Tmins.append(self.VDI_Tmin); Tmaxs.append(self.VDI_Tmax)
         if has_CoolProp and self.CASRN in coolprop_dict:
             methods.append(COOLPROP); methods_P.append(COOLPROP)
@@ -693,7 +693,7 @@ class ThermalConductivityLiquid(TPDependentProperty):
         elif method == BAHADORI_L:
             kl = Bahadori_liquid(T, self.MW)
         elif method == COOLPROP:
-            kl = CoolProp_T_dependent_property(T, self.CASRN, 'L', 'l')
+            kl = CoolProp_T_dependent_property(T, self.CASRN, 'L', 'l', self.CoolProp_backend)
         elif method in self.tabular_data:
             kl = self.interpolate(T, method)
         return kl
@@ -726,7 +726,7 @@ class ThermalConductivityLiquid(TPDependentProperty):
             kl = self.T_dependent_property(T)
             kl = Missenard(T, P, self.Tc, self.Pc, kl)
         elif method == COOLPROP:
-            kl = PropsSI('L', 'T', T, 'P', P, self.CASRN)
+            kl = CoolProp_TP(T, P, self.CASRN, 'L', self.CoolProp_backend)
         elif method in self.tabular_data:
             kl = self.interpolate_P(T, P, method)
         return kl
@@ -819,7 +819,7 @@ class ThermalConductivityLiquid(TPDependentProperty):
             if T < 0 or P < 0:
                 validity = False
         elif method == COOLPROP:
-            validity = PhaseSI('T', T, 'P', P, self.CASRN) in ['liquid', 'supercritical_liquid']
+            validity = CoolProp_phase(T, P, self.CASRN, self.CoolProp_backend) in ['liquid', 'supercritical_liquid']
         elif method in self.tabular_data:
             if not self.tabular_extrapolation_permitted:
                 Ts, Ps, properties = self.tabular_data[method]
@@ -1800,10 +1800,10 @@ class ThermalConductivityGas(TPDependentProperty):
         Tmins, Tmaxs = [], []
         if self.CASRN in _VDISaturationDict:
             methods.append(VDI_TABULAR)
-            Ts, props = VDI_tabular_data(self.CASRN, 'K (g)')
-            self.VDI_Tmin = Ts[0]
-            self.VDI_Tmax = Ts[-1]
-            self.tabular_data[VDI_TABULAR] = (Ts, props)
+            Ts, props = VDI_data = VDI_tabular_arrays(self.CASRN, 'K (g)')
+            self.VDI_Tmin = float(Ts[0])
+            self.VDI_Tmax = float(Ts[-1])
+            self.tabular_data[VDI_TABULAR] = VDI_data
             Tmins.append(self.VDI_Tmin); Tmaxs.append(self.VDI_Tmax)
         if has_CoolProp and self.CASRN in coolprop_dict:
             methods.append(COOLPROP); methods_P.append(COOLPROP)
@@ -1883,7 +1883,7 @@ class ThermalConductivityGas(TPDependentProperty):
         elif method == BAHADORI_G:
             kg = Bahadori_gas(T, self.MW)
         elif method == COOLPROP:
-            kg = CoolProp_T_dependent_property(T, self.CASRN, 'L', 'g')
+            kg = CoolProp_T_dependent_property(T, self.CASRN, 'L', 'g', self.CoolProp_backend)
         elif method in self.tabular_data:
             kg = self.interpolate(T, method)
         return kg
@@ -1917,7 +1917,7 @@ class ThermalConductivityGas(TPDependentProperty):
             kg = self.T_dependent_property(T)
             kg = stiel_thodos_dense(T, self.MW, self.Tc, self.Pc, self.Vc, self.Zc, self.Vmg, kg)
         elif method == COOLPROP:
-            kg = PropsSI('L', 'T', T, 'P', P, self.CASRN)
+            kg = CoolProp_TP(T, P, self.CASRN, 'L', self.CoolProp_backend)
         elif method in self.tabular_data:
             kg = self.interpolate_P(T, P, method)
         return kg
@@ -2001,7 +2001,7 @@ class ThermalConductivityGas(TPDependentProperty):
             if T < self.CP_f.Tmin or T > self.CP_f.Tmax or P > self.CP_f.Pmax:
                 return False
             else:
-                return PhaseSI('T', T, 'P', P, self.CASRN) in ['gas', 'supercritical_gas', 'supercritical', 'supercritical_liquid']
+                return CoolProp_phase(T, P, self.CASRN, self.CoolProp_backend) in ['gas', 'supercritical_gas', 'supercritical', 'supercritical_liquid']
         elif method in self.tabular_data:
             if not self.tabular_extrapolation_permitted:
                 Ts, Ps, properties = self.tabular_data[method]
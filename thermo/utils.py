@@ -22,6 +22,7 @@ SOFTWARE.'''
 
 from __future__ import division
 from math import log, exp
+import sys
 import numpy as np
 from scipy.constants import R
 from scipy.optimize import brenth
@@ -756,6 +757,111 @@ def phase_set_property(phase=None, s=None, l=None, g=None, V_over_F=None):
 #print phase_set_property(phase='l', l=1560.14, g=3312.)
 
 
+def tabular_interpolators(Ts, properties, interpolation_T=None,
+                          interpolation_property=None):
+    r'''Creates the interpolators used by :obj:`TDependentProperty.interpolate`
+    for a tabular data set: a linear interpolator which also extrapolates,
+    and a cubic spline if 5 or more points are available (None otherwise).
+    The transforms `interpolation_T` and `interpolation_property` are
+    applied to the temperatures and properties first, if given.
+
+    Parameters
+    ----------
+    Ts : array-like
+        Increasing temperatures at which properties are specified, [K]
+    properties : array-like
+        Properties at Ts, [various]
+    interpolation_T : callable, optional
+        Transform of the temperatures
+    interpolation_property : callable, optional
+        Transform of the properties
+
+    Returns
+    -------
+    extrapolator : interp1d
+        Linear interpolator and extrapolator
+    spline : interp1d or None
+        Cubic spline interpolator
+
+    Examples
+    --------
+    >>> extrapolator, spline = tabular_interpolators([200, 300, 400], [1., 2., 4.])
+    >>> float(extrapolator(500)), spline
+    (6.0, None)
+    '''
+    if interpolation_T:  # Transform ths Ts with interpolation_T if set
+        Ts2 = [interpolation_T(T2) for T2 in Ts]
+    else:
+        Ts2 = Ts
+    if interpolation_property:  # Transform ths props with interpolation_property if set
+        properties2 = [interpolation_property(p) for p in properties]
+    else:
+        properties2 = properties
+    # Only allow linear extrapolation, but with whatever transforms are specified
+    extrapolator = interp1d(Ts2, properties2, fill_value='extrapolate')
+    # If more than 5 property points, create a spline interpolation
+    if len(properties) >= 5:
+        spline = interp1d(Ts2, properties2, kind='cubic')
+    else:
+        spline = None
+    return extrapolator, spline
+
+
+class SharedTabularData(tuple):
+    r'''Tabular data set (Ts, properties) which is shared by many property
+    objects, such as the data of a databank; it unpacks like the tuples set
+    by :obj:`TDependentProperty.set_tabular_data`. Its interpolators are
+    created once for each set of transforms and shared by every object
+    interpolating it.
+
+    Parameters
+    ----------
+    Ts : array-like
+        Increasing temperatures at which properties are specified, [K]
+    properties : array-like
+        Properties at Ts, [various]
+
+    Examples
+    --------
+    >>> data = SharedTabularData([200., 300., 400.], [1., 2., 4.])
+    >>> Ts, properties = data
+    >>> data.interpolators() is data.interpolators()
+    True
+    '''
+    def __new__(cls, Ts, properties):
+        self = tuple.__new__(cls, (Ts, properties))
+        self._interpolators = {}
+        return self
+
+    def __reduce__(self):
+        return (self.__class__, tuple(self))
+
+    def interpolators(self, interpolation_T=None, interpolation_property=None):
+        r'''Returns the interpolators of :obj:`tabular_interpolators` for
+        the data with the given transforms, creating them on first use.
+        Transforms which are methods are identified by their function, so
+        objects of the same class share interpolators.'''
+        key = (getattr(interpolation_T, '__func__', interpolation_T),
+               getattr(interpolation_property, '__func__', interpolation_property))
+        interpolators = self._interpolators.get(key)
+        if interpolators is None:
+            interpolators = tabular_interpolators(self[0], self[1], interpolation_T,
+                                                  interpolation_property)
+            self._interpolators[key] = interpolators
+        return interpolators
+
+
+def _plan_attribute(name, plan):
+    # An attribute which discards the cached method plan `plan` when set
+    storage = '_' + name
+    def get(self):
+        return getattr(self, storage)
+    def set(self, value):
+        setattr(self, storage, value)
+        setattr(self, plan, None)
+    return property(get, set)
+
+
 TEST_METHOD_1 = 'Test method 1'
 TEST_METHOD_2 = 'Test method 2'
 
@@ -853,6 +959,10 @@ class TDependentProperty(object):
         call
     user_methods : list
         Sorted methods as specified by the user
+    CoolProp_backend : str
+        CoolProp backend used by the COOLPROP methods of this object, one of
+        :obj:`thermo.coolprop.CoolProp_backends`; if None, the backend
+        selected with :obj:`thermo.coolprop.set_CoolProp_backend` is used
     '''
     # Dummy properties
     name = 'Property name'
@@ -864,7 +974,13 @@ class TDependentProperty(object):
     interpolation_property_inv = None
 
     method = None
-    forced = False
+    _forced = False
+    _method_plan = None
+    CoolProp_backend = None
+
+    forced = _plan_attribute('forced', '_method_plan')
+    all_methods = _plan_attribute('all_methods', '_method_plan')
+    user_methods = _plan_attribute('user_methods', '_method_plan')
 
     property_min = 0
     property_max = 1E4  # Arbitrary max
@@ -911,6 +1027,7 @@ class TDependentProperty(object):
         # Remove previously selected methods
         self.method = None
         self.sorted_valid_methods = []
+        self._method_plan = None
 
     def select_valid_methods(self, T):
         r'''Method to obtain a sorted list methods which are valid at `T`
@@ -930,31 +1047,52 @@ class TDependentProperty(object):
             Sorted lists of methods valid at T according to
             `test_method_validity`
         '''
+        return [method for method in self.method_plan()
+                if self.test_method_validity(T, method)]
+
+    def method_plan(self):
+        r'''Method to obtain the order in which methods are considered,
+        before checking their validity at a given temperature. Considers
+        either only user methods if forced is True, or all methods. User
+        methods come first in their listed order, followed by the rest of
+        the methods in their order in `ranked_methods`.
+
+        The order is computed once and stored as a tuple, which is never
+        modified; it is discarded whenever `all_methods`, `user_methods`, or
+        `forced` is set, including by :obj:`set_user_methods` and
+        :obj:`set_tabular_data`. Code which changes those collections in
+        place, or `ranked_methods`, must call :obj:`set_user_methods`
+        afterwards.
+
+        Returns
+        -------
+        methods : tuple
+            Methods in order of preference
+        '''
+        plan = self._method_plan
+        if plan is not None:
+            return plan
+        user_methods = self.user_methods
         # Consider either only the user's methods or all methods
         # Tabular data will be in both when inserted
         if self.forced:
-            considered_methods = list(self.user_methods)
+            considered_methods = list(user_methods)
         else:
             considered_methods = list(self.all_methods)
 
         # User methods (incl. tabular data); add back later, after ranking the rest
-        if self.user_methods:
-            [considered_methods.remove(i) for i in self.user_methods]
+        if user_methods:
+            [considered_methods.remove(i) for i in user_methods]
 
         # Index the rest of the methods by ranked_methods, and add them to a list, sorted_methods
         preferences = sorted([self.ranked_methods.index(i) for i in considered_methods])
         sorted_methods = [self.ranked_methods[i] for i in preferences]
 
         # Add back the user's methods to the top, in order.
-        if self.user_methods:
-            [sorted_methods.insert(0, i) for i in reversed(self.user_methods)]
-
-        sorted_valid_methods = []
-        for method in sorted_methods:
-            if self.test_method_validity(T, method):
-                sorted_valid_methods.append(method)
-
-        return sorted_valid_methods
+        if user_methods:
+            [sorted_methods.insert(0, i) for i in reversed(user_methods)]
+        methods = self._method_plan = tuple(sorted_methods)
+        return methods
 
     @classmethod
     def test_property_validity(self, prop):
@@ -1008,31 +1146,62 @@ class TDependentProperty(object):
         prop : float
             Calculated property, [`units`]
         '''
-        # Optimistic track, with the already set method
-        if self.method:
-            # retest within range
-            if self.test_method_validity(T, self.method):
-                try:
-                    prop = self.calculate(T, self.method)
-                    if self.test_property_validity(prop):
-                        return prop
-                except:  # pragma: no cover
-                    pass
+        # Calculated with local state only; the results are stored after,
+        # each with one assignment, so concurrent calls do not interfere
+        prop, method, sorted_valid_methods = self._T_dependent_property(T, self.method)
+        if sorted_valid_methods is not None:
+            self.sorted_valid_methods = sorted_valid_methods
+        if method is not None:
+            self.method = method
+        return prop
 
+    def _T_dependent_property(self, T, method):
+        # Returns the property, the method which calculated it, and the
+        # methods valid at T if they had to be found (otherwise None)
+        if method and self.test_method_validity(T, method):
+            try:
+                prop = self.calculate(T, method)
+                if self.test_property_validity(prop):
+                    return prop, method, None
+            except:  # pragma: no cover
+                pass
         # get valid methods at T, and try them until one yields a valid
-        # property; store the method and return the answer
-        self.sorted_valid_methods = self.select_valid_methods(T)
-        for method in self.sorted_valid_methods:
+        # property
+        sorted_valid_methods = self.select_valid_methods(T)
+        for method in sorted_valid_methods:
             try:
                 prop = self.calculate(T, method)
                 if self.test_property_validity(prop):
-                    self.method = method
-                    return prop
+                    return prop, method, sorted_valid_methods
             except:  # pragma: no cover
                 pass
-
         # Function returns None if it does not work.
-        return None
+        return None, None, sorted_valid_methods
+
+    def T_dependent_property_and_method(self, T, method=None):
+        r'''Method to calculate the property in the same way as
+        :obj:`T_dependent_property`, but without modifying the object: the
+        method to try first is given as an argument instead of being read
+        from `method`, and the method which succeeded is returned instead of
+        being stored. This makes it safe to share one object between threads,
+        each of which keeps track of its own `method`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature at which to calculate the property, [K]
+        method : str, optional
+            Method to try first, normally the one returned by the previous
+            call
+
+        Returns
+        -------
+        prop : float
+            Calculated property, or None if no method succeeded, [`units`]
+        method : str
+            Method used to calculate the property, or None
+        '''
+        return self._T_dependent_property(T, method)[:2]
 
 #    def plot(self, Tmin=None, Tmax=None, methods=[], pts=50, only_valid=True, order=0): # pragma: no cover
 #            return self.plot_T_dependent_property(Tmin=Tmin, Tmax=Tmax, methods=methods, pts=pts, only_valid=only_valid, order=order)
@@ -1137,7 +1306,9 @@ class TDependentProperty(object):
         `interpolation_property`, and `interpolation_property_inv` if set. If
         any of these are changed after the interpolators were first created,
         new interpolators are created with the new transforms.
-        All interpolation is performed via the `interp1d` function.
+        All interpolation is performed via the `interp1d` function, with the
+        interpolators of :obj:`tabular_interpolators`; those of a
+        :obj:`SharedTabularData` data set are reused from it.
 
         Parameters
         ----------
@@ -1157,30 +1328,20 @@ class TDependentProperty(object):
 #        if isinstance(self.tabular_data_interpolators, dict) and key in self.tabular_data_interpolators:
 #            extrapolator, spline = self.tabular_data_interpolators[key]
 
-        if key in self.tabular_data_interpolators:
-            extrapolator, spline = self.tabular_data_interpolators[key]
+        # A single lookup; the entry is only ever added whole, so this is safe
+        # while another thread creates interpolators
+        interpolators = self.tabular_data_interpolators.get(key)
+        if interpolators is not None:
+            extrapolator, spline = interpolators
         else:
-            Ts, properties = self.tabular_data[name]
-
-            if self.interpolation_T:  # Transform ths Ts with interpolation_T if set
-                Ts2 = [self.interpolation_T(T2) for T2 in Ts]
-            else:
-                Ts2 = Ts
-            if self.interpolation_property:  # Transform ths props with interpolation_property if set
-                properties2 = [self.interpolation_property(p) for p in properties]
+            data = self.tabular_data[name]
+            if isinstance(data, SharedTabularData):
+                # Interpolators of databank data are shared between objects
+                extrapolator, spline = data.interpolators(self.interpolation_T, self.interpolation_property)
             else:
-                properties2 = properties
-            # Only allow linear extrapolation, but with whatever transforms are specified
-            extrapolator = interp1d(Ts2, properties2, fill_value='extrapolate')
-            # If more than 5 property points, create a spline interpolation
-            if len(properties) >= 5:
-                spline = interp1d(Ts2, properties2, kind='cubic')
-            else:
-                spline = None
-#            if isinstance(self.tabular_data_interpolators, dict):
-#                self.tabular_data_interpolators[key] = (extrapolator, spline)
-#            else:
-#                self.tabular_data_interpolators = {key: (extrapolator, spline)}
+                Ts, properties = data
+                extrapolator, spline = tabular_interpolators(Ts, properties, self.interpolation_T,
+                                                             self.interpolation_property)
             self.tabular_data_interpolators[key] = (extrapolator, spline)
 
         # Load the stores values, tor checking which interpolation strategy to
@@ -1238,6 +1399,9 @@ class TDependentProperty(object):
         self.all_methods.add(name)
 
         self.set_user_methods(user_methods=self.user_methods, forced=self.forced)
+        # Create the interpolators now rather than during an evaluation
+        if len(Ts) > 1:
+            self.interpolate(Ts[0], name)
 
     def solve_prop(self, goal, reset_method=True):
         r'''Method to solve for the temperature at which a property is at a
@@ -1578,7 +1742,12 @@ class TPDependentProperty(TDependentProperty):
     properties.'''
     interpolation_P = None
     method_P = None
-    forced_P = False
+    _forced_P = False
+    _method_plan_P = None
+
+    forced_P = _plan_attribute('forced_P', '_method_plan_P')
+    all_methods_P = _plan_attribute('all_methods_P', '_method_plan_P')
+    user_methods_P = _plan_attribute('user_methods_P', '_method_plan_P')
 
     def set_user_methods_P(self, user_methods_P, forced_P=False):
         r'''Method to set the pressure-dependent property methods desired for
@@ -1616,6 +1785,7 @@ class TPDependentProperty(TDependentProperty):
         # Remove previously selected methods
         self.method_P = None
         self.sorted_valid_methods_P = []
+        self._method_plan_P = None
 
     def select_valid_methods_P(self, T, P):
         r'''Method to obtain a sorted list methods which are valid at `T`
@@ -1637,27 +1807,40 @@ class TPDependentProperty(TDependentProperty):
             Sorted lists of methods valid at T and P according to
             `test_method_validity`
         '''
-        # Same as select_valid_methods but with _P added to variables
+        return [method for method in self.method_plan_P()
+                if self.test_method_validity_P(T, P, method)]
+
+    def method_plan_P(self):
+        r'''Method to obtain the order in which pressure-dependent methods are
+        considered, before checking their validity; the counterpart of
+        :obj:`method_plan`, discarded whenever `all_methods_P`,
+        `user_methods_P`, or `forced_P` is set.
+
+        Returns
+        -------
+        methods : tuple
+            Methods in order of preference
+        '''
+        # Same as method_plan but with _P added to variables
+        plan = self._method_plan_P
+        if plan is not None:
+            return plan
+        user_methods_P = self.user_methods_P
         if self.forced_P:
-            considered_methods = list(self.user_methods_P)
+            considered_methods = list(user_methods_P)
         else:
             considered_methods = list(self.all_methods_P)
 
-        if self.user_methods_P:
-            [considered_methods.remove(i) for i in self.user_methods_P]
+        if user_methods_P:
+            [considered_methods.remove(i) for i in user_methods_P]
 
         preferences = sorted([self.ranked_methods_P.index(i) for i in considered_methods])
         sorted_methods = [self.ranked_methods_P[i] for i in preferences]
 
-        if self.user_methods_P:
-            [sorted_methods.insert(0, i) for i in reversed(self.user_methods_P)]
-
-        sorted_valid_methods_P = []
-        for method in sorted_methods:
-            if self.test_method_validity_P(T, P, method):
-                sorted_valid_methods_P.append(method)
-
-        return sorted_valid_methods_P
+        if user_methods_P:
+            [sorted_methods.insert(0, i) for i in reversed(user_methods_P)]
+        methods = self._method_plan_P = tuple(sorted_methods)
+        return methods
 
     def TP_dependent_property(self, T, P):
         r'''Method to calculate the property with sanity checking and without
@@ -1688,30 +1871,57 @@ class TPDependentProperty(TDependentProperty):
         prop : float
             Calculated property, [`units`]
         '''
-        # Optimistic track, with the already set method
-        if self.method_P:
-            # retest within range
-            if self.test_method_validity_P(T, P, self.method_P):
-                try:
-                    prop = self.calculate_P(T, P, self.method_P)
-                    if self.test_property_validity(prop):
-                        return prop
-                except:  # pragma: no cover
-                    pass
+        # Calculated with local state only, as in T_dependent_property
+        prop, method_P, sorted_valid_methods_P = self._TP_dependent_property(T, P, self.method_P)
+        if sorted_valid_methods_P is not None:
+            self.sorted_valid_methods_P = sorted_valid_methods_P
+        if method_P is not None:
+            self.method_P = method_P
+        return prop
 
-        # get valid methods at T, and try them until one yields a valid
-        # property; store the method_P and return the answer
-        self.sorted_valid_methods_P = self.select_valid_methods_P(T, P)
-        for method_P in self.sorted_valid_methods_P:
+    def _TP_dependent_property(self, T, P, method_P):
+        # Counterpart of _T_dependent_property
+        if method_P and self.test_method_validity_P(T, P, method_P):
             try:
                 prop = self.calculate_P(T, P, method_P)
                 if self.test_property_validity(prop):
-                    self.method_P = method_P
-                    return prop
+                    return prop, method_P, None
+            except:  # pragma: no cover
+                pass
+        sorted_valid_methods_P = self.select_valid_methods_P(T, P)
+        for method_P in sorted_valid_methods_P:
+            try:
+                prop = self.calculate_P(T, P, method_P)
+                if self.test_property_validity(prop):
+                    return prop, method_P, sorted_valid_methods_P
             except:  # pragma: no cover
                 pass
         # Function returns None if it does not work.
-        return None
+        return None, None, sorted_valid_methods_P
+
+    def TP_dependent_property_and_method(self, T, P, method_P=None):
+        r'''Method to calculate the property in the same way as
+        :obj:`TP_dependent_property`, but without modifying the object; the
+        counterpart of :obj:`T_dependent_property_and_method`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature at which to calculate the property, [K]
+        P : float
+            Pressure at which to calculate the property, [Pa]
+        method_P : str, optional
+            Method to try first, normally the one returned by the previous
+            call
+
+        Returns
+        -------
+        prop : float
+            Calculated property, or None if no method succeeded, [`units`]
+        method_P : str
+            Method used to calculate the property, or None
+        '''
+        return self._TP_dependent_property(T, P, method_P)[:2]
 
     def set_tabular_data_P(self, Ts, Ps, properties, name=None, check_properties=True):
         r'''Method to set tabular data to be used for interpolation.
@@ -1754,6 +1964,9 @@ class TPDependentProperty(TDependentProperty):
         self.all_methods_P.add(name)
 
         self.set_user_methods_P(user_methods_P=self.user_methods_P, forced_P=self.forced_P)
+        # Create the interpolators now rather than during an evaluation
+        if len(Ts) > 1 and len(Ps) > 1:
+            self.interpolate_P(Ts[0], Ps[0], name)
 
     def interpolate_P(self, T, P, name):
         r'''Method to perform interpolation on a given tabular data set
@@ -1787,8 +2000,9 @@ class TPDependentProperty(TDependentProperty):
         key = (name, self.interpolation_T, self.interpolation_P, self.interpolation_property, self.interpolation_property_inv)
 
         # If the interpolator and extrapolator has already been created, load it
-        if key in self.tabular_data_interpolators:
-            extrapolator, spline = self.tabular_data_interpolators[key]
+        interpolators = self.tabular_data_interpolators.get(key)
+        if interpolators is not None:
+            extrapolator, spline = interpolators
         else:
             Ts, Ps, properties = self.tabular_data[name]
 
@@ -1972,3 +2186,62 @@ class TPDependentProperty(TDependentProperty):
         plt.xlabel('Temperature, K')
         plt.title(self.name + ' of ' + self.CASRN)
         plt.show()
+
+
+class TableWriter(object):
+    r'''Writes DataFrames one after the other to one CSV file, or to
+    standard output if the path is '-', or to a Parquet file if the path
+    ends with .parquet (requires pyarrow). The first DataFrame sets the
+    columns; each DataFrame is written as it is given, so tables of any size
+    can be written in chunks with bounded memory.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file to write
+    index : bool, optional
+        Whether to write the index of the DataFrames
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> writer = TableWriter('-')
+    >>> writer.write(pd.DataFrame({'T': [300.]}))
+    T
+    300.0
+    >>> writer.write(pd.DataFrame({'T': [350.]}))
+    350.0
+    >>> writer.close()
+    '''
+    def __init__(self, path, index=False):
+        self.path, self.index = path, index
+        self.parquet = path.endswith('.parquet')
+        self.writer = None
+        self.started = False
+        if self.parquet:
+            try:
+                import pyarrow
+                import pyarrow.parquet
+            except ImportError:  # pragma: no cover
+                raise Exception('Writing Parquet files requires pyarrow')
+            self.pa, self.pq = pyarrow, pyarrow.parquet
+
+    def write(self, df):
+        r'''Writes a DataFrame after those already written.'''
+        if self.parquet:  # pragma: no cover
+            table = self.pa.Table.from_pandas(df, preserve_index=self.index)
+            if self.writer is None:
+                self.writer = self.pq.ParquetWriter(self.path, table.schema)
+            else:
+                table = table.cast(self.writer.schema)
+            self.writer.write_table(table)
+        else:
+            df.to_csv(sys.stdout if self.path == '-' else self.path,
+                      mode='a' if self.started else 'w', header=not self.started,
+                      index=self.index)
+        self.started = True
+
+    def close(self):
+        r'''Finishes the file; required for Parquet files.'''
+        if self.writer is not None:  # pragma: no cover
+            self.writer.close()
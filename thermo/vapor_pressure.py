@@ -25,9 +25,9 @@ import os
 from math import log, exp
 import numpy as np
 import pandas as pd
-from thermo.miscdata import _VDISaturationDict, VDI_tabular_data
+from thermo.miscdata import _VDISaturationDict, VDI_tabular_arrays
 from thermo.utils import TDependentProperty
-from thermo.coolprop import has_CoolProp, PropsSI, coolprop_dict, coolprop_fluids
+from thermo.coolprop import has_CoolProp, coolprop_dict, coolprop_fluids, CoolProp_TQ
 
 
 folder = os.path.join(os.path.dirname(__file__), 'Vapor Pressure')
@@ -158,6 +158,89 @@ def TRC_Antoine_extended(T, Tc, to, A, B, C, n, E, F):
     return _Psat
 
 
+def dAntoine_dT(T, A, B, C, Base=10.0):
+    r'''Calculates the first temperature derivative of vapor pressure
+    according to the Antoine equation, :obj:`Antoine`.
+
+    .. math::
+        \frac{dP^{sat}}{dT} = P^{sat}\frac{B\ln(\text{Base})}{(T+C)^2}
+
+    Examples
+    --------
+    >>> dAntoine_dT(100.0, 8.7687, 395.744, -6.469) # methane
+    3591.414774748115
+    '''
+    Psat = Base**(A-B/(T+C))
+    return Psat*B*log(Base)/(T+C)**2
+
+
+def dWagner_original_dT(T, Tc, Pc, a, b, c, d):
+    r'''Calculates the first temperature derivative of vapor pressure
+    according to the original Wagner equation 3,6 form,
+    :obj:`Wagner_original`.
+
+    .. math::
+        \frac{dP^{sat}}{dT} = -\frac{P^{sat}}{T_c T_r^2}\left[T_r(a +
+        1.5b\tau^{0.5} + 3c\tau^2 + 6d\tau^5) + a\tau + b \tau^{1.5}
+        + c\tau^3 + d\tau^6\right]
+
+    Examples
+    --------
+    >>> dWagner_original_dT(100.0, 190.53, 4596420., -6.00435, 1.1885, -0.834082, -1.22833) # CH4
+    3593.7078328375014
+    '''
+    Tr = T/Tc
+    tau = 1.0 - Tr
+    g = a*tau + b*tau**1.5 + c*tau**3 + d*tau**6
+    dg = a + 1.5*b*tau**0.5 + 3*c*tau**2 + 6*d*tau**5
+    Psat = Pc*exp(g/Tr)
+    return -Psat*(dg*Tr + g)/(Tc*Tr*Tr)
+
+
+def dWagner_dT(T, Tc, Pc, a, b, c, d):
+    r'''Calculates the first temperature derivative of vapor pressure
+    according to the Wagner equation 2.5, 5 form, :obj:`Wagner`.
+
+    .. math::
+        \frac{dP^{sat}}{dT} = -\frac{P^{sat}}{T_c T_r^2}\left[T_r(a +
+        1.5b\tau^{0.5} + 2.5c\tau^{1.5} + 5d\tau^4) + a\tau + b \tau^{1.5}
+        + c\tau^{2.5} + d\tau^5\right]
+
+    Examples
+    --------
+    >>> dWagner_dT(100., 190.551, 4599200, -6.02242, 1.26652, -0.5707, -1.366) # CH4
+    3587.2910498076603
+    '''
+    Tr = T/Tc
+    tau = 1.0 - Tr
+    g = a*tau + b*tau**1.5 + c*tau**2.5 + d*tau**5
+    dg = a + 1.5*b*tau**0.5 + 2.5*c*tau**1.5 + 5*d*tau**4
+    Psat = Pc*exp(g/Tr)
+    return -Psat*(dg*Tr + g)/(Tc*Tr*Tr)
+
+
+def dTRC_Antoine_extended_dT(T, Tc, to, A, B, C, n, E, F):
+    r'''Calculates the first temperature derivative of vapor pressure
+    according to the TRC extended Antoine equation,
+    :obj:`TRC_Antoine_extended`.
+
+    .. math::
+        \frac{dP^{sat}}{dT} = P^{sat}\ln(10)\left[\frac{B}{(T+C)^2} +
+        \frac{0.43429nx^{n-1} + 8Ex^7 + 12Fx^{11}}{T_c}\right]
+
+    Examples
+    --------
+    >>> dTRC_Antoine_extended_dT(180.0, 227.51, -120., 8.95894, 510.595, -15.95, 2.41377, -93.74, 7425.9) # CF4
+    31219.60612638225
+    '''
+    x = (T - to - 273.15)/Tc
+    Psat = TRC_Antoine_extended(T, Tc, to, A, B, C, n, E, F)
+    dlog10P = B/(T+C)**2
+    if x > 0:
+        dlog10P += (0.43429*n*x**(n-1) + 8*E*x**7 + 12*F*x**11)/Tc
+    return Psat*dlog10P*log(10.)
+
+
 WAGNER_MCGARRY = 'Wagner Original (McGarry)'
 WAGNER_POLING = 'Wagner (Poling)'
 ANTOINE_POLING = 'Antoine (Poling)'
@@ -369,10 +452,10 @@ class VaporPressure(TDependentProperty):
             Tmins.append(self.CP_f.Tmin); Tmaxs.append(self.CP_f.Tc)
         if self.CASRN in _VDISaturationDict:
             methods.append(VDI_TABULAR)
-            Ts, props = VDI_tabular_data(self.CASRN, 'P')
-            self.VDI_Tmin = Ts[0]
-            self.VDI_Tmax = Ts[-1]
-            self.tabular_data[VDI_TABULAR] = (Ts, props)
+            Ts, props = VDI_data = VDI_tabular_arrays(self.CASRN, 'P')
+            self.VDI_Tmin = float(Ts[0])
+            self.VDI_Tmax = float(Ts[-1])
+            self.tabular_data[VDI_TABULAR] = VDI_data
             Tmins.append(self.VDI_Tmin); Tmaxs.append(self.VDI_Tmax)
         if all((self.Tb, self.Tc, self.Pc)):
             methods.append(BOILING_CRITICAL)
@@ -419,7 +502,7 @@ class VaporPressure(TDependentProperty):
             A, B, C = self.ANTOINE_POLING_coefs
             Psat = Antoine(T, A, B, C, Base=10.0)
         elif method == COOLPROP:
-            Psat = PropsSI('P','T', T,'Q',0, self.CASRN)
+            Psat = CoolProp_TQ(T, 0, self.CASRN, 'P', self.CoolProp_backend)
         elif method == BOILING_CRITICAL:
             Psat = boiling_critical_relation(T, self.Tb, self.Tc, self.Pc)
         elif method == LEE_KESLER_PSAT:
@@ -432,6 +515,76 @@ class VaporPressure(TDependentProperty):
             Psat = self.interpolate(T, method)
         return Psat
 
+    def calculate_derivative(self, T, method, order=1):
+        r'''Method to calculate a derivative of a vapor pressure with respect
+        to temperature, of a given order using a specified method. The first
+        derivative is calculated analytically for all coefficient-based and
+        CSP methods, as all of them are of the form
+        :math:`P^{sat} = \exp(f(T))` and so
+        :math:`\frac{dP^{sat}}{dT} = P^{sat} \frac{df}{dT}`. Higher order
+        derivatives, CoolProp, and tabular data use the numerical
+        implementation in :obj:`TDependentProperty.calculate_derivative`.
+
+        Parameters
+        ----------
+        T : float
+            Temperature at which to calculate the derivative, [K]
+        method : str
+            Method for which to find the derivative
+        order : int
+            Order of the derivative, >= 1
+
+        Returns
+        -------
+        dPsat_dT : float
+            Calculated derivative of vapor pressure, [Pa/K^order]
+        '''
+        if order == 1:
+            if method == WAGNER_MCGARRY:
+                A, B, C, D = self.WAGNER_MCGARRY_coefs
+                return dWagner_original_dT(T, self.WAGNER_MCGARRY_Tc, self.WAGNER_MCGARRY_Pc, A, B, C, D)
+            elif method == WAGNER_POLING:
+                A, B, C, D = self.WAGNER_POLING_coefs
+                return dWagner_dT(T, self.WAGNER_POLING_Tc, self.WAGNER_POLING_Pc, A, B, C, D)
+            elif method == ANTOINE_EXTENDED_POLING:
+                Tc, to, A, B, C, n, E, F = self.ANTOINE_EXTENDED_POLING_coefs
+                return dTRC_Antoine_extended_dT(T, Tc, to, A, B, C, n, E, F)
+            elif method == ANTOINE_POLING:
+                A, B, C = self.ANTOINE_POLING_coefs
+                return dAntoine_dT(T, A, B, C, Base=10.0)
+            elif method == BOILING_CRITICAL:
+                Psat = boiling_critical_relation(T, self.Tb, self.Tc, self.Pc)
+                Tbr = self.Tb/self.Tc
+                h = Tbr*log(self.Pc/101325.)/(1 - Tbr)
+                return Psat*h*self.Tc/(T*T)
+            elif method == LEE_KESLER_PSAT:
+                Tr = T/self.Tc
+                df0 = 6.09648/Tr**2 - 1.28862/Tr + 1.016082*Tr**5
+                df1 = 15.6875/Tr**2 - 13.4721/Tr + 2.61462*Tr**5
+                Psat = Lee_Kesler(T, self.Tc, self.Pc, self.omega)
+                return Psat*(df0 + self.omega*df1)/self.Tc
+            elif method == AMBROSE_WALTON:
+                Tr = T/self.Tc
+                tau = 1 - Tr
+                g0 = -5.97616*tau + 1.29874*tau**1.5 - 0.60394*tau**2.5 - 1.06841*tau**5
+                g1 = -5.03365*tau + 1.11505*tau**1.5 - 5.41217*tau**2.5 - 7.46628*tau**5
+                g2 = -0.64771*tau + 2.41539*tau**1.5 - 4.26979*tau**2.5 + 3.25259*tau**5
+                dg0 = -5.97616 + 1.94811*tau**0.5 - 1.50985*tau**1.5 - 5.34205*tau**4
+                dg1 = -5.03365 + 1.672575*tau**0.5 - 13.530425*tau**1.5 - 37.3314*tau**4
+                dg2 = -0.64771 + 3.623085*tau**0.5 - 10.674475*tau**1.5 + 16.26295*tau**4
+                g = g0 + self.omega*g1 + self.omega**2*g2
+                dg = dg0 + self.omega*dg1 + self.omega**2*dg2
+                Psat = self.Pc*exp(g/Tr)
+                return -Psat*(dg*Tr + g)/(self.Tc*Tr*Tr)
+            elif method == SANJARI:
+                Tr = T/self.Tc
+                df0 = 5.76051/Tr**2 + 0.90654/Tr - 2.221214*Tr**0.9
+                df1 = 28.1460/Tr**2 - 58.0352/Tr + 44.791854*Tr**0.9
+                df2 = -16.33839/Tr**2 + 65.6995/Tr - 68.35041*Tr**0.9
+                Psat = Sanjari(T, self.Tc, self.Pc, self.omega)
+                return Psat*(df0 + self.omega*df1 + self.omega**2*df2)/self.Tc
+        return super(VaporPressure, self).calculate_derivative(T, method, order)
+
     def test_method_validity(self, T, method):
         r'''Method to check the validity of a method. Follows the given
         ranges for all coefficient-based methods. For CSP methods, the models
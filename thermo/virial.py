@@ -22,9 +22,11 @@ SOFTWARE.'''
 
 from __future__ import division
 from scipy.constants import R
+import numpy as np
 
 __all__ = ['BVirial_Pitzer_Curl', 'BVirial_Abbott', 'BVirial_Tsonopoulos',
-           'BVirial_Tsonopoulos_Extended']
+           'BVirial_Tsonopoulos_Extended', 'Tcijs_Pcijs_omegaijs',
+           'BVirial_matrix', 'BVirial_mixture']
 
 ### Second Virial Coefficients
 
@@ -42,7 +44,7 @@ def BVirial_Pitzer_Curl(T, Tc, Pc, omega):
 
     Parameters
     ----------
-    T : float
+    T : float or ndarray
         Temperature of fluid [K]
     Tc : float
         Critical temperature of fluid [K]
@@ -53,7 +55,7 @@ def BVirial_Pitzer_Curl(T, Tc, Pc, omega):
 
     Returns
     -------
-    BVirial : float
+    BVirial : float or ndarray
         Second virial coefficient, [m^3/mol]
 
     Notes
@@ -73,9 +75,12 @@ def BVirial_Pitzer_Curl(T, Tc, Pc, omega):
        Second Virial Coefficient1." Journal of the American Chemical Society
        79, no. 10 (May 1, 1957): 2369-70. doi:10.1021/ja01567a007.
     '''
-    Tr = T/Tc
-    B0 = 0.1445 - 0.33/Tr - 0.1385/Tr**2 - 0.0121/Tr**3
-    B1 = 0.073 + 0.46/Tr - 0.5/Tr**2 - 0.097/Tr**3 - 0.0073/Tr**8
+    Tr_inv = Tc/T
+    Tr_inv2 = Tr_inv*Tr_inv
+    Tr_inv3 = Tr_inv2*Tr_inv
+    Tr_inv8 = Tr_inv3*Tr_inv3*Tr_inv2
+    B0 = 0.1445 - 0.33*Tr_inv - 0.1385*Tr_inv2 - 0.0121*Tr_inv3
+    B1 = 0.073 + 0.46*Tr_inv - 0.5*Tr_inv2 - 0.097*Tr_inv3 - 0.0073*Tr_inv8
     Br = B0 + omega*B1
     BVirial = Br*R*Tc/Pc
     return BVirial
@@ -94,7 +99,7 @@ def BVirial_Abbott(T, Tc, Pc, omega):
 
     Parameters
     ----------
-    T : float
+    T : float or ndarray
         Temperature of fluid [K]
     Tc : float
         Critical temperature of fluid [K]
@@ -105,7 +110,7 @@ def BVirial_Abbott(T, Tc, Pc, omega):
 
     Returns
     -------
-    BVirial : float
+    BVirial : float or ndarray
         Second virial coefficient, [m^3/mol]
 
     Notes
@@ -143,7 +148,7 @@ def BVirial_Tsonopoulos(T, Tc, Pc, omega):
 
     Parameters
     ----------
-    T : float
+    T : float or ndarray
         Temperature of fluid [K]
     Tc : float
         Critical temperature of fluid [K]
@@ -154,7 +159,7 @@ def BVirial_Tsonopoulos(T, Tc, Pc, omega):
 
     Returns
     -------
-    BVirial : float
+    BVirial : float or ndarray
         Second virial coefficient, [m^3/mol]
 
     Notes
@@ -175,9 +180,12 @@ def BVirial_Tsonopoulos(T, Tc, Pc, omega):
        Coefficients." AIChE Journal 20, no. 2 (March 1, 1974): 263-72.
        doi:10.1002/aic.690200209.
     '''
-    Tr = T/Tc
-    B0 = 0.1445 - 0.33/Tr - 0.1385/Tr**2 - 0.0121/Tr**3 - 0.000607/Tr**8
-    B1 = 0.0637 + 0.331/Tr**2 - 0.423/Tr**3 - 0.008/Tr**8
+    Tr_inv = Tc/T
+    Tr_inv2 = Tr_inv*Tr_inv
+    Tr_inv3 = Tr_inv2*Tr_inv
+    Tr_inv8 = Tr_inv3*Tr_inv3*Tr_inv2
+    B0 = 0.1445 - 0.33*Tr_inv - 0.1385*Tr_inv2 - 0.0121*Tr_inv3 - 0.000607*Tr_inv8
+    B1 = 0.0637 + 0.331*Tr_inv2 - 0.423*Tr_inv3 - 0.008*Tr_inv8
     Br = (B0+omega*B1)
     BVirial = Br*R*Tc/Pc
     return BVirial
@@ -192,7 +200,7 @@ def BVirial_Tsonopoulos_Extended(T, Tc, Pc, omega, a=0, b=0, speciestype='', dip
 
     Parameters
     ----------
-    T : float
+    T : float or ndarray
         Temperature of fluid [K]
     Tc : float
         Critical temperature of fluid [K]
@@ -209,7 +217,7 @@ def BVirial_Tsonopoulos_Extended(T, Tc, Pc, omega, a=0, b=0, speciestype='', dip
 
     Returns
     -------
-    BVirial : float
+    BVirial : float or ndarray
         Second virial coefficient, [m^3/mol]
 
     Notes
@@ -234,11 +242,15 @@ def BVirial_Tsonopoulos_Extended(T, Tc, Pc, omega, a=0, b=0, speciestype='', dip
        and Ternary Mixtures of Ethers, Alkanes and Alkanols, 133, no. 1-2
        (June 1997): 11-34. doi:10.1016/S0378-3812(97)00058-7.
     '''
-    Tr = T/Tc
-    B0 = 0.1445 - 0.33/Tr - 0.1385/Tr**2 - 0.0121/Tr**3 - 0.000607/Tr**8
-    B1 = 0.0637+0.331/Tr**2-0.423/Tr**3-0.008/Tr**8
-    B2 = 1./Tr**6
-    B3 = -1./Tr**8
+    Tr_inv = Tc/T
+    Tr_inv2 = Tr_inv*Tr_inv
+    Tr_inv3 = Tr_inv2*Tr_inv
+    Tr_inv6 = Tr_inv3*Tr_inv3
+    Tr_inv8 = Tr_inv6*Tr_inv2
+    B0 = 0.1445 - 0.33*Tr_inv - 0.1385*Tr_inv2 - 0.0121*Tr_inv3 - 0.000607*Tr_inv8
+    B1 = 0.0637 + 0.331*Tr_inv2 - 0.423*Tr_inv3 - 0.008*Tr_inv8
+    B2 = Tr_inv6
+    B3 = -Tr_inv8
 
     if a == 0 and b == 0 and speciestype != '':
         if speciestype == 'simple' or speciestype == 'normal':
@@ -263,3 +275,152 @@ def BVirial_Tsonopoulos_Extended(T, Tc, Pc, omega, a=0, b=0, speciestype='', dip
     Br = B0 + omega*B1 + a*B2 + b*B3
     BVirial = Br*R*Tc/Pc
     return BVirial
+
+
+def Tcijs_Pcijs_omegaijs(Tcs, Pcs, Vcs, omegas, kijs=None):
+    r'''Calculates the matrices of interaction critical temperatures,
+    critical pressures, and acentric factors used to compute cross second
+    virial coefficients of a mixture, with the combining rules in [1]_.
+    The diagonal elements are the pure component values.
+
+    .. math::
+        T_{c,ij} = \sqrt{T_{c,i}T_{c,j}}(1-k_{ij})
+
+        \omega_{ij} = \frac{\omega_i + \omega_j}{2}
+
+        Z_{c,ij} = \frac{Z_{c,i} + Z_{c,j}}{2}
+
+        V_{c,ij} = \left(\frac{V_{c,i}^{1/3} + V_{c,j}^{1/3}}{2}\right)^3
+
+        P_{c,ij} = \frac{Z_{c,ij}RT_{c,ij}}{V_{c,ij}}
+
+    Parameters
+    ----------
+    Tcs : list[float]
+        Critical temperatures of all components [K]
+    Pcs : list[float]
+        Critical pressures of all components [Pa]
+    Vcs : list[float]
+        Critical volumes of all components [m^3/mol]
+    omegas : list[float]
+        Acentric factors of all components, [-]
+    kijs : list[list[float]], optional
+        Binary interaction parameters; zero if not given, [-]
+
+    Returns
+    -------
+    Tcijs : ndarray
+        Interaction critical temperatures [K]
+    Pcijs : ndarray
+        Interaction critical pressures [Pa]
+    omegaijs : ndarray
+        Interaction acentric factors, [-]
+
+    Examples
+    --------
+    Methane and ethane.
+
+    >>> Tcijs, Pcijs, omegaijs = Tcijs_Pcijs_omegaijs([190.56, 305.32],
+    ... [4599000., 4872000.], [9.86e-05, 0.0001455], [0.008, 0.098])
+    >>> Tcijs
+    array([[190.56      , 241.20899486],
+           [241.20899486, 305.32      ]])
+
+    References
+    ----------
+    .. [1] Smith, H. C. Van Ness Joseph M. Introduction to Chemical Engineering
+       Thermodynamics 4E 1987.
+    '''
+    Tcs = np.asarray(Tcs, dtype=float)
+    Pcs = np.asarray(Pcs, dtype=float)
+    Vcs = np.asarray(Vcs, dtype=float)
+    omegas = np.asarray(omegas, dtype=float)
+    Tcijs = np.sqrt(np.outer(Tcs, Tcs))
+    if kijs is not None:
+        Tcijs *= 1. - np.asarray(kijs, dtype=float)
+    omegaijs = 0.5*np.add.outer(omegas, omegas)
+    Zcs = Pcs*Vcs/(R*Tcs)
+    Zcijs = 0.5*np.add.outer(Zcs, Zcs)
+    Vcs_third = Vcs**(1/3.)
+    Vcijs = (0.5*np.add.outer(Vcs_third, Vcs_third))**3
+    Pcijs = Zcijs*R*Tcijs/Vcijs
+    # Keep the pure component values exact on the diagonal
+    np.fill_diagonal(Pcijs, Pcs)
+    return Tcijs, Pcijs, omegaijs
+
+
+def BVirial_matrix(T, Tcs, Pcs, Vcs, omegas, kijs=None,
+                   correlation=BVirial_Tsonopoulos):
+    r'''Calculates the matrix of second virial coefficients :math:`B_{ij}`
+    of a mixture, using the combining rules of
+    :obj:`Tcijs_Pcijs_omegaijs` and one of the corresponding-states
+    correlations in this module. All pairs are evaluated in one NumPy
+    call. If `T` is an array, the result has an extra leading dimension
+    for temperature.
+
+    Parameters
+    ----------
+    T : float or ndarray
+        Temperature of fluid [K]
+    Tcs : list[float]
+        Critical temperatures of all components [K]
+    Pcs : list[float]
+        Critical pressures of all components [Pa]
+    Vcs : list[float]
+        Critical volumes of all components [m^3/mol]
+    omegas : list[float]
+        Acentric factors of all components, [-]
+    kijs : list[list[float]], optional
+        Binary interaction parameters; zero if not given, [-]
+    correlation : function, optional
+        One of :obj:`BVirial_Pitzer_Curl`, :obj:`BVirial_Abbott`,
+        :obj:`BVirial_Tsonopoulos`, or :obj:`BVirial_Tsonopoulos_Extended`
+
+    Returns
+    -------
+    Bijs : ndarray
+        Second virial coefficients of all pairs of components, [m^3/mol]
+
+    Examples
+    --------
+    >>> BVirial_matrix(300., [190.56, 305.32], [4599000., 4872000.],
+    ... [9.86e-05, 0.0001455], [0.008, 0.098])
+    array([[-4.25146718e-05, -9.11370162e-05],
+           [-9.11370162e-05, -1.83942939e-04]])
+    '''
+    Tcijs, Pcijs, omegaijs = Tcijs_Pcijs_omegaijs(Tcs, Pcs, Vcs, omegas, kijs)
+    if hasattr(T, '__len__'):
+        T = np.asarray(T, dtype=float)[..., None, None]
+    return correlation(T, Tcijs, Pcijs, omegaijs)
+
+
+def BVirial_mixture(ys, Bijs):
+    r'''Calculates the second virial coefficient of a mixture from the
+    matrix of pure and cross coefficients, as calculated by
+    :obj:`BVirial_matrix`. If `Bijs` has a leading temperature dimension,
+    an array of mixture coefficients is returned.
+
+    .. math::
+        B = \sum_i\sum_j y_i y_j B_{ij}
+
+    Parameters
+    ----------
+    ys : list[float]
+        Mole fractions of all components in the gas, [-]
+    Bijs : ndarray
+        Second virial coefficients of all pairs of components, [m^3/mol]
+
+    Returns
+    -------
+    B : float or ndarray
+        Second virial coefficient of the mixture, [m^3/mol]
+
+    Examples
+    --------
+    >>> Bijs = BVirial_matrix(300., [190.56, 305.32], [4599000., 4872000.],
+    ... [9.86e-05, 0.0001455], [0.008, 0.098])
+    >>> BVirial_mixture([0.7, 0.3], Bijs)
+    -7.566460050671404e-05
+    '''
+    ys = np.asarray(ys, dtype=float)
+    return np.dot(np.dot(Bijs, ys), ys)
@@ -27,9 +27,9 @@ import numpy as np
 import pandas as pd
 
 from thermo.utils import none_and_length_check, mixing_simple, mixing_logarithmic, TPDependentProperty
-from thermo.miscdata import _VDISaturationDict, VDI_tabular_data
+from thermo.miscdata import _VDISaturationDict, VDI_tabular_arrays
 from thermo.electrochem import _Laliberte_Viscosity_ParametersDict, Laliberte_viscosity
-from thermo.coolprop import has_CoolProp, PropsSI, PhaseSI, coolprop_fluids, coolprop_dict, CoolProp_T_dependent_property
+from thermo.coolprop import has_CoolProp, coolprop_fluids, coolprop_dict, CoolProp_T_dependent_property, CoolProp_TP, CoolProp_phase
 
 folder = os.path.join(os.path.dirname(__file__), 'Viscosity')
 
@@ -479,10 +479,10 @@ class ViscosityLiquid(TPDependentProperty):
             Tmins.append(self.CP_f.Tmin); Tmaxs.append(self.CP_f.Tc)
         if self.CASRN in _VDISaturationDict:
             methods.append(VDI_TABULAR)
-            Ts, props = VDI_tabular_data(self.CASRN, 'Mu (l)')
-            self.VDI_Tmin = Ts[0]
-            self.VDI_Tmax = Ts[-1]
-            self.tabular_data[VDI_TABULAR] = (Ts, props)
+            Ts, props = VDI_data = VDI_tabular_arrays(self.CASRN, 'Mu (l)')
+            self.VDI_Tmin = float(Ts[0])
+            self.VDI_Tmax = float(Ts[-1])
+            self.tabular_data[VDI_TABULAR] = VDI_data
             Tmins.append(self.VDI_Tmin); Tmaxs.append(self.VDI_Tmax)
         if self.CASRN in Dutt_Prasad.index:
             methods.append(DUTT_PRASAD)
@@ -549,7 +549,7 @@ class ViscosityLiquid(TPDependentProperty):
             C, D = self.VISWANATH_NATARAJAN_2E_coeffs
             mu = ViswanathNatarajan2Exponential(T, C, D)
         elif method == COOLPROP:
-            mu = CoolProp_T_dependent_property(T, self.CASRN, 'V', 'l')
+            mu = CoolProp_T_dependent_property(T, self.CASRN, 'V', 'l', self.CoolProp_backend)
         elif method == LETSOU_STIEL:
             mu = Letsou_Stiel(T, self.MW, self.Tc, self.Pc, self.omega)
         elif method == PRZEDZIECKI_SRIDHAR:
@@ -637,7 +637,7 @@ class ViscosityLiquid(TPDependentProperty):
             Psat = self.Psat(T) if hasattr(self.Psat, '__call__') else self.Psat
             mu = Lucas(T, P, self.Tc, self.Pc, self.omega, Psat, mu)
         elif method == COOLPROP:
-            mu = PropsSI('V', 'T', T, 'P', P, self.CASRN)
+            mu = CoolProp_TP(T, P, self.CASRN, 'V', self.CoolProp_backend)
         elif method in self.tabular_data:
             mu = self.interpolate_P(T, P, method)
         return mu
@@ -671,7 +671,7 @@ class ViscosityLiquid(TPDependentProperty):
         if method == LUCAS:
             pass
         elif method == COOLPROP:
-            validity = PhaseSI('T', T, 'P', P, self.CASRN) in ['liquid', 'supercritical_liquid']
+            validity = CoolProp_phase(T, P, self.CASRN, self.CoolProp_backend) in ['liquid', 'supercritical_liquid']
         elif method in self.tabular_data:
             if not self.tabular_extrapolation_permitted:
                 Ts, Ps, properties = self.tabular_data[method]
@@ -1264,10 +1264,10 @@ class ViscosityGas(TPDependentProperty):
         Tmins, Tmaxs = [], []
         if self.CASRN in _VDISaturationDict:
             methods.append(VDI_TABULAR)
-            Ts, props = VDI_tabular_data(self.CASRN, 'Mu (g)')
-            self.VDI_Tmin = Ts[0]
-            self.VDI_Tmax = Ts[-1]
-            self.tabular_data[VDI_TABULAR] = (Ts, props)
+            Ts, props = VDI_data = VDI_tabular_arrays(self.CASRN, 'Mu (g)')
+            self.VDI_Tmin = float(Ts[0])
+            self.VDI_Tmax = float(Ts[-1])
+            self.tabular_data[VDI_TABULAR] = VDI_data
             Tmins.append(self.VDI_Tmin); Tmaxs.append(self.VDI_Tmax)
         if has_CoolProp and self.CASRN in coolprop_dict:
             methods.append(COOLPROP); methods_P.append(COOLPROP)
@@ -1310,7 +1310,7 @@ class ViscosityGas(TPDependentProperty):
         if method == GHARAGHEIZI:
             mu = Gharagheizi_gas(T, self.Tc, self.Pc, self.MW)
         elif method == COOLPROP:
-            mu = CoolProp_T_dependent_property(T, self.CASRN, 'V', 'g')
+            mu = CoolProp_T_dependent_property(T, self.CASRN, 'V', 'g', self.CoolProp_backend)
         elif method == YOON_THODOS:
             mu = Yoon_Thodos(T, self.Tc, self.Pc, self.MW)
         elif method == STIEL_THODOS:
@@ -1391,7 +1391,7 @@ class ViscosityGas(TPDependentProperty):
             Viscosity of the gas at T and P, [Pa*]
         '''
         if method == COOLPROP:
-            mu = PropsSI('V', 'T', T, 'P', P, self.CASRN)
+            mu = CoolProp_TP(T, P, self.CASRN, 'V', self.CoolProp_backend)
         elif method in self.tabular_data:
             mu = self.interpolate_P(T, P, method)
         return mu
@@ -1424,7 +1424,7 @@ class ViscosityGas(TPDependentProperty):
         '''
         validity = True
         if method == COOLPROP:
-            validity = PhaseSI('T', T, 'P', P, self.CASRN) in ['gas', 'supercritical_gas', 'supercritical', 'supercritical_liquid']
+            validity = CoolProp_phase(T, P, self.CASRN, self.CoolProp_backend) in ['gas', 'supercritical_gas', 'supercritical', 'supercritical_liquid']
         elif method in self.tabular_data:
             if not self.tabular_extrapolation_permitted:
                 Ts, Ps, properties = self.tabular_data[method]
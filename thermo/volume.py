@@ -32,13 +32,13 @@ import pandas as pd
 
 from thermo.utils import Vm_to_rho, rho_to_Vm, mixing_simple, none_and_length_check
 from thermo.virial import BVirial_Pitzer_Curl, BVirial_Abbott, BVirial_Tsonopoulos, BVirial_Tsonopoulos_Extended
-from thermo.pr import PR_Vm
-from thermo.miscdata import _VDISaturationDict, VDI_tabular_data
+from thermo.pr import PR_Vm, PR_Vm_roots, a as PR_a, b as PR_b, kappa as PR_kappa
+from thermo.miscdata import _VDISaturationDict, VDI_tabular_arrays
 from thermo.dippr import EQ105
 
 from thermo.electrochem import _Laliberte_Density_ParametersDict, Laliberte_density
 
-from thermo.coolprop import has_CoolProp, PropsSI, PhaseSI, coolprop_fluids, coolprop_dict, CoolProp_T_dependent_property
+from thermo.coolprop import has_CoolProp, coolprop_fluids, coolprop_dict, CoolProp_T_dependent_property, CoolProp_TP, CoolProp_phase
 from thermo.utils import TDependentProperty, TPDependentProperty
 
 
@@ -942,10 +942,10 @@ class VolumeLiquid(TPDependentProperty):
             Tmins.append(self.DIPPR_Tmin); Tmaxs.append(self.DIPPR_Tmax)
         if self.CASRN in _VDISaturationDict:
             methods.append(VDI_TABULAR)
-            Ts, props = VDI_tabular_data(self.CASRN, 'Volume (l)')
-            self.VDI_Tmin = Ts[0]
-            self.VDI_Tmax = Ts[-1]
-            self.tabular_data[VDI_TABULAR] = (Ts, props)
+            Ts, props = VDI_data = VDI_tabular_arrays(self.CASRN, 'Volume (l)')
+            self.VDI_Tmin = float(Ts[0])
+            self.VDI_Tmax = float(Ts[-1])
+            self.tabular_data[VDI_TABULAR] = VDI_data
             Tmins.append(self.VDI_Tmin); Tmaxs.append(self.VDI_Tmax)
         if self.Tc and self.CASRN in COSTALD_data.index:
             methods.append(HTCOSTALDFIT)
@@ -1040,7 +1040,7 @@ class VolumeLiquid(TPDependentProperty):
         elif method == CRC_INORG_L_CONST:
             Vm = self.CRC_INORG_L_CONST_Vm
         elif method == COOLPROP:
-            Vm = 1./CoolProp_T_dependent_property(T, self.CASRN, 'DMOLAR', 'l')
+            Vm = 1./CoolProp_T_dependent_property(T, self.CASRN, 'DMOLAR', 'l', self.CoolProp_backend)
         elif method in self.tabular_data:
             Vm = self.interpolate(T, method)
         return Vm
@@ -1071,7 +1071,7 @@ class VolumeLiquid(TPDependentProperty):
             Psat = self.Psat(T) if hasattr(self.Psat, '__call__') else self.Psat
             Vm = COSTALD_compressed(T, P, Psat, self.Tc, self.Pc, self.omega, Vm)
         elif method == COOLPROP:
-            Vm = 1./PropsSI('DMOLAR', 'T', T, 'P', P, self.CASRN)
+            Vm = 1./CoolProp_TP(T, P, self.CASRN, 'DMOLAR', self.CoolProp_backend)
         elif method in self.tabular_data:
             Vm = self.interpolate_P(T, P, method)
         return Vm
@@ -1167,7 +1167,7 @@ class VolumeLiquid(TPDependentProperty):
         if method == COSTALD_COMPRESSED:
             pass
         elif method == COOLPROP:
-            validity = PhaseSI('T', T, 'P', P, self.CASRN) == 'liquid'
+            validity = CoolProp_phase(T, P, self.CASRN, self.CoolProp_backend) == 'liquid'
         elif method in self.tabular_data:
             if not self.tabular_extrapolation_permitted:
                 Ts, Ps, properties = self.tabular_data[method]
@@ -1568,6 +1568,10 @@ volume_gas_methods = [PR, CRC_VIRIAL, TSONOPOULOS_EXTENDED, TSONOPOULOS,
                       ABBOTT, PITZER_CURL, IDEAL]
 '''Holds all methods available for the VolumeGas class, for use in
 iterating over them.'''
+virial_methods = [CRC_VIRIAL, TSONOPOULOS_EXTENDED, TSONOPOULOS, ABBOTT,
+                  PITZER_CURL]
+'''Holds the methods of the VolumeGas class which are based on the second
+virial coefficient.'''
 
 
 class VolumeGas(TPDependentProperty):
@@ -1746,9 +1750,13 @@ class VolumeGas(TPDependentProperty):
         '''
         methods_P = [IDEAL]
         # no point in getting Tmin, Tmax
+        self._B_cache = (None, None, None)
         if all((self.Tc, self.Pc, self.omega)):
             methods_P.extend([PR, TSONOPOULOS_EXTENDED, TSONOPOULOS, ABBOTT,
                             PITZER_CURL])
+            self.PR_a = PR_a(self.Tc, self.Pc)
+            self.PR_b = PR_b(self.Tc, self.Pc)
+            self.PR_kappa = PR_kappa(self.omega)
         if self.CASRN in CRC_virial_data.index:
             methods_P.append(CRC_VIRIAL)
             self.CRC_VIRIAL_coeffs = _CRC_virial_data_values[CRC_virial_data.index.get_loc(self.CASRN)].tolist()[1:]
@@ -1779,31 +1787,54 @@ class VolumeGas(TPDependentProperty):
             Molar volume of the gas at T and P, [m^3/mol]
         '''
         if method == PR:
-            Vm = PR_Vm(T, P, self.Tc, self.Pc, self.omega, phase='g')
-        elif method == TSONOPOULOS_EXTENDED:
+            Vm = PR_Vm_roots(T, P, self.PR_a, self.PR_b, self.PR_kappa, self.Tc)[1]
+        elif method in virial_methods:
+            Vm = ideal_gas(T, P) + self.calculate_B(T, method)
+        elif method == IDEAL:
+            Vm = ideal_gas(T, P)
+        elif method == COOLPROP:
+            Vm = 1./CoolProp_TP(T, P, self.CASRN, 'DMOLAR', self.CoolProp_backend)
+        elif method in self.tabular_data:
+            Vm = self.interpolate_P(T, P, method)
+        return Vm
+
+    def calculate_B(self, T, method):
+        r'''Method to calculate the second virial coefficient of the gas at
+        temperature `T` with a given virial method. The most recently
+        calculated value is cached, so pressure sweeps at a constant
+        temperature only evaluate the correlation once.
+
+        Parameters
+        ----------
+        T : float
+            Temperature at which to calculate the second virial coefficient,
+            [K]
+        method : str
+            Name of the method to use; one of `virial_methods`
+
+        Returns
+        -------
+        B : float
+            Second virial coefficient of the gas at T, [m^3/mol]
+        '''
+        cache = self._B_cache
+        if cache[0] == T and cache[1] == method:
+            return cache[2]
+        if method == TSONOPOULOS_EXTENDED:
             B = BVirial_Tsonopoulos_Extended(T, self.Tc, self.Pc, self.omega, dipole=self.dipole)
-            Vm = ideal_gas(T, P) + B
         elif method == TSONOPOULOS:
             B = BVirial_Tsonopoulos(T, self.Tc, self.Pc, self.omega)
-            Vm = ideal_gas(T, P) + B
         elif method == ABBOTT:
             B = BVirial_Abbott(T, self.Tc, self.Pc, self.omega)
-            Vm = ideal_gas(T, P) + B
         elif method == PITZER_CURL:
             B = BVirial_Pitzer_Curl(T, self.Tc, self.Pc, self.omega)
-            Vm = ideal_gas(T, P) + B
         elif method == CRC_VIRIAL:
             a1, a2, a3, a4, a5 = self.CRC_VIRIAL_coeffs
             t = 298.15/T - 1.
             B = (a1 + a2*t + a3*t**2 + a4*t**3 + a5*t**4)/1E6
-            Vm = ideal_gas(T, P) + B
-        elif method == IDEAL:
-            Vm = ideal_gas(T, P)
-        elif method == COOLPROP:
-            Vm = 1./PropsSI('DMOLAR', 'T', T, 'P', P, self.CASRN)
-        elif method in self.tabular_data:
-            Vm = self.interpolate_P(T, P, method)
-        return Vm
+        # Replaced as a whole so a concurrent reader never sees a mixed entry
+        self._B_cache = (T, method, B)
+        return B
 
     def test_method_validity_P(self, T, P, method):
         r'''Method to check the validity of a pressure and temperature
@@ -1847,7 +1878,7 @@ class VolumeGas(TPDependentProperty):
             pass
             # Would be nice to have a limit on CRC_VIRIAL
         elif method == COOLPROP:
-            validity = PhaseSI('T', T, 'P', P, self.CASRN) in ['gas', 'supercritical_gas', 'supercritical', 'supercritical_liquid']
+            validity = CoolProp_phase(T, P, self.CASRN, self.CoolProp_backend) in ['gas', 'supercritical_gas', 'supercritical', 'supercritical_liquid']
         elif method in self.tabular_data:
             if not self.tabular_extrapolation_permitted:
                 Ts, Ps, properties = self.tabular_data[method]